@@ -0,0 +1,322 @@
+"""
+Local fake of the parts of the GitHub API repo-radar talks to.
+
+Serves one synthetic repository of a configurable number of PRs:
+
+- REST ``GET /api/v3/repos/<owner>/<name>`` (what ``gh.get_repo`` needs);
+- GraphQL ``POST /api/graphql``: PR search (``is:``, ``closed:``,
+  ``created:``, ``updated:``, ``author:``, ``-base:`` and ``sort:`` qualifiers, the
+  1,000-result cap, cursor pagination) and aliased ``pullRequest`` detail
+  batches (files, check runs, reviews).
+
+Every response carries rate-limit headers and waits ``latency`` seconds.
+Request counts and bytes per endpoint are served at ``GET /__stats`` and
+reset with ``POST /__reset``. Run it in its own process with
+:func:`start_server` so its memory and CPU do not skew the measurements.
+"""
+
+import bisect
+import json
+import multiprocessing
+import random
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+SEARCH_RESULT_LIMIT = 1000
+AUTHORS = [f"dev{i:03d}" for i in range(200)]
+WINDOW_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+WINDOW_DAYS = 366
+
+_DATE_FIELDS = {"closed": "closedAt", "created": "createdAt", "updated": "updatedAt"}
+_ALIAS = re.compile(r"(pr_\d+): pullRequest\(number: (\d+)\)")
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def generate_pull_requests(count: int, open_fraction: float = 0.1, seed: int = 0) -> List[dict]:
+    """``count`` PR nodes spread over 2024, shaped like the GraphQL ``PullRequestFields``."""
+    rng = random.Random(seed)
+    span = WINDOW_DAYS * 24 * 3600
+    nodes = []
+    for number in range(1, count + 1):
+        created = WINDOW_START + timedelta(seconds=int(span * number / (count + 1)))
+        is_open = rng.random() < open_fraction
+        closed = None if is_open else created + timedelta(hours=rng.expovariate(1 / 72))
+        merged = not is_open and rng.random() < 0.8
+        nodes.append(
+            {
+                "number": number,
+                "title": f"Synthetic change {number}",
+                "state": "OPEN" if is_open else ("MERGED" if merged else "CLOSED"),
+                "merged": merged,
+                "createdAt": _iso(created),
+                "updatedAt": _iso(closed or created),
+                "closedAt": _iso(closed) if closed else None,
+                "changedFiles": int(rng.paretovariate(1.2)),
+                "url": f"https://github.example/bench/repo/pull/{number}",
+                "baseRefName": "main" if rng.random() < 0.9 else "release",
+                "headRefOid": f"{rng.getrandbits(160):040x}",
+                "author": {"login": rng.choice(AUTHORS)},
+            }
+        )
+    return nodes
+
+
+def _bounds(value: str) -> Tuple[str, str]:
+    """``[low, high)`` string bounds of a date qualifier value on ISO timestamps."""
+    top = "\uffff"
+    if ".." in value:
+        low, high = value.split("..", 1)
+        return low, high + top
+    for op, bounds in (
+        (">=", lambda v: (v, top)),
+        ("<=", lambda v: ("", v + top)),
+        (">", lambda v: (v + top, top)),
+        ("<", lambda v: ("", v)),
+    ):
+        if value.startswith(op):
+            return bounds(value[len(op) :])
+    return value, value + top
+
+
+class FakeRepository:
+    def __init__(self, nodes: List[dict]):
+        self.nodes = nodes
+        self.by_number = {node["number"]: node for node in nodes}
+        # field -> sorted [(value, index)] for range qualifiers
+        self._sorted = {
+            field: sorted(
+                (node[field], i) for i, node in enumerate(nodes) if node[field] is not None
+            )
+            for field in _DATE_FIELDS.values()
+        }
+        self._results: "OrderedDict[str, List[dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _candidates(self, ranges: List[Tuple[str, str, str]]) -> List[int]:
+        if not ranges:
+            return list(range(len(self.nodes)))
+        field, low, high = ranges[0]
+        column = self._sorted[field]
+        start = bisect.bisect_left(column, (low,))
+        end = bisect.bisect_left(column, (high,))
+        return [i for _, i in column[start:end]]
+
+    def search(self, query: str) -> List[dict]:
+        with self._lock:
+            if query in self._results:
+                self._results.move_to_end(query)
+                return self._results[query]
+
+        ranges, filters, sort = [], [], ("createdAt", True)
+        for token in query.split():
+            key, _, value = token.partition(":")
+            if key in _DATE_FIELDS:
+                ranges.append((_DATE_FIELDS[key], *_bounds(value)))
+            elif key == "is" and value in ("open", "closed", "merged"):
+                filters.append(value)
+            elif key == "author":
+                filters.append(("author", value))
+            elif key == "-base":
+                filters.append(("-base", value))
+            elif key == "sort":
+                field, _, direction = value.partition("-")
+                sort = (_DATE_FIELDS.get(field, "createdAt"), direction != "asc")
+
+        def matches(node: dict) -> bool:
+            for field, low, high in ranges:
+                value = node[field]
+                if value is None or not low <= value < high:
+                    return False
+            for f in filters:
+                if f == "open" and node["state"] != "OPEN":
+                    return False
+                if f == "closed" and node["state"] == "OPEN":
+                    return False
+                if f == "merged" and not node["merged"]:
+                    return False
+                if isinstance(f, tuple) and f[0] == "author" and node["author"]["login"] != f[1]:
+                    return False
+                if isinstance(f, tuple) and f[0] == "-base" and node["baseRefName"] == f[1]:
+                    return False
+            return True
+
+        results = [self.nodes[i] for i in self._candidates(ranges) if matches(self.nodes[i])]
+        results.sort(key=lambda node: node[sort[0]] or "", reverse=sort[1])
+        with self._lock:
+            self._results[query] = results
+            while len(self._results) > 64:
+                self._results.popitem(last=False)
+        return results
+
+    def details(self, number: int, query: str) -> Optional[dict]:
+        node = self.by_number.get(number)
+        if node is None:
+            return None
+        rng = random.Random(number)
+        pr: Dict[str, Any] = {"number": number}
+        if "files(" in query:
+            pr["files"] = self.files_page(number, 0)
+        if "commits(" in query:
+            runs = [
+                {
+                    "name": f"ci-{i}",
+                    "status": "COMPLETED",
+                    "conclusion": "FAILURE" if rng.random() < 0.1 else "SUCCESS",
+                }
+                for i in range(rng.randint(1, 3))
+            ]
+            last_page = {"hasNextPage": False, "endCursor": None}
+            suite = {
+                "id": f"suite-{number}",
+                "checkRuns": {"pageInfo": last_page, "nodes": runs},
+            }
+            pr["commits"] = {
+                "nodes": [
+                    {
+                        "commit": {
+                            "oid": f"{number:040x}",
+                            "checkSuites": {"pageInfo": last_page, "nodes": [suite]},
+                        }
+                    }
+                ]
+            }
+        if "reviews(" in query:
+            pr["reviews"] = {
+                "nodes": [
+                    {
+                        "author": {"login": rng.choice(AUTHORS)},
+                        "state": "APPROVED",
+                        "submittedAt": node["updatedAt"],
+                    }
+                    for _ in range(rng.randint(0, 2))
+                ]
+            }
+        return pr
+
+    def files_page(self, number: int, offset: int) -> dict:
+        total = self.by_number[number]["changedFiles"]
+        end = min(total, offset + 100)
+        return {
+            "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)},
+            "nodes": [
+                {"path": f"src/module_{number}/file_{i}.py", "additions": i + 1, "deletions": i % 3}
+                for i in range(offset, end)
+            ],
+        }
+
+
+def make_handler(repository: FakeRepository, latency: float, stats: Counter):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, payload: Any, endpoint: Optional[str] = None) -> None:
+            body = json.dumps(payload).encode()
+            if endpoint:
+                time.sleep(latency)
+                stats[endpoint] += 1
+                stats[f"{endpoint}_bytes"] += len(body)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("X-RateLimit-Limit", "5000")
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/__stats":
+                return self._send(200, dict(stats))
+            match = re.fullmatch(r"/api/v3/repos/([^/]+)/([^/?]+)", self.path)
+            if not match:
+                return self._send(404, {"message": "Not Found"}, "rest")
+            owner, name = match.groups()
+            base = f"http://{self.headers['Host']}/api/v3"
+            self._send(
+                200,
+                {
+                    "id": 1,
+                    "name": name,
+                    "full_name": f"{owner}/{name}",
+                    "url": f"{base}/repos/{owner}/{name}",
+                    "html_url": f"http://{self.headers['Host']}/{owner}/{name}",
+                    "owner": {"login": owner},
+                    "archived": False,
+                },
+                "rest",
+            )
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.path == "/__reset":
+                stats.clear()
+                return self._send(200, {})
+            request = json.loads(body)
+            query, variables = request["query"], request.get("variables") or {}
+
+            if "search(" in query:
+                results = repository.search(variables["q"])
+                capped = results[:SEARCH_RESULT_LIMIT]
+                start = int(variables.get("after") or 0)
+                end = min(len(capped), start + variables.get("first", 1))
+                endpoint = "graphql_count" if "nodes" not in query else "graphql_search"
+                data = {
+                    "search": {
+                        "issueCount": len(results),
+                        "pageInfo": {"hasNextPage": end < len(capped), "endCursor": str(end)},
+                        "nodes": capped[start:end],
+                    }
+                }
+            elif "pullRequest(number: $number)" in query:
+                endpoint = "graphql_files_page"
+                data = {
+                    "repository": {
+                        "pullRequest": {
+                            "files": repository.files_page(
+                                variables["number"], int(variables.get("after") or 0)
+                            )
+                        }
+                    }
+                }
+            else:
+                endpoint = "graphql_details"
+                data = {
+                    "repository": {
+                        alias: repository.details(int(number), query)
+                        for alias, number in _ALIAS.findall(query)
+                    }
+                }
+            self._send(200, {"data": data}, endpoint)
+
+    return Handler
+
+
+def serve(count: int, latency: float, port_queue) -> None:
+    repository = FakeRepository(generate_pull_requests(count))
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(repository, latency, Counter())
+    )
+    server.daemon_threads = True
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def start_server(count: int, latency: float = 0.0) -> Tuple[multiprocessing.Process, int]:
+    """Start a fake GitHub serving ``count`` PRs in a child process; returns it and its port."""
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=serve, args=(count, latency, port_queue), daemon=True
+    )
+    process.start()
+    return process, port_queue.get(timeout=300)
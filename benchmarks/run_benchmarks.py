@@ -0,0 +1,163 @@
+"""
+Benchmark the audit queries against a local fake GitHub API.
+
+For every repository size a fake GitHub (see :mod:`benchmarks.fake_github`)
+is started in a child process, then every module in ``repo_radar.queries``
+and the full ``run_config_audit`` pipeline are run against it. Each run
+reports wall time, API calls per endpoint and peak traced memory.
+
+    python -m benchmarks.run_benchmarks --sizes 1000,10000 --latency-ms 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import requests
+
+# Never send real credentials to the fake server, and keep progress bars quiet.
+os.environ["GITHUB_TOKENS"] = "benchmark-token"
+os.environ.setdefault("TQDM_DISABLE", "1")
+
+from benchmarks.fake_github import AUTHORS, start_server  # noqa: E402
+from repo_radar.audit_runner import run_dynamic_query  # noqa: E402
+from repo_radar.audit_scripts.run_config_audit import run_config_audit  # noqa: E402
+from repo_radar.github_client.client_pool import registry  # noqa: E402
+from repo_radar.utils.path_utils import get_queries_dir  # noqa: E402
+
+DEFAULT_SIZES = "1000,10000"
+
+
+def benchmark_config(port: int, size: int, max_workers: int) -> dict:
+    return {
+        "repository": f"http://127.0.0.1:{port}/bench/repo",
+        "base_url": f"http://127.0.0.1:{port}/api/v3",
+        "start_date": "2024-01-01",
+        "end_date": "2024-12-31",
+        "max_workers": max_workers,
+        "max_requests_per_second": 1_000_000,
+        "http_cache": False,
+        "details_cache": False,
+        "teams": {f"team-{i}": AUTHORS[i::10] for i in range(10)},
+    }
+
+
+def count_results(result: Any) -> int:
+    """Items a query returned: list entries, summed over dict values; a scalar (e.g. a total) counts once."""
+    if isinstance(result, dict):
+        return sum(count_results(value) for value in result.values())
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 1
+
+
+def measure(
+    name: str, func: Callable[[], Any], stats_url: str, trace_memory: bool
+) -> Dict[str, Any]:
+    # Fresh clients per run, so every run pays for the same requests.
+    registry.clear()
+    requests.post(f"{stats_url}/__reset")
+    if trace_memory:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    result = func()
+    wall = time.perf_counter() - started
+
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    stats = requests.get(f"{stats_url}/__stats").json()
+
+    endpoint_calls = {k: v for k, v in stats.items() if not k.endswith("_bytes")}
+    return {
+        "name": name,
+        "wall_seconds": round(wall, 3),
+        "api_calls": sum(endpoint_calls.values()),
+        "calls_by_endpoint": endpoint_calls,
+        "response_bytes": sum(v for k, v in stats.items() if k.endswith("_bytes")),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2) if peak is not None else None,
+        "results": count_results(result),
+    }
+
+
+def run(sizes: List[int], latency: float, max_workers: int, trace_memory: bool) -> List[dict]:
+    query_names = sorted(
+        f.stem for f in get_queries_dir().glob("*.py") if not f.stem.startswith("_")
+    )
+    report = []
+    for size in sizes:
+        print(f"🧪 Starting fake GitHub with {size} PRs (latency {latency * 1000:.0f} ms)")
+        process, port = start_server(size, latency)
+        stats_url = f"http://127.0.0.1:{port}"
+        config = benchmark_config(port, size, max_workers)
+        try:
+            for query_name in query_names:
+                entry = measure(
+                    query_name,
+                    lambda: run_dynamic_query(query_name, config),
+                    stats_url,
+                    trace_memory,
+                )
+                report.append({"size": size, **entry})
+            entry = measure(
+                "run_config_audit",
+                lambda: run_config_audit(config, {"enabled_checks": query_names}),
+                stats_url,
+                trace_memory,
+            )
+            report.append({"size": size, **entry})
+        finally:
+            process.terminate()
+    return report
+
+
+def print_report(report: List[dict]) -> None:
+    header = f"{'size':>8}  {'benchmark':<32} {'wall s':>8} {'calls':>7} {'MB resp':>8} {'peak MB':>8} {'results':>8}"
+    print(header)
+    print("-" * len(header))
+    for row in report:
+        peak = f"{row['peak_memory_mb']:.2f}" if row["peak_memory_mb"] is not None else "-"
+        print(
+            f"{row['size']:>8}  {row['name']:<32} {row['wall_seconds']:>8.3f} "
+            f"{row['api_calls']:>7} {row['response_bytes'] / 1024 / 1024:>8.2f} "
+            f"{peak:>8} {row['results']:>8}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help="Comma separated PR counts of the synthetic repositories (e.g. 1000,10000,100000)",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Latency added to every API response"
+    )
+    parser.add_argument("--max-workers", type=int, default=4, help="max_workers config value")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip tracemalloc, which slows Python down, to get cleaner wall times",
+    )
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = run(sizes, args.latency_ms / 1000, args.max_workers, not args.no_memory)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Benchmark report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+Vectorised rollups of audit results per team, author, check and week.
+
+As results arrive, :class:`RollupColumns` keeps the few PR facts the rollups
+need (repository, team, author, check, created and closed timestamps, changed
+files, merged) in typed arrays. :func:`rollup` groups all rows by any
+combination of ``repository``, ``team``, ``author``, ``check`` and ``week``
+in one NumPy pass: group codes come from ``np.unique``, counts and sums from
+``np.bincount``, and the median and p90 PR age and size from a single sort of
+the values within their group.
+Weekly or per-author questions are answered from the same columns instead of
+another GitHub crawl.
+
+The CLI renders the summary report from :func:`audit_rollups` and writes the
+rollups as JSON next to it.
+"""
+
+import json
+import math
+import os
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from repo_radar.records import finding_team
+from repo_radar.utils.path_utils import resolve_path
+
+DIMENSIONS = ("repository", "team", "author", "check", "week")
+QUANTILES = {"median": 0.5, "p90": 0.9}
+
+_DAY_SECONDS = 24 * 60 * 60
+_WEEK_SECONDS = 7 * _DAY_SECONDS
+# The epoch was a Thursday; weeks start on the Monday four days later.
+_FIRST_MONDAY = 4 * _DAY_SECONDS
+UNKNOWN_WEEK = "unknown"
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    """POSIX seconds of a datetime, ``nan`` when missing."""
+    return math.nan if value is None else value.timestamp()
+
+
+class RollupColumns:
+    """
+    Columnar PR facts to aggregate, one row per result.
+
+    Rows are read from the PR record each result carries, never from its
+    output keys, so every layout rolls up the same. Rows without a
+    repository of their own belong to ``repository``.
+    """
+
+    __slots__ = (
+        "default_repository",
+        "repository",
+        "team",
+        "author",
+        "check",
+        "created_at",
+        "closed_at",
+        "changed_files",
+        "merged",
+    )
+
+    def __init__(self, repository: str = ""):
+        self.default_repository = repository
+        self.repository: List[str] = []
+        self.team: List[str] = []
+        self.author: List[str] = []
+        self.check: List[str] = []
+        self.created_at = array("d")
+        self.closed_at = array("d")
+        # Float so results without a PR can hold ``nan``
+        self.changed_files = array("d")
+        self.merged = array("b")
+
+    def __len__(self) -> int:
+        return len(self.team)
+
+    def _append(
+        self, repository, check, team, author, created_at, closed_at, changed_files, merged
+    ):
+        self.repository.append(sys.intern(repository))
+        self.check.append(sys.intern(check))
+        self.team.append(sys.intern(team))
+        self.author.append(sys.intern(author or "ghost"))
+        self.created_at.append(created_at)
+        self.closed_at.append(closed_at)
+        self.changed_files.append(changed_files)
+        self.merged.append(bool(merged))
+
+    def truncate(self, length: int) -> None:
+        """Drop every row after the first ``length``."""
+        for name in self.__slots__[1:]:
+            del getattr(self, name)[length:]
+
+    def add(self, check_name: str, item: Any) -> None:
+        """
+        Add one audit result.
+
+        The PR facts are read from the record of a :class:`Finding` or
+        :class:`RenderedFinding`. A plain dict result (from a check without
+        findings) only counts towards its team; its PR facts are missing.
+        """
+        if isinstance(item, dict):
+            self._append(
+                item.get("repository") or self.default_repository,
+                check_name,
+                finding_team(item),
+                None,
+                math.nan,
+                math.nan,
+                math.nan,
+                False,
+            )
+            return
+        pr = item.pr
+        self._append(
+            getattr(item, "repository", None) or self.default_repository,
+            check_name,
+            item.team,
+            pr.user,
+            _timestamp(pr.created_at),
+            _timestamp(pr.closed_at),
+            float(pr.changed_files),
+            pr.merged,
+        )
+
+
+def _grouped_quantiles(
+    group: np.ndarray, values: np.ndarray, n_groups: int
+) -> Dict[str, np.ndarray]:
+    """
+    Linearly interpolated quantiles of ``values`` within each group, ignoring ``nan``.
+
+    One lexicographic sort orders the values by group, then by value (``nan``
+    last), so every quantile is read at a computed offset into its group.
+    """
+    order = np.lexsort((values, group))
+    ordered = values[order]
+    sizes = np.bincount(group, minlength=n_groups)
+    valid = np.bincount(group, weights=~np.isnan(values), minlength=n_groups).astype(np.int64)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    quantiles = {}
+    for name, fraction in QUANTILES.items():
+        position = fraction * np.maximum(valid - 1, 0)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        weight = position - low
+        value = ordered[starts + low] * (1 - weight) + ordered[starts + high] * weight
+        quantiles[name] = np.where(valid > 0, value, np.nan)
+    return quantiles
+
+
+def _dimension_codes(columns: RollupColumns, dimension: str, week_of: np.ndarray):
+    """``(labels, code of each row)`` for one grouping dimension."""
+    if dimension == "week":
+        starts, codes = np.unique(week_of, return_inverse=True)
+        labels = [
+            UNKNOWN_WEEK
+            if math.isnan(start)
+            else datetime.fromtimestamp(start, timezone.utc).date().isoformat()
+            for start in starts
+        ]
+        return labels, codes
+    if dimension not in DIMENSIONS:
+        raise ValueError(f"Unknown rollup dimension '{dimension}'")
+    labels, codes = np.unique(
+        np.array(getattr(columns, dimension), dtype=object), return_inverse=True
+    )
+    return list(labels), codes
+
+
+def _rounded(value: float) -> Optional[float]:
+    return None if math.isnan(value) else round(float(value), 2)
+
+
+def rollup(
+    columns: RollupColumns, by: Sequence[str], now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Aggregate ``columns`` by the dimensions ``by`` (any of ``DIMENSIONS``).
+
+    A PR's age is the days from creation to close, or to ``now`` while it is
+    open; its size is its changed file count. A PR falls in the week (starting
+    Monday) it was closed, or created while it is open.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Stats nested by the ``by`` keys in order, e.g. ``{team: {check: stats}}``,
+        where ``stats`` holds ``prs``, ``merged``, ``open``, ``changed_files``
+        (sum) and the ``age_days`` / ``changed_files`` median and p90.
+    """
+    if not len(columns):
+        return {}
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    created = np.frombuffer(columns.created_at, dtype=np.float64)
+    closed = np.frombuffer(columns.closed_at, dtype=np.float64)
+    size = np.frombuffer(columns.changed_files, dtype=np.float64)
+    merged = np.frombuffer(columns.merged, dtype=np.int8).astype(bool)
+    is_open = np.isnan(closed)
+
+    age_days = (np.where(is_open, now_ts, closed) - created) / _DAY_SECONDS
+    moment = np.where(is_open, created, closed)
+    week_of = (
+        np.floor((moment - _FIRST_MONDAY) / _WEEK_SECONDS) * _WEEK_SECONDS + _FIRST_MONDAY
+    )
+
+    labels, codes = zip(*(_dimension_codes(columns, dim, week_of) for dim in by))
+    shape = tuple(len(dim_labels) for dim_labels in labels)
+    groups, group = np.unique(np.ravel_multi_index(codes, shape), return_inverse=True)
+    n_groups = len(groups)
+
+    prs = np.bincount(group, minlength=n_groups)
+    merged_prs = np.bincount(group, weights=merged, minlength=n_groups)
+    open_prs = np.bincount(group, weights=is_open, minlength=n_groups)
+    files = np.bincount(group, weights=np.nan_to_num(size), minlength=n_groups)
+    ages = _grouped_quantiles(group, age_days, n_groups)
+    sizes = _grouped_quantiles(group, size, n_groups)
+
+    result: Dict[str, Any] = {}
+    key_codes = np.unravel_index(groups, shape)
+    for g in range(n_groups):
+        keys = [str(labels[d][key_codes[d][g]]) for d in range(len(by))]
+        node = result
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        stats = {
+            "prs": int(prs[g]),
+            "merged": int(merged_prs[g]),
+            "open": int(open_prs[g]),
+            "changed_files": int(files[g]),
+        }
+        for name in QUANTILES:
+            stats[f"age_days_{name}"] = _rounded(ages[name][g])
+        for name in QUANTILES:
+            stats[f"changed_files_{name}"] = _rounded(sizes[name][g])
+        node[keys[-1]] = stats
+    return result
+
+
+def audit_rollups(columns: RollupColumns, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    The rollups of an audit's results, each per check: per team, per author,
+    per team and week, and per repository and team.
+    """
+    return {
+        "by_team": rollup(columns, ("team", "check"), now=now),
+        "by_author": rollup(columns, ("author", "check"), now=now),
+        "by_week": rollup(columns, ("team", "check", "week"), now=now),
+        "by_repository": rollup(columns, ("repository", "team", "check"), now=now),
+    }
+
+
+def summary_counts(team_rollups: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, int]]:
+    """``{team: {check: result count}}`` from the ``by_team`` rollups."""
+    return {
+        team: {check: stats["prs"] for check, stats in checks.items()}
+        for team, checks in team_rollups.items()
+    }
+
+
+def rollups_output_path(config: dict) -> str:
+    """``rollups_output_path``, else ``<summary_output_path stem>_rollups.json`` beside it."""
+    if config.get("rollups_output_path"):
+        return resolve_path(config["rollups_output_path"])
+    summary_path = config.get("summary_output_path", "summary_output.json")
+    stem, _ = os.path.splitext(summary_path)
+    return resolve_path(f"{stem}_rollups.json")
+
+
+def save_rollups(rollups: Dict[str, Any], config: dict) -> None:
+    path = rollups_output_path(config)
+    with open(path, "w") as f:
+        json.dump(rollups, f, indent=2)
+    print(f"🧮 Rollups saved to {path}")
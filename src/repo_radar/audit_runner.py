@@ -2,17 +2,26 @@ import importlib
 import inspect
 import os
 from pathlib import Path
-from typing import Callable, Tuple, Type
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
 from pydantic import BaseModel
 import json
-from repo_radar.github_client import get_github_and_repo
+from repo_radar.metrics import instrument, scope, stage
+
+if TYPE_CHECKING:
+    # The GitHub client stack (PyGithub, requests) is imported when a query first runs
+    from repo_radar.dataset import PRDataset
+    from repo_radar.github_client.search_filter import SearchFilter
 
 QUERIES_PATH = Path(__file__).parent / "queries"
 
 
+def load_query_module(query_name: str) -> ModuleType:
+    return importlib.import_module(f"repo_radar.queries.{query_name}")
+
+
 def load_query_function_and_config(query_name: str) -> Tuple[Callable, Type[BaseModel]]:
-    module_path = f"repo_radar.queries.{query_name}"
-    module = importlib.import_module(module_path)
+    module = load_query_module(query_name)
 
     # Get function
     func = getattr(module, query_name)
@@ -29,12 +38,93 @@ def load_query_function_and_config(query_name: str) -> Tuple[Callable, Type[Base
     raise ValueError(f"No Config class found in {query_name}")
 
 
-def run_dynamic_query(query_name: str, raw_config: dict):
+def build_query_config(query_name: str, raw_config: dict) -> dict:
+    """
+    Flatten the config for one check: top-level values, overridden by the
+    check's own section (e.g. ``raw_config["get_large_prs"]``) when present.
+    """
+    section = raw_config.get(query_name)
+    if isinstance(section, dict):
+        return {**raw_config, **section}
+    return dict(raw_config)
+
+
+def dataset_search_filters(
+    query_names: List[str], raw_config: dict
+) -> Dict[str, "SearchFilter"]:
+    """
+    Search filters (``closed``, ``open`` and ``created``) of a dataset shared by
+    ``query_names``: the most selective filters that still cover every query's
+    own ``search_filters(config)`` (no filter for a query that declares none).
+    """
+    from repo_radar.github_client.search_filter import SearchFilter
+
+    per_state: Dict[str, List[SearchFilter]] = {"closed": [], "open": [], "created": []}
+    for query_name in query_names:
+        module = load_query_module(query_name)
+        declare = getattr(module, "search_filters", None)
+        filters = {}
+        if declare is not None:
+            _, ConfigClass = load_query_function_and_config(query_name)
+            filters = declare(ConfigClass(**build_query_config(query_name, raw_config)))
+        for state, state_filters in per_state.items():
+            state_filters.append(filters.get(state) or SearchFilter())
+    return {state: SearchFilter.covering(f) for state, f in per_state.items()}
+
+
+def _prepare_query(query_name: str, raw_config: dict, gh, repo):
     func, ConfigClass = load_query_function_and_config(query_name)
-    config_obj = ConfigClass(**raw_config)
+    config_obj = ConfigClass(**build_query_config(query_name, raw_config))
+
+    if gh is None or repo is None:
+        from repo_radar.github_client import get_github_and_repo
 
-    gh, repo = get_github_and_repo(raw_config)
-    # repo = get_repo(gh, raw_config)
+        gh, repo = get_github_and_repo(raw_config)
 
-    result = func(gh, repo, config_obj)
+    return func, config_obj, gh, repo
+
+
+def run_dynamic_query(
+    query_name: str,
+    raw_config: dict,
+    gh=None,
+    repo=None,
+    dataset: Optional["PRDataset"] = None,
+):
+    with scope(query_name):
+        func, config_obj, gh, repo = _prepare_query(query_name, raw_config, gh, repo)
+
+        with stage("evaluate"):
+            result = func(gh, repo, config_obj, dataset=dataset)
+            if inspect.isgenerator(result):
+                result = list(result)
     return result
+
+
+def iter_dynamic_query(
+    query_name: str,
+    raw_config: dict,
+    gh=None,
+    repo=None,
+    dataset: Optional["PRDataset"] = None,
+) -> Iterator[Any]:
+    """
+    Yield the query's results one at a time.
+
+    Yields the module's findings through :func:`repo_radar.dataset.iter_findings`
+    when it declares ``findings``; otherwise iterates whatever its
+    ``iter_results`` generator or query function returns (a list or a
+    generator).
+    """
+    with scope(query_name):
+        func, config_obj, gh, repo = _prepare_query(query_name, raw_config, gh, repo)
+    module = load_query_module(query_name)
+    if hasattr(module, "findings"):
+        from repo_radar.dataset import iter_findings
+
+        results = iter_findings(module.__name__, gh, repo, config_obj, dataset)
+    else:
+        func = getattr(module, "iter_results", func)
+        results = func(gh, repo, config_obj, dataset=dataset)
+
+    yield from instrument(results, query_name)
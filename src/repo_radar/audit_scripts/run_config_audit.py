@@ -1,14 +1,21 @@
 import argparse
+import fnmatch
 import json
-from repo_radar.github_client import get_repo, get_github_and_repo
-from repo_radar.audit_runner import run_dynamic_query
-from repo_radar.utils.team_utils import (
-    group_results_by_team,
-    summarize_failure_counts,
-    save_all_results,
-    save_failure_counts,
-)
-from typing import Dict, List, Any
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from urllib.parse import urlparse
+from repo_radar.github_client import get_repo, get_github, get_github_and_repo
+from repo_radar.aggregation import save_rollups, summary_counts
+from repo_radar.audit_runner import dataset_search_filters, iter_dynamic_query
+from repo_radar.dataset import PRDataset
+from repo_radar.history import HistoryStore, record_audit
+from repo_radar.incremental import iter_incremental_audit
+from repo_radar.metrics import metrics, save_metrics, scope
+from repo_radar.query_manifest import required_fields_for
+from repo_radar.records import finding_to_dict, with_repository
+from repo_radar.utils.team_utils import AuditResultWriter, save_summary
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 import os
 
@@ -21,6 +28,19 @@ def load_cli_arguments():
         help="Path to the enabled checks config JSON file",
         default=r"",
     )
+    subcommands = parser.add_subparsers(dest="command")
+    trend = subcommands.add_parser(
+        "trend",
+        help="Print stored audit summaries over time from the local history, without calling GitHub",
+    )
+    trend.add_argument("--repository", help="Repository as owner/name")
+    trend.add_argument("--team", help="Team name")
+    trend.add_argument("--check", help="Check name, e.g. get_stale_or_long_lived_prs")
+    trend.add_argument("--start_date", help="First audit end date to include (YYYY-MM-DD)")
+    trend.add_argument("--end_date", help="Last audit end date to include (YYYY-MM-DD)")
+    trend.add_argument(
+        "--history_path", help="History store to read (default: the config's history_path)"
+    )
     args = parser.parse_args()
 
     config_path: str = args.config
@@ -33,28 +53,234 @@ def load_cli_arguments():
     config_path = (
         config_path
         if config_path
-        else os.path.join(repo_radar_config_dir, "config.json")
+        else os.path.join(repo_radar_config_dir or "", "config.json")
     )
     enabled_checks_config = (
         enabled_checks_config
         if enabled_checks_config
-        else os.path.join(repo_radar_config_dir, "enabled_checks_config.json")
+        else os.path.join(repo_radar_config_dir or "", "enabled_checks_config.json")
     )
 
-    return config_path, enabled_checks_config
+    return config_path, enabled_checks_config, args
 
 
-def run_config_audit(raw_config, enabled_checks_config) -> dict:
-    results = {}
-    for check_name in enabled_checks_config["enabled_checks"]:
+def iter_config_audit(
+    raw_config,
+    enabled_checks_config,
+    on_failure: Optional[Callable[[str, str], None]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ``(check name, result)`` pairs as the enabled checks produce them.
+
+    A check that raises is reported to ``on_failure(check name, error)`` and
+    the audit moves on to the next check; results it yielded before failing
+    have already been passed on.
+    """
+    enabled_checks = enabled_checks_config["enabled_checks"]
+
+    # One client and one PR dataset shared by every check
+    with scope("dataset"):
+        gh, repo = get_github_and_repo(raw_config)
+        dataset = PRDataset.from_config(
+            gh, repo, raw_config, filters=dataset_search_filters(enabled_checks, raw_config)
+        )
+        dataset.prefetch(required_fields_for(enabled_checks))
+
+    for check_name in enabled_checks:
         print(f"🔍 Running audit check: {check_name}...")
-        results[check_name] = run_dynamic_query(check_name, raw_config)
+        try:
+            for item in iter_dynamic_query(
+                check_name, raw_config, gh=gh, repo=repo, dataset=dataset
+            ):
+                yield check_name, item
+        except Exception as e:
+            # Keep the results of the checks that already completed
+            print(f"❌ Audit check {check_name} failed: {e}")
+            if on_failure is not None:
+                on_failure(check_name, str(e))
 
+
+def iter_audit(
+    raw_config,
+    enabled_checks_config,
+    on_failure: Optional[Callable[[str, str], None]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """:func:`iter_config_audit`, or its incremental variant when ``incremental`` is set."""
+    if raw_config.get("incremental"):
+        return iter_incremental_audit(raw_config, enabled_checks_config, on_failure)
+    return iter_config_audit(raw_config, enabled_checks_config, on_failure)
+
+
+def run_config_audit(raw_config, enabled_checks_config) -> dict:
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for check_name, item in iter_audit(raw_config, enabled_checks_config):
+        results.setdefault(check_name, []).append(finding_to_dict(item))
     return results
 
 
+# Repositories audited at once in a multi-repository audit.
+DEFAULT_PARALLELISM = 4
+
+
+def resolve_repositories(raw_config: dict) -> Optional[List[str]]:
+    """
+    Repository URLs of a multi-repository audit, or ``None`` for a single one.
+
+    Either ``repositories`` lists the URLs, or ``organization`` (a URL such as
+    ``https://github.com/my-org``, or just its name on github.com) selects
+    the organization's non-archived repositories whose name matches the glob
+    ``repository_filter`` (default ``*``).
+    """
+    if raw_config.get("repositories"):
+        return list(raw_config["repositories"])
+
+    organization = raw_config.get("organization")
+    if not organization:
+        return None
+
+    org_url = organization if "://" in organization else f"https://github.com/{organization}"
+    parsed = urlparse(org_url)
+    org_name = parsed.path.strip("/")
+    pattern = raw_config.get("repository_filter", "*")
+
+    gh = get_github(raw_config, org_url)
+    return [
+        f"{parsed.scheme}://{parsed.netloc}/{repo.full_name}"
+        for repo in gh.get_organization(org_name).get_repos()
+        if not repo.archived and fnmatch.fnmatch(repo.name.lower(), pattern.lower())
+    ]
+
+
+def audit_repository(
+    raw_config: dict, enabled_checks_config: dict, repository: str
+) -> Tuple[str, List[Tuple[str, Any]], Optional[str], Dict[str, str]]:
+    """
+    Audit one repository of a multi-repository audit (runs in a worker process).
+
+    Returns ``(repository, [(check name, result)], error, failed checks)``;
+    every result is tagged with ``"repository": "owner/name"`` and keeps its
+    PR record (see :class:`~repo_radar.records.RenderedFinding`) for the
+    rollups. A failure is returned as ``error`` instead of raised so the
+    other repositories keep going; ``failed checks`` maps each check that
+    failed to its error, and none of its results are returned.
+    """
+    config = {**raw_config, "repository": repository}
+    full_name = urlparse(repository).path.strip("/")
+    failed_checks: Dict[str, str] = {}
+    try:
+        results = [
+            (check_name, with_repository(item, full_name))
+            for check_name, item in iter_audit(
+                config, enabled_checks_config, failed_checks.__setitem__
+            )
+        ]
+    except Exception as e:
+        return repository, [], str(e), {}
+    results = [
+        (check_name, item) for check_name, item in results if check_name not in failed_checks
+    ]
+    return repository, results, None, failed_checks
+
+
+def _audit_repository_in_worker(
+    raw_config: dict, enabled_checks_config: dict, repository: str
+) -> Tuple[
+    str, List[Tuple[str, Any]], Optional[str], Dict[str, str], Dict[str, Any]
+]:
+    """:func:`audit_repository`, plus the worker's metrics for this repository."""
+    # Worker processes are reused, so only report what this repository cost
+    metrics.reset()
+    return (
+        *audit_repository(raw_config, enabled_checks_config, repository),
+        metrics.export_state(),
+    )
+
+
+def run_repository_audits(
+    raw_config: dict,
+    enabled_checks_config: dict,
+    repositories: List[str],
+    on_result: Callable[[str, Any], None],
+    failed_checks: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Dict[str, str]:
+    """
+    Audit ``repositories`` on up to ``parallelism`` worker processes.
+
+    ``on_result(check name, result)`` receives each repository's results as
+    soon as that repository finishes. Returns the error of every repository
+    that failed; the checks that failed in the other repositories are added
+    to ``failed_checks`` as ``{repository: {check name: error}}``.
+    """
+    parallelism = min(raw_config.get("parallelism", DEFAULT_PARALLELISM), len(repositories))
+    errors: Dict[str, str] = {}
+
+    def collect(repository, results, error, check_errors=None, worker_metrics=None):
+        if worker_metrics is not None:
+            metrics.merge_state(worker_metrics)
+        if error is not None:
+            print(f"❌ Audit of {repository} failed: {error}")
+            errors[repository] = error
+            return
+        if check_errors and failed_checks is not None:
+            failed_checks[repository] = check_errors
+        print(f"✅ Audited {repository} ({len(results)} results)")
+        for check_name, item in results:
+            on_result(check_name, item)
+
+    if parallelism <= 1:
+        for repository in repositories:
+            collect(*audit_repository(raw_config, enabled_checks_config, repository))
+        return errors
+
+    # Spawn rather than fork: forked workers would share the parent's pooled
+    # HTTP connections (e.g. from listing an organization's repositories)
+    with ProcessPoolExecutor(
+        max_workers=parallelism, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {
+            executor.submit(
+                _audit_repository_in_worker, raw_config, enabled_checks_config, repository
+            ): repository
+            for repository in repositories
+        }
+        for future in as_completed(futures):
+            try:
+                collect(*future.result())
+            except Exception as e:
+                # e.g. a worker process that died
+                collect(futures[future], [], str(e))
+    return errors
+
+
+def print_trend(args, config_path: str) -> None:
+    """The ``trend`` subcommand: print the matching history series as JSON."""
+    config = {}
+    if args.history_path:
+        config["history_path"] = args.history_path
+    elif os.path.exists(config_path):
+        with open(config_path) as f:
+            config = json.load(f)
+
+    store = HistoryStore.from_config(config)
+    try:
+        series = store.trend(
+            repository=args.repository,
+            team=args.team,
+            check=args.check,
+            start_date=args.start_date,
+            end_date=args.end_date,
+        )
+    finally:
+        store.close()
+    print(json.dumps(series, indent=2))
+
+
 def main():
-    config_path, enabled_checks_config_path = load_cli_arguments()
+    config_path, enabled_checks_config_path, args = load_cli_arguments()
+
+    if args.command == "trend":
+        print_trend(args, config_path)
+        return
 
     with open(config_path) as f:
         raw_config = json.load(f)
@@ -62,15 +288,72 @@ def main():
     with open(enabled_checks_config_path) as f:
         enabled_checks_config = json.load(f)
 
-    # Step 1: Run all enabled queries and collect raw results
-    raw_results = run_config_audit(raw_config, enabled_checks_config)
+    repositories = resolve_repositories(raw_config)
+    errors: Dict[str, str] = {}
+    # repository URL -> {check name: error}
+    failed_checks: Dict[str, Dict[str, str]] = {}
+
+    # Run all enabled queries, grouping, counting and (for ndjson) writing
+    # each result as it is produced
+    with AuditResultWriter(raw_config) as writer:
+        if repositories is None:
+            check_errors = failed_checks.setdefault(raw_config["repository"], {})
+
+            def on_failure(check_name: str, error: str) -> None:
+                check_errors[check_name] = error
+                writer.fail(check_name, error)
+
+            for check_name, item in iter_audit(raw_config, enabled_checks_config, on_failure):
+                writer.add(check_name, item)
+        else:
+            print(f"🛰️ Auditing {len(repositories)} repositories")
+            errors = run_repository_audits(
+                raw_config, enabled_checks_config, repositories, writer.add, failed_checks
+            )
+            for repository, check_errors in failed_checks.items():
+                for check_name, error in check_errors.items():
+                    writer.fail(check_name, error, urlparse(repository).path.strip("/"))
+
+    rollups = writer.rollups()
+    save_summary(
+        summary_counts(rollups["by_team"]), raw_config, rollups["by_team"], failed_checks
+    )
+    save_rollups(rollups, raw_config)
+    save_metrics(raw_config)
+
+    audited = [
+        urlparse(repository).path.strip("/")
+        for repository in (repositories or [raw_config["repository"]])
+        if repository not in errors
+    ]
+    record_audit(
+        raw_config,
+        enabled_checks_config["enabled_checks"],
+        audited,
+        rollups["by_repository"],
+        {
+            urlparse(repository).path.strip("/"): list(check_errors)
+            for repository, check_errors in failed_checks.items()
+        },
+    )
+
+    if errors:
+        print(f"⚠️ {len(errors)} of {len(repositories)} repositories failed:")
+        for repository, error in errors.items():
+            print(f"   - {repository}: {error}")
 
-    # Step 2: Group them by team
-    team_results = group_results_by_team(raw_results, raw_config.get("teams", {}))
+    failures = [
+        (repository, check_name, error)
+        for repository, check_errors in failed_checks.items()
+        for check_name, error in check_errors.items()
+    ]
+    if failures:
+        print(f"⚠️ {len(failures)} audit check(s) failed:")
+        for repository, check_name, error in failures:
+            print(f"   - {check_name} on {repository}: {error}")
 
-    # Step 3: Save output
-    save_all_results(team_results, raw_config)
-    save_failure_counts(team_results, raw_config)
+    if errors or failures:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,324 @@
+"""
+Shared pull request dataset for one audit window and repository.
+
+The audit runner builds a single :class:`PRDataset` and hands it to every
+enabled check, so the closed-PR and open-PR searches run once per audit instead
+of once per check. Detail fields (files, check runs, reviews) are fetched in
+one batched pass, and only for the PR batches of the checks that declare they
+need them through their module-level ``REQUIRED_FIELDS`` and ``PR_BATCHES``;
+files and check runs already cached for a PR's head commit are not fetched
+again. The dataset also
+carries the audit's :class:`TeamDirectory`, so team lookups are indexed once
+per audit.
+
+Checks that select PRs by creation date use ``created``, every PR created
+within the window whatever its state. Its searches are narrowed by the
+``closed``, ``open`` and ``created`` :class:`SearchFilter` it is built with:
+the checks' own filters for a private dataset, or one covering every enabled
+check for a shared one.
+"""
+
+import sys
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+from repo_radar.github_client.details_cache import DetailsCache, get_details_cache
+from repo_radar.github_client.pull_requests import (
+    get_closed_pull_requests,
+    get_created_pull_requests,
+    get_open_pull_requests,
+    get_pull_request_details,
+)
+from repo_radar.github_client.search_filter import SearchFilter
+from repo_radar.metrics import stage
+from repo_radar.query_manifest import DEFAULT_PR_BATCHES
+from repo_radar.records import Finding, PullRequestBatch
+from repo_radar.utils.concurrency import DEFAULT_MAX_WORKERS
+from repo_radar.utils.team_utils import TeamDirectory
+
+DETAIL_FIELDS = ("files", "check_runs", "reviews")
+PR_BATCHES = ("closed", "open", "created")
+
+
+class PRDataset:
+    def __init__(
+        self,
+        gh,
+        repo,
+        start_date: str,
+        end_date: str,
+        store_path: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        teams: Optional[TeamDirectory] = None,
+        updated_since: Optional[str] = None,
+        filters: Optional[Mapping[str, SearchFilter]] = None,
+        details_cache: Optional[DetailsCache] = None,
+    ):
+        self.gh = gh
+        self.repo = repo
+        self.start_date = start_date
+        self.end_date = end_date
+        self.store_path = store_path
+        self.max_workers = max_workers
+        self.teams = teams if teams is not None else TeamDirectory({})
+        # Incremental audits only look at closed PRs updated since the last run.
+        self.updated_since = updated_since
+        filters = filters or {}
+        self.closed_filter = filters.get("closed") or SearchFilter()
+        self.open_filter = filters.get("open") or SearchFilter()
+        self.created_filter = filters.get("created") or SearchFilter()
+        # Files and check runs of head commits seen by earlier audits
+        self.details_cache = details_cache
+
+        self._lock = threading.RLock()
+        self._closed: Optional[PullRequestBatch] = None
+        self._open: Optional[PullRequestBatch] = None
+        self._created: Optional[PullRequestBatch] = None
+        self._details: Dict[int, Dict[str, List[dict]]] = {}
+        # PR numbers of each loaded batch, for finding the batch of a PR
+        self._numbers: Dict[str, Set[int]] = {}
+        # PR numbers each detail field has been fetched for
+        self._fetched: Dict[str, Set[int]] = {field: set() for field in DETAIL_FIELDS}
+
+    @classmethod
+    def from_config(
+        cls,
+        gh,
+        repo,
+        config: Mapping[str, Any],
+        updated_since: Optional[str] = None,
+        filters: Optional[Mapping[str, SearchFilter]] = None,
+        teams: Optional[TeamDirectory] = None,
+    ) -> "PRDataset":
+        return cls(
+            gh,
+            repo,
+            start_date=config["start_date"],
+            end_date=config["end_date"],
+            store_path=config.get("pr_store_path"),
+            max_workers=config.get("max_workers", DEFAULT_MAX_WORKERS),
+            teams=teams if teams is not None else cls._load_teams(config, gh),
+            updated_since=updated_since,
+            filters=filters,
+            details_cache=get_details_cache(config),
+        )
+
+    @staticmethod
+    def _load_teams(config: Mapping[str, Any], gh) -> TeamDirectory:
+        with stage("load_teams"):
+            return TeamDirectory.from_config(config, gh)
+
+    @classmethod
+    def for_query(
+        cls,
+        gh,
+        repo,
+        config: Mapping[str, Any],
+        dataset: Optional["PRDataset"],
+        filters: Optional[Mapping[str, SearchFilter]] = None,
+    ) -> "PRDataset":
+        """
+        Reuse ``dataset`` when it covers the query's window and ``filters``,
+        else build a private one narrowed by ``filters``.
+        """
+        if dataset is not None and dataset.covers(repo, config, filters):
+            return dataset
+        return cls.from_config(gh, repo, config, filters=filters)
+
+    def covers(
+        self,
+        repo,
+        config: Mapping[str, Any],
+        filters: Optional[Mapping[str, SearchFilter]] = None,
+    ) -> bool:
+        filters = filters or {}
+        return (
+            self.repo.full_name == repo.full_name
+            and self.start_date == config["start_date"]
+            and self.end_date == config["end_date"]
+            and self.closed_filter.includes(filters.get("closed") or SearchFilter())
+            and self.open_filter.includes(filters.get("open") or SearchFilter())
+            and self.created_filter.includes(filters.get("created") or SearchFilter())
+        )
+
+    @property
+    def closed(self) -> PullRequestBatch:
+        """PRs closed within the window by ``(closed_at, number)``, fetched on first access."""
+        with self._lock:
+            if self._closed is None:
+                with stage("search_closed"):
+                    records = get_closed_pull_requests(
+                        self.gh,
+                        self.repo,
+                        self.start_date,
+                        self.end_date,
+                        store_path=self.store_path,
+                        max_workers=self.max_workers,
+                        updated_since=self.updated_since,
+                        search_filter=self.closed_filter,
+                    )
+                # Close-time order, the order incremental audits emit results in
+                records = sorted(records, key=lambda r: (r.closed_at, r.number))
+                self._closed = PullRequestBatch.from_records(records)
+            return self._closed
+
+    @property
+    def open(self) -> PullRequestBatch:
+        """Currently open PRs, fetched on first access."""
+        with self._lock:
+            if self._open is None:
+                with stage("search_open"):
+                    records = get_open_pull_requests(
+                        self.gh,
+                        self.repo,
+                        store_path=self.store_path,
+                        since=self.start_date,
+                        search_filter=self.open_filter,
+                    )
+                self._open = PullRequestBatch.from_records(records)
+            return self._open
+
+    @property
+    def created(self) -> PullRequestBatch:
+        """PRs in any state created within the window, fetched on first access."""
+        with self._lock:
+            if self._created is None:
+                with stage("search_created"):
+                    records = get_created_pull_requests(
+                        self.gh,
+                        self.repo,
+                        self.start_date,
+                        self.end_date,
+                        store_path=self.store_path,
+                        max_workers=self.max_workers,
+                        search_filter=self.created_filter,
+                    )
+                self._created = PullRequestBatch.from_records(records)
+            return self._created
+
+    def batch(self, name: str) -> PullRequestBatch:
+        """The ``closed``, ``open`` or ``created`` batch, fetched on first access."""
+        if name not in PR_BATCHES:
+            raise ValueError(f"Unknown PR batch '{name}'")
+        return getattr(self, name)
+
+    def prefetch(self, fields: Mapping[str, Iterable[str]]) -> None:
+        """
+        Fetch every missing detail field for the PRs of each batch in one pass,
+        e.g. ``{"closed": {"files"}}`` fetches file lists for closed PRs only.
+        """
+        with self._lock:
+            head_shas: Dict[int, str] = {}
+            wanted: Dict[str, Set[int]] = {field: set() for field in DETAIL_FIELDS}
+            for name, batch_fields in fields.items():
+                batch_fields = set(batch_fields) & set(DETAIL_FIELDS)
+                if not batch_fields:
+                    continue
+                batch = self.batch(name)
+                numbers = batch.column("number")
+                for number, sha in zip(numbers, batch.column("head_sha")):
+                    head_shas.setdefault(number, sha)
+                for field in batch_fields:
+                    wanted[field].update(numbers)
+
+            # Fields missing for the same PRs are fetched together
+            missing: Dict[frozenset, List[str]] = {}
+            for field in DETAIL_FIELDS:
+                numbers = frozenset(wanted[field]) - self._fetched[field]
+                if numbers:
+                    missing.setdefault(numbers, []).append(field)
+
+            for numbers, missing_fields in missing.items():
+                with stage("fetch_details"):
+                    fetched = get_pull_request_details(
+                        self.repo,
+                        sorted(numbers),
+                        missing_fields,
+                        max_workers=self.max_workers,
+                        head_shas={n: head_shas[n] for n in numbers if head_shas[n]},
+                        cache=self.details_cache,
+                    )
+                for number, details in fetched.items():
+                    self._details.setdefault(number, {}).update(details)
+                for field in missing_fields:
+                    self._fetched[field] |= numbers
+
+    def _batch_of(self, number: int) -> Optional[str]:
+        """Name of the first loaded batch holding PR ``number``."""
+        for name in PR_BATCHES:
+            batch = getattr(self, f"_{name}")
+            if batch is None:
+                continue
+            if name not in self._numbers:
+                self._numbers[name] = set(batch.column("number"))
+            if number in self._numbers[name]:
+                return name
+        return None
+
+    def details(self, number: int, field: str) -> List[dict]:
+        """
+        Detail entries (e.g. ``files``) for PR ``number``; on first use the
+        field is fetched for the loaded batch holding the PR only.
+        """
+        if field not in DETAIL_FIELDS:
+            raise ValueError(f"Unknown PR detail field '{field}'")
+        with self._lock:
+            if number not in self._fetched[field]:
+                name = self._batch_of(number)
+                if name is None:
+                    raise ValueError(
+                        f"PR #{number} is not among the loaded closed, open or created "
+                        "PRs of this dataset"
+                    )
+                self.prefetch({name: [field]})
+            return self._details.get(number, {}).get(field, [])
+
+
+def required_fields(query_modules: Iterable[Any]) -> Dict[str, Set[str]]:
+    """
+    Batch name -> union of the ``REQUIRED_FIELDS`` of the given query modules
+    reading that batch, per their ``PR_BATCHES``.
+    """
+    fields: Dict[str, Set[str]] = {}
+    for module in query_modules:
+        module_fields = set(getattr(module, "REQUIRED_FIELDS", ()))
+        if not module_fields:
+            continue
+        for name in getattr(module, "PR_BATCHES", DEFAULT_PR_BATCHES):
+            fields.setdefault(name, set()).update(module_fields)
+    return fields
+
+
+def iter_findings(
+    query_module: str,
+    gh,
+    repo,
+    config: Any,
+    dataset: Optional[PRDataset] = None,
+) -> Iterator[Finding]:
+    """
+    Yield the findings of a query module one at a time.
+
+    ``query_module`` is the module's name (its ``__name__``). The module
+    declares what is specific to its check:
+
+    - ``Config``, the model a dict ``config`` is validated with;
+    - ``findings(dataset, config, teams)``, yielding a :class:`Finding` per
+      reported PR;
+    - ``LAYOUT``, the :class:`FindingLayout` of those findings;
+    - optionally ``REQUIRED_FIELDS`` and ``PR_BATCHES``, the detail fields it
+      reads and the batches it reads them for, and ``search_filters(config)``,
+      narrowing the dataset it is given (see :meth:`PRDataset.for_query`).
+
+    ``dataset`` is reused when it covers the check, else a private one is built.
+    """
+    module = sys.modules[query_module]
+    if isinstance(config, dict):
+        config = module.Config(**config)
+    declare = getattr(module, "search_filters", None)
+    filters = declare(config) if declare is not None else None
+    dataset = PRDataset.for_query(
+        gh, repo, config.model_dump(), dataset, filters=filters
+    )
+    teams = dataset.teams.with_teams(getattr(config, "teams", None))
+    yield from module.findings(dataset, config, teams)
@@ -0,0 +1,142 @@
+import os
+from github import Github
+from github.Repository import Repository
+from dotenv import load_dotenv
+from urllib.parse import urlparse
+from typing import Callable, Tuple
+from requests.adapters import HTTPAdapter
+
+from repo_radar.github_client.client_pool import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_REPO_CACHE_TTL_SECONDS,
+    registry,
+)
+from repo_radar.github_client.http_cache import CachingAdapter, get_http_cache
+from repo_radar.github_client.rate_limit import (
+    DEFAULT_MAX_REQUESTS_PER_SECOND,
+    TRANSPORT_RETRY,
+    RateLimitedAdapter,
+    get_scheduler,
+    load_tokens,
+)
+
+def get_repo(config: dict = None) -> Repository:
+    load_dotenv()
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token:
+        raise EnvironmentError("❌ GITHUB_TOKEN not found in environment variables.")
+
+    if not config or "repository" not in config:
+        raise ValueError("❌ Missing 'repository' key in config file.")
+
+    gh = Github(token)
+    return gh.get_repo(config["repository"])
+
+def install_adapter(gh: Github, make_adapter: Callable[..., HTTPAdapter]) -> None:
+    """
+    Route every HTTP request made by ``gh`` through ``make_adapter(**adapter_kwargs)``.
+
+    PyGithub creates its ``requests`` session lazily inside a connection object
+    and has no public hook for it; swapping the requester's (private)
+    connection class lets us mount our adapter on it. This is why PyGithub is
+    pinned to 2.x, whose requester keeps the class in ``__connectionClass``.
+    """
+    requester = getattr(gh, "_Github__requester", None)
+    base_class = getattr(requester, "_Requester__connectionClass", None)
+    if base_class is None:
+        raise RuntimeError(
+            "Unsupported PyGithub version: cannot install the rate-limited HTTP adapter"
+        )
+
+    class AdapterConnection(base_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.adapter = make_adapter(
+                max_retries=self.retry,
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+            )
+            self.session.mount(f"{self.protocol}://", self.adapter)
+
+    requester._Requester__connectionClass = AdapterConnection
+
+
+def _build_client(base_url: str, token: str, pool_size: int, cache) -> Github:
+    # Pacing and rate-limit retries are handled by the scheduler, not PyGithub.
+    gh = Github(
+        base_url=base_url,
+        login_or_token=token,
+        retry=TRANSPORT_RETRY,
+        seconds_between_requests=None,
+        pool_size=pool_size,
+    )
+    scheduler = get_scheduler(urlparse(base_url).netloc)
+    if cache is not None:
+        install_adapter(gh, lambda **kwargs: CachingAdapter(scheduler, cache, **kwargs))
+    else:
+        install_adapter(gh, lambda **kwargs: RateLimitedAdapter(scheduler, **kwargs))
+    return gh
+
+
+def _api_base_url(url: str, config: dict) -> str:
+    """REST API base URL for a repository or organization URL."""
+    host = urlparse(url).netloc
+    if "github.com" in host:
+        return "https://api.github.com"
+    # Enterprise GitHub
+    base_url = config.get("base_url")
+    if not base_url: # if base url is not explicitly mentioned in config
+        base_url = f"https://{host}/api/v3"
+    return base_url
+
+
+def _client_key_and_factory(config: dict, url: str) -> Tuple[tuple, Callable[[], Github]]:
+    """Registry key of the client ``config`` selects for ``url``, and how to build it."""
+    tokens = load_tokens()
+    if not tokens:
+        raise ValueError("Missing GITHUB_TOKEN in environment")
+    token = tokens[0]
+
+    base_url = _api_base_url(url, config)
+    get_scheduler(
+        urlparse(base_url).netloc,
+        config.get("max_requests_per_second", DEFAULT_MAX_REQUESTS_PER_SECOND),
+    )
+    pool_size = config.get("github_pool_size", DEFAULT_POOL_SIZE)
+    cache = get_http_cache(config)
+    key = (base_url, token, pool_size, cache.path if cache is not None else None)
+    return key, lambda: _build_client(base_url, token, pool_size, cache)
+
+
+def get_github(config: dict, url: str) -> Github:
+    """
+    Return the pooled client for the GitHub instance hosting ``url``.
+
+    Clients are reused per API base URL, token, ``github_pool_size`` and HTTP
+    cache (see :mod:`repo_radar.github_client.client_pool`), so a config that
+    changes any of these gets its own client. ``max_requests_per_second`` is
+    applied to the host's shared scheduler on every call.
+    """
+    return registry.get_client(*_client_key_and_factory(config, url))
+
+
+def get_github_and_repo(config: dict) -> Tuple[Github, Repository]:
+    """
+    Return the pooled client and repository handle for ``config["repository"]``.
+
+    Repositories are cached for ``repo_cache_ttl_seconds``.
+    """
+    repo_url = config.get("repository")
+    if not repo_url:
+        raise ValueError("repository must be provided in the config")
+
+    client_key, factory = _client_key_and_factory(config, repo_url)
+    gh = registry.get_client(client_key, factory)
+    path = urlparse(repo_url).path.strip("/")
+    # Repository handles send requests through the client that loaded them
+    repo = registry.get_repository(
+        (*client_key, path.lower()),
+        lambda: gh.get_repo(path),
+        config.get("repo_cache_ttl_seconds", DEFAULT_REPO_CACHE_TTL_SECONDS),
+    )
+    return gh, repo
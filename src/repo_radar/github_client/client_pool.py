@@ -0,0 +1,56 @@
+"""
+Process-wide registry of GitHub clients and repository handles.
+
+Building a ``Github`` object sets up a new HTTP session (and TLS handshake on
+first use), and ``gh.get_repo`` costs a round trip. The registry keeps one
+client per API base URL, token and client settings (see
+:func:`repo_radar.github_client.get_github`) with a keep-alive connection
+pool, and caches ``Repository`` objects for a configurable TTL, so repeated
+MCP tool calls and audit runs in one process pay neither cost again.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+# Keep-alive connections per client; also bounds concurrent requests per host.
+DEFAULT_POOL_SIZE = 16
+DEFAULT_REPO_CACHE_TTL_SECONDS = 300
+
+T = TypeVar("T")
+
+
+class ClientRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[Hashable, object] = {}
+        self._repos: Dict[Hashable, Tuple[float, object]] = {}
+
+    def get_client(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the client registered under ``key``, building it once with ``factory``."""
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = factory()
+            return self._clients[key]
+
+    def get_repository(
+        self, key: Hashable, loader: Callable[[], T], ttl_seconds: float
+    ) -> T:
+        """Return the cached repository for ``key``, reloading it once ``ttl_seconds`` passed."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._repos.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+        repo = loader()
+        with self._lock:
+            self._repos[key] = (now + ttl_seconds, repo)
+        return repo
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._repos.clear()
+
+
+registry = ClientRegistry()
@@ -0,0 +1,151 @@
+"""
+Durable cache of PR detail fields keyed by repository and head commit SHA.
+
+The files a commit changes never change, and neither do check runs once they
+have all completed, so these details are stored per ``(repo, head_sha)`` and
+never fetched again for that commit. Repeated audits of merged PRs read them
+from disk instead of paginating through the files and check-run endpoints.
+Like :class:`~repo_radar.github_client.http_cache.HTTPCache` the cache is a
+size-bounded LRU stored in SQLite and shared across processes.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from repo_radar.utils.path_utils import get_cache_dir, resolve_path
+
+DEFAULT_MAX_MB = 128
+
+# Detail fields that only depend on the head commit; reviews do not, so they are never cached.
+CACHEABLE_FIELDS = ("files", "check_runs")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS details (
+    repo TEXT NOT NULL,
+    head_sha TEXT NOT NULL,
+    field TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (repo, head_sha, field)
+);
+CREATE INDEX IF NOT EXISTS idx_details_last_access ON details (last_access);
+"""
+
+
+def is_final(field: str, entries: List[dict]) -> bool:
+    """Whether ``entries`` can no longer change for the same head commit."""
+    if field == "check_runs":
+        # Runs still queued or in progress, or not reported yet, will change.
+        return bool(entries) and all(run["status"] == "completed" for run in entries)
+    return field in CACHEABLE_FIELDS
+
+
+class DetailsCache:
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.path = resolve_path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def lookup(
+        self, repo_name: str, field: str, head_shas: Iterable[str]
+    ) -> Dict[str, List[dict]]:
+        """Cached ``field`` entries for every head SHA that has them."""
+        head_shas = list(dict.fromkeys(head_shas))
+        found: Dict[str, List[dict]] = {}
+        with self._lock, self._conn:
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(head_shas), 500):
+                chunk = head_shas[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT head_sha, payload FROM details "
+                    f"WHERE repo = ? AND field = ? AND head_sha IN ({placeholders})",
+                    (repo_name, field, *chunk),
+                ).fetchall()
+                for head_sha, payload in rows:
+                    found[head_sha] = json.loads(payload)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE details SET last_access = ? "
+                    "WHERE repo = ? AND field = ? AND head_sha = ?",
+                    [(now, repo_name, field, head_sha) for head_sha in found],
+                )
+        return found
+
+    def store(
+        self, repo_name: str, field: str, entries_by_sha: Dict[str, List[dict]]
+    ) -> None:
+        """Persist the final ``field`` entries of each head SHA; others are skipped."""
+        now = time.time()
+        rows = []
+        for head_sha, entries in entries_by_sha.items():
+            if not is_final(field, entries):
+                continue
+            payload = json.dumps(entries, separators=(",", ":")).encode()
+            if len(payload) <= self.max_bytes:
+                rows.append((repo_name, head_sha, field, payload, len(payload), now))
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO details "
+                "(repo, head_sha, field, payload, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in ``max_bytes``."""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM details"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT repo, head_sha, field, size FROM details ORDER BY last_access"
+        ).fetchall()
+        stale = []
+        for repo_name, head_sha, field, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((repo_name, head_sha, field))
+            total -= size
+        self._conn.executemany(
+            "DELETE FROM details WHERE repo = ? AND head_sha = ? AND field = ?", stale
+        )
+
+
+_caches: Dict[str, DetailsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_details_cache(config) -> Optional[DetailsCache]:
+    """
+    Process-wide details cache selected by the config.
+
+    ``details_cache`` (default true) toggles caching, ``details_cache_path``
+    overrides the default location in the repo-radar cache directory and
+    ``details_cache_max_mb`` bounds its size (the latest config's bound applies
+    to a cache already open at that path).
+    """
+    if not config.get("details_cache", True):
+        return None
+    path = config.get("details_cache_path") or str(
+        get_cache_dir() / "details_cache.sqlite3"
+    )
+    max_bytes = int(config.get("details_cache_max_mb", DEFAULT_MAX_MB) * 1024 * 1024)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = DetailsCache(path, max_bytes=max_bytes)
+        _caches[path].max_bytes = max_bytes
+        return _caches[path]
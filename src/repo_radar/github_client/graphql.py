@@ -0,0 +1,400 @@
+"""
+Batched pull request fetching over the GitHub GraphQL API.
+
+A single GraphQL search page returns up to 100 PRs together with every field
+the audit queries need (``changedFiles``, ``merged``, ``closedAt`` ...), so a
+window of N PRs costs ``ceil(N / 100)`` requests instead of ``1 + N`` REST calls.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from repo_radar.github_client.client_pool import DEFAULT_POOL_SIZE, registry
+from repo_radar.github_client.rate_limit import (
+    RateLimitedAdapter,
+    get_scheduler,
+    load_tokens,
+)
+from repo_radar.records import PullRequestRecord, parse_github_datetime
+
+PULL_REQUEST_FIELDS = """
+fragment PullRequestFields on PullRequest {
+  number
+  title
+  state
+  merged
+  createdAt
+  updatedAt
+  closedAt
+  changedFiles
+  url
+  baseRefName
+  headRefOid
+  author { login }
+}
+"""
+
+SEARCH_QUERY = (
+    """
+query($q: String!, $first: Int!, $after: String) {
+  search(query: $q, type: ISSUE, first: $first, after: $after) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes { ... on PullRequest { ...PullRequestFields } }
+  }
+}
+"""
+    + PULL_REQUEST_FIELDS
+)
+
+
+class GraphQLError(Exception):
+    """Raised when the GraphQL API answers with an ``errors`` payload."""
+
+
+def graphql_url_for(api_base_url: str) -> str:
+    """
+    Map a REST API base URL to its GraphQL endpoint.
+
+    ``https://api.github.com`` -> ``https://api.github.com/graphql``
+    ``https://ghe.example.com/api/v3`` -> ``https://ghe.example.com/api/graphql``
+    """
+    base = api_base_url.rstrip("/")
+    if base.endswith("/api/v3"):
+        return base[: -len("/v3")] + "/graphql"
+    return base + "/graphql"
+
+
+class GraphQLClient:
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        session: Optional[requests.Session] = None,
+        timeout: int = 30,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.update(
+            {"Authorization": f"bearer {token}", "Accept": "application/json"}
+        )
+
+    def execute(self, query: str, variables: Optional[Dict[str, Any]] = None) -> dict:
+        response = self.session.post(
+            self.url,
+            json={"query": query, "variables": variables or {}},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            messages = "; ".join(e.get("message", str(e)) for e in payload["errors"])
+            raise GraphQLError(f"GraphQL query failed: {messages}")
+        return payload["data"]
+
+
+def get_graphql_client(repo) -> GraphQLClient:
+    """
+    Build a GraphQL client for the API host ``repo`` was loaded from.
+
+    Clients are pooled per endpoint and token, keeping their HTTP connections
+    alive. Requests go through the host's shared rate-limit scheduler, which
+    also picks the token from the ``GITHUB_TOKENS`` / ``GITHUB_TOKEN`` pool.
+    """
+    tokens = load_tokens()
+    if not tokens:
+        raise ValueError("Missing GITHUB_TOKEN in environment")
+
+    # repo.url is "<api base>/repos/<owner>/<name>" for github.com and Enterprise alike.
+    api_base_url = repo.url[: -len(f"/repos/{repo.full_name}")]
+    url = graphql_url_for(api_base_url)
+    return registry.get_client(
+        ("graphql", url, tokens[0]), lambda: _build_client(url, tokens[0])
+    )
+
+
+def _build_client(url: str, token: str) -> GraphQLClient:
+    parsed = urlparse(url)
+    client = GraphQLClient(url, token)
+    adapter = RateLimitedAdapter(
+        get_scheduler(parsed.netloc),
+        pool_connections=DEFAULT_POOL_SIZE,
+        pool_maxsize=DEFAULT_POOL_SIZE,
+    )
+    client.session.mount(f"{parsed.scheme}://{parsed.netloc}", adapter)
+    return client
+
+
+def record_from_node(node: Dict[str, Any]) -> PullRequestRecord:
+    author = node.get("author") or {}
+    return PullRequestRecord(
+        number=node["number"],
+        title=node["title"],
+        user=author.get("login", "ghost"),
+        state="open" if node["state"] == "OPEN" else "closed",
+        merged=node["merged"],
+        created_at=parse_github_datetime(node["createdAt"]),
+        updated_at=parse_github_datetime(node["updatedAt"]),
+        closed_at=parse_github_datetime(node["closedAt"]),
+        changed_files=node["changedFiles"],
+        html_url=node["url"],
+        base_ref=node["baseRefName"],
+        head_sha=node["headRefOid"],
+    )
+
+
+class PullRequestSearch:
+    """
+    Lazily paginated GraphQL PR search, analogous to PyGithub's ``PaginatedList``.
+
+    Iterating yields :class:`PullRequestRecord` objects page by page;
+    ``total_count`` is the ``issueCount`` reported by GitHub.
+    """
+
+    def __init__(self, client: GraphQLClient, query: str, page_size: int = 100):
+        self.client = client
+        self.query = query
+        self.page_size = page_size
+        self._first_page: Optional[dict] = None
+
+    def _fetch_page(self, after: Optional[str]) -> dict:
+        data = self.client.execute(
+            SEARCH_QUERY, {"q": self.query, "first": self.page_size, "after": after}
+        )
+        return data["search"]
+
+    @property
+    def total_count(self) -> int:
+        if self._first_page is None:
+            self._first_page = self._fetch_page(None)
+        return self._first_page["issueCount"]
+
+    def __iter__(self) -> Iterator[PullRequestRecord]:
+        page = self._first_page or self._fetch_page(None)
+        while True:
+            for node in page["nodes"]:
+                if node:  # non-PR nodes come back as empty objects
+                    yield record_from_node(node)
+            if not page["pageInfo"]["hasNextPage"]:
+                return
+            page = self._fetch_page(page["pageInfo"]["endCursor"])
+
+
+def search_pull_requests(
+    client: GraphQLClient, query: str, page_size: int = 100
+) -> PullRequestSearch:
+    return PullRequestSearch(client, query, page_size=page_size)
+
+
+# Per-PR detail selections that can be requested in addition to the base fields.
+DETAIL_SELECTIONS = {
+    "files": """
+    files(first: 100) {
+      pageInfo { hasNextPage endCursor }
+      nodes { path additions deletions }
+    }""",
+    "check_runs": """
+    commits(last: 1) {
+      nodes { commit { oid checkSuites(first: 50) {
+        pageInfo { hasNextPage endCursor }
+        nodes { id checkRuns(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { name status conclusion }
+        } }
+      } } }
+    }""",
+    "reviews": """
+    reviews(first: 100) {
+      nodes { author { login } state submittedAt }
+    }""",
+}
+
+FILES_PAGE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      files(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path additions deletions }
+      }
+    }
+  }
+}
+"""
+
+
+CHECK_SUITES_PAGE_QUERY = """
+query($owner: String!, $name: String!, $oid: GitObjectID!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    object(oid: $oid) {
+      ... on Commit {
+        checkSuites(first: 50, after: $after) {
+          pageInfo { hasNextPage endCursor }
+          nodes { id checkRuns(first: 100) {
+            pageInfo { hasNextPage endCursor }
+            nodes { name status conclusion }
+          } }
+        }
+      }
+    }
+  }
+}
+"""
+
+CHECK_RUNS_PAGE_QUERY = """
+query($id: ID!, $after: String) {
+  node(id: $id) {
+    ... on CheckSuite {
+      checkRuns(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { name status conclusion }
+      }
+    }
+  }
+}
+"""
+
+
+def _file_entries(nodes: List[dict]) -> List[dict]:
+    return [
+        {
+            "filename": node["path"],
+            "additions": node["additions"],
+            "deletions": node["deletions"],
+        }
+        for node in nodes
+    ]
+
+
+def _check_run_entries(nodes: List[dict]) -> List[dict]:
+    return [
+        {
+            "name": run["name"],
+            "status": (run["status"] or "").lower(),
+            "conclusion": (run["conclusion"] or "").lower() or None,
+        }
+        for run in nodes
+    ]
+
+
+def _suite_check_runs(client: GraphQLClient, suite: dict) -> List[dict]:
+    """Every check run of a check suite, following its pages."""
+    runs = suite["checkRuns"]
+    entries = _check_run_entries(runs["nodes"])
+    while runs["pageInfo"]["hasNextPage"]:
+        data = client.execute(
+            CHECK_RUNS_PAGE_QUERY,
+            {"id": suite["id"], "after": runs["pageInfo"]["endCursor"]},
+        )
+        runs = data["node"]["checkRuns"]
+        entries += _check_run_entries(runs["nodes"])
+    return entries
+
+
+def _commit_check_runs(
+    client: GraphQLClient, owner: str, name: str, commit: dict
+) -> List[dict]:
+    """Every check run of a commit, following check suite and check run pages."""
+    suites = commit["checkSuites"]
+    entries: List[dict] = []
+    while True:
+        for suite in suites["nodes"]:
+            entries += _suite_check_runs(client, suite)
+        if not suites["pageInfo"]["hasNextPage"]:
+            return entries
+        data = client.execute(
+            CHECK_SUITES_PAGE_QUERY,
+            {
+                "owner": owner,
+                "name": name,
+                "oid": commit["oid"],
+                "after": suites["pageInfo"]["endCursor"],
+            },
+        )
+        suites = data["repository"]["object"]["checkSuites"]
+
+
+def _parse_details(
+    client: GraphQLClient, owner: str, name: str, pr: dict, fields: Iterable[str]
+) -> Dict[str, List[dict]]:
+    details: Dict[str, List[dict]] = {}
+    if "files" in fields:
+        files = pr["files"]
+        entries = _file_entries(files["nodes"])
+        while files["pageInfo"]["hasNextPage"]:
+            data = client.execute(
+                FILES_PAGE_QUERY,
+                {
+                    "owner": owner,
+                    "name": name,
+                    "number": pr["number"],
+                    "after": files["pageInfo"]["endCursor"],
+                },
+            )
+            files = data["repository"]["pullRequest"]["files"]
+            entries += _file_entries(files["nodes"])
+        details["files"] = entries
+    if "check_runs" in fields:
+        details["check_runs"] = [
+            run
+            for commit in pr["commits"]["nodes"]
+            for run in _commit_check_runs(client, owner, name, commit["commit"])
+        ]
+    if "reviews" in fields:
+        details["reviews"] = [
+            {
+                "user": (review.get("author") or {}).get("login", "ghost"),
+                "state": review["state"].lower(),
+                "submitted_at": review["submittedAt"],
+            }
+            for review in pr["reviews"]["nodes"]
+        ]
+    return details
+
+
+def fetch_pull_request_details(
+    client: GraphQLClient,
+    repo_full_name: str,
+    numbers: List[int],
+    fields: Iterable[str],
+) -> Dict[int, Dict[str, List[dict]]]:
+    """
+    Fetch the requested detail ``fields`` for a batch of PR numbers in one request.
+
+    PRs are addressed with GraphQL aliases (``pr_<number>``); file lists,
+    check suites and check runs longer than one page are completed with
+    follow-up requests for that PR only, so cached details are never
+    truncated.
+
+    Returns
+    -------
+    Dict[int, Dict[str, List[dict]]]
+        ``{pr_number: {field: entries}}`` for every PR that exists.
+    """
+    fields = [f for f in fields if f in DETAIL_SELECTIONS]
+    if not numbers or not fields:
+        return {}
+
+    owner, name = repo_full_name.split("/")
+    selection = "number" + "".join(DETAIL_SELECTIONS[f] for f in fields)
+    aliases = "\n".join(
+        f"pr_{number}: pullRequest(number: {number}) {{ {selection} }}"
+        for number in numbers
+    )
+    query = (
+        "query($owner: String!, $name: String!) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{aliases}\n"
+        "  }\n"
+        "}"
+    )
+    data = client.execute(query, {"owner": owner, "name": name})
+
+    results = {}
+    for pr in data["repository"].values():
+        if pr:
+            results[pr["number"]] = _parse_details(client, owner, name, pr, fields)
+    return results
@@ -0,0 +1,203 @@
+"""
+On-disk conditional-request cache for GitHub REST calls.
+
+Responses to ``GET`` requests are stored with their ``ETag`` /
+``Last-Modified`` validators. The next request for the same URL is sent with
+``If-None-Match`` / ``If-Modified-Since``; GitHub answers ``304 Not Modified``
+when nothing changed, which does not count against the rate limit, and the
+cached body is served instead. The cache is a size-bounded LRU stored in
+SQLite, so the CLI and the MCP server can share it across processes.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from repo_radar.github_client.rate_limit import RateLimitedAdapter
+from repo_radar.utils.path_utils import get_cache_dir, resolve_path
+
+DEFAULT_MAX_MB = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+"""
+
+# Headers that describe the 304 itself rather than the cached representation.
+_FRESH_HEADER_PREFIXES = ("x-ratelimit-", "date", "x-github-request-id")
+# The cached body is stored decoded, so transfer headers no longer apply to it.
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def to_response(self, request, not_modified) -> requests.Response:
+        """Rebuild a full response from the cache, keeping the 304's fresh headers."""
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        for name, value in not_modified.headers.items():
+            if name.lower().startswith(_FRESH_HEADER_PREFIXES):
+                response.headers[name] = value
+        response._content = self.body
+        response.encoding = not_modified.encoding
+        response.url = request.url
+        response.request = request
+        response.connection = not_modified.connection
+        return response
+
+
+class HTTPCache:
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.path = resolve_path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def key_for(request) -> str:
+        return f"{request.headers.get('Accept', '')} {request.url}"
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, status, headers, body FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        etag, last_modified, status, headers, body = row
+        return CachedResponse(etag, last_modified, status, json.loads(headers), body)
+
+    def store(self, key: str, response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, etag, last_modified, status, headers, body, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    etag,
+                    last_modified,
+                    response.status_code,
+                    json.dumps(
+                        {
+                            name: value
+                            for name, value in response.headers.items()
+                            if name.lower() not in _TRANSFER_HEADERS
+                        }
+                    ),
+                    body,
+                    len(body),
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in ``max_bytes``."""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ).fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+
+class CachingAdapter(RateLimitedAdapter):
+    """:class:`RateLimitedAdapter` that revalidates ``GET`` requests against an :class:`HTTPCache`."""
+
+    def __init__(self, scheduler, cache: HTTPCache, **kwargs):
+        self.cache = cache
+        super().__init__(scheduler, **kwargs)
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        key = self.cache.key_for(request)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            rebuilt = cached.to_response(request, response)
+            # Release the pooled connection; the 304 has no body to read
+            response.close()
+            return rebuilt
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+
+
+_caches: Dict[str, HTTPCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(config: dict) -> Optional[HTTPCache]:
+    """
+    Process-wide cache selected by the config.
+
+    ``http_cache`` (default true) toggles caching, ``http_cache_path`` overrides
+    the default location in the repo-radar cache directory and
+    ``http_cache_max_mb`` bounds its size (the latest config's bound applies
+    to a cache already open at that path).
+    """
+    if not config.get("http_cache", True):
+        return None
+    path = config.get("http_cache_path") or str(get_cache_dir() / "http_cache.sqlite3")
+    max_bytes = int(config.get("http_cache_max_mb", DEFAULT_MAX_MB) * 1024 * 1024)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = HTTPCache(path, max_bytes=max_bytes)
+        _caches[path].max_bytes = max_bytes
+        return _caches[path]
@@ -0,0 +1,223 @@
+"""
+On-disk pull request store with incremental sync.
+
+PR records are persisted per repository in SQLite. Every sync only asks GitHub
+for PRs whose ``updated_at`` is newer than the stored high-water mark, so a
+second audit over the same window costs a single search request. The search
+index can lag behind updates, so each sync looks back ``SYNC_OVERLAP`` before
+the mark; PRs seen twice are simply upserted again.
+"""
+
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from repo_radar.github_client.graphql import GraphQLClient, get_graphql_client
+from repo_radar.github_client.search_planner import iter_sorted_search
+from repo_radar.records import PullRequestRecord, parse_github_datetime
+from repo_radar.utils.path_utils import resolve_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pull_requests (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    user TEXT NOT NULL,
+    state TEXT NOT NULL,
+    merged INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    closed_at TEXT,
+    changed_files INTEGER NOT NULL,
+    html_url TEXT NOT NULL,
+    base_ref TEXT NOT NULL,
+    head_sha TEXT NOT NULL,
+    PRIMARY KEY (repo, number)
+);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_closed ON pull_requests (repo, closed_at);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_state ON pull_requests (repo, state);
+CREATE TABLE IF NOT EXISTS sync_state (
+    repo TEXT PRIMARY KEY,
+    synced_from TEXT NOT NULL,
+    high_water_mark TEXT NOT NULL
+);
+"""
+
+# Searches may lag behind updates; look back this far before the high-water mark.
+SYNC_OVERLAP = timedelta(minutes=10)
+
+_COLUMNS = (
+    "number",
+    "title",
+    "user",
+    "state",
+    "merged",
+    "created_at",
+    "updated_at",
+    "closed_at",
+    "changed_files",
+    "html_url",
+    "base_ref",
+    "head_sha",
+)
+
+
+def _utc_iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _day_after(day: str) -> str:
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+class PRStore:
+    """SQLite backed store of normalized :class:`PullRequestRecord` rows."""
+
+    def __init__(self, path: str):
+        self.path = resolve_path(path)
+        self._lock = threading.Lock()
+        # Multi-repository audits write to one store from several processes.
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def upsert(self, repo_name: str, records: Iterable[PullRequestRecord]) -> int:
+        rows = [(repo_name, *record.to_row().values()) for record in records]
+        placeholders = ", ".join("?" for _ in range(len(_COLUMNS) + 1))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO pull_requests (repo, {', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+        return len(rows)
+
+    def get_sync_state(self, repo_name: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT synced_from, high_water_mark FROM sync_state WHERE repo = ?",
+                (repo_name,),
+            ).fetchone()
+
+    def set_sync_state(
+        self, repo_name: str, synced_from: str, high_water_mark: str
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (repo, synced_from, high_water_mark) "
+                "VALUES (?, ?, ?)",
+                (repo_name, synced_from, high_water_mark),
+            )
+
+    def _select(self, where: str, params: tuple) -> List[PullRequestRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM pull_requests WHERE {where}",
+                params,
+            ).fetchall()
+        return [PullRequestRecord.from_row(dict(row)) for row in rows]
+
+    def get_closed(
+        self,
+        repo_name: str,
+        start_date: str,
+        end_date: str,
+        updated_since: Optional[str] = None,
+    ) -> List[PullRequestRecord]:
+        """
+        Closed PRs whose ``closed_at`` day falls within ``start_date..end_date`` (inclusive).
+
+        ``updated_since`` (an ISO timestamp) further keeps only PRs updated at or after it.
+        """
+        where = "repo = ? AND state = 'closed' AND closed_at >= ? AND closed_at < ?"
+        params = [repo_name, start_date, _day_after(end_date)]
+        if updated_since:
+            where += " AND updated_at >= ?"
+            params.append(parse_github_datetime(updated_since).isoformat())
+        return self._select(where + " ORDER BY closed_at, number", tuple(params))
+
+    def get_created(
+        self, repo_name: str, start_date: str, end_date: str
+    ) -> List[PullRequestRecord]:
+        """PRs in any state whose ``created_at`` day falls within ``start_date..end_date``."""
+        return self._select(
+            "repo = ? AND created_at >= ? AND created_at < ? ORDER BY created_at, number",
+            (repo_name, start_date, _day_after(end_date)),
+        )
+
+    def get_open(self, repo_name: str) -> List[PullRequestRecord]:
+        return self._select(
+            "repo = ? AND state = 'open' ORDER BY created_at, number", (repo_name,)
+        )
+
+
+def _drain_search(
+    client: GraphQLClient, repo_name: str, qualifiers: str, sort: str
+) -> List[PullRequestRecord]:
+    """Fetch every PR matching ``qualifiers``, walking past the search result cap."""
+    return list(
+        iter_sorted_search(client, f"repo:{repo_name} is:pr {qualifiers}", sort)
+    )
+
+
+def sync_pull_requests(gh, repo, store: PRStore, since: str) -> int:
+    """
+    Bring the store up to date for ``repo`` and make sure it covers ``since`` onwards.
+
+    Parameters
+    ----------
+    gh : Github
+        An authenticated GitHub API client.
+    repo : Repository
+        The repository to sync.
+    store : PRStore
+        Destination store.
+    since : str
+        Earliest date (YYYY-MM-DD) the caller needs closed PRs for.
+
+    Returns
+    -------
+    int
+        Number of PR records written.
+    """
+    repo_name = repo.full_name
+    client = get_graphql_client(repo)
+    state = store.get_sync_state(repo_name)
+    records: List[PullRequestRecord] = []
+
+    if state is None:
+        # First sync: every open PR, plus everything touched since the window start.
+        records += _drain_search(client, repo_name, "is:open", "created")
+        records += _drain_search(client, repo_name, f"updated:>={since}", "updated")
+        synced_from = since
+    else:
+        synced_from = state["synced_from"]
+        if since < synced_from:
+            # Backfill an older window that was never synced.
+            records += _drain_search(
+                client, repo_name, f"updated:{since}..{synced_from}", "updated"
+            )
+            synced_from = since
+        updated_since = _utc_iso(
+            parse_github_datetime(state["high_water_mark"]) - SYNC_OVERLAP
+        )
+        records += _drain_search(client, repo_name, f"updated:>={updated_since}", "updated")
+
+    high_water_mark = state["high_water_mark"] if state else None
+    if records:
+        newest = _utc_iso(max(record.updated_at for record in records))
+        if high_water_mark is None or newest > high_water_mark:
+            high_water_mark = newest
+    if high_water_mark is None:
+        high_water_mark = f"{since}T00:00:00Z"
+
+    written = store.upsert(repo_name, records)
+    store.set_sync_state(repo_name, synced_from, high_water_mark)
+    return written
+
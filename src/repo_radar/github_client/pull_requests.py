@@ -0,0 +1,237 @@
+"""
+Fetch layer returning :class:`PullRequestRecord` lists for the audit queries.
+
+When a ``store_path`` is given the records are read from the local PR store
+after an incremental sync; otherwise they are fetched live through batched
+GraphQL searches.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from repo_radar.github_client.details_cache import CACHEABLE_FIELDS, DetailsCache
+from repo_radar.github_client.graphql import (
+    fetch_pull_request_details,
+    get_graphql_client,
+)
+from repo_radar.github_client.pr_store import PRStore, sync_pull_requests
+from repo_radar.github_client.search_filter import SearchFilter
+from repo_radar.github_client.search_planner import (
+    day_range,
+    iter_sorted_search,
+    search_all_pull_requests,
+)
+from repo_radar.records import PullRequestRecord
+from repo_radar.utils.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+from repo_radar.utils.progress import ProgressBar
+
+# PRs per aliased GraphQL request when fetching files / check runs / reviews.
+DETAIL_BATCH_SIZE = 25
+
+
+def _open_store(gh, repo, store_path: str, since: str) -> PRStore:
+    store = PRStore(store_path)
+    written = sync_pull_requests(gh, repo, store, since=since)
+    print(f"🗄️ PR store synced for {repo.full_name} ({written} PRs updated)")
+    return store
+
+
+def get_closed_pull_requests(
+    gh,
+    repo,
+    start_date: str,
+    end_date: str,
+    store_path: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    desc: str = "🔍 Checking closed PRs",
+    updated_since: Optional[str] = None,
+    search_filter: Optional[SearchFilter] = None,
+) -> List[PullRequestRecord]:
+    """
+    Closed PRs whose close date falls within ``start_date..end_date``.
+
+    Live searches are sharded by close date so windows with more than 1,000
+    closed PRs are returned in full. ``updated_since`` (ISO timestamp) limits
+    the result to PRs updated at or after it, and ``search_filter`` to the PRs
+    it matches.
+    """
+    search_filter = search_filter or SearchFilter()
+    if store_path:
+        store = _open_store(gh, repo, store_path, since=start_date)
+        try:
+            records = store.get_closed(
+                repo.full_name, start_date, end_date, updated_since=updated_since
+            )
+        finally:
+            store.close()
+        return [record for record in records if search_filter.matches(record)]
+
+    base_query = f"repo:{repo.full_name} is:pr is:closed{search_filter.qualifiers()}"
+    if updated_since:
+        base_query += f" updated:>={updated_since}"
+    start, end = day_range(start_date, end_date)
+    return search_all_pull_requests(
+        get_graphql_client(repo),
+        base_query,
+        "closed",
+        start,
+        end,
+        max_workers=max_workers,
+        desc=desc,
+    )
+
+
+def get_created_pull_requests(
+    gh,
+    repo,
+    start_date: str,
+    end_date: str,
+    store_path: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    desc: str = "🆕 Checking created PRs",
+    search_filter: Optional[SearchFilter] = None,
+) -> List[PullRequestRecord]:
+    """
+    PRs in any state created within ``start_date..end_date`` and matching
+    ``search_filter``, sharded by creation date like the closed-PR search.
+    """
+    search_filter = search_filter or SearchFilter()
+    if store_path:
+        store = _open_store(gh, repo, store_path, since=start_date)
+        try:
+            records = store.get_created(repo.full_name, start_date, end_date)
+        finally:
+            store.close()
+        return [record for record in records if search_filter.matches(record)]
+
+    start, end = day_range(start_date, end_date)
+    return search_all_pull_requests(
+        get_graphql_client(repo),
+        f"repo:{repo.full_name} is:pr{search_filter.qualifiers()}",
+        "created",
+        start,
+        end,
+        max_workers=max_workers,
+        desc=desc,
+    )
+
+
+def get_open_pull_requests(
+    gh,
+    repo,
+    store_path: Optional[str] = None,
+    since: Optional[str] = None,
+    desc: str = "📂 Checking open PRs",
+    search_filter: Optional[SearchFilter] = None,
+) -> List[PullRequestRecord]:
+    """
+    Every currently open PR matching ``search_filter``, oldest first.
+
+    Fetched live, the search is sorted by creation date and streamed in pages
+    of 100, walking past the search cap. A ``created_on_or_before`` bound in
+    the filter (e.g. the stale check's age threshold) ends the scan at the
+    first PR that is too young, so younger PRs are never fetched.
+
+    ``since`` is only used to seed a first PR store sync.
+    """
+    search_filter = search_filter or SearchFilter()
+    if store_path:
+        store = _open_store(gh, repo, store_path, since=since)
+        try:
+            records = store.get_open(repo.full_name)
+        finally:
+            store.close()
+        return [record for record in records if search_filter.matches(record)]
+
+    results = iter_sorted_search(
+        get_graphql_client(repo),
+        f"repo:{repo.full_name} is:pr is:open{search_filter.qualifiers()}",
+        "created",
+    )
+    records = []
+    with ProgressBar(desc=desc, unit="PR") as progress:
+        for record in results:
+            records.append(record)
+            progress.update()
+    return records
+
+
+def get_pull_request_details(
+    repo,
+    numbers: List[int],
+    fields: Iterable[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    desc: str = "📑 Fetching PR details",
+    head_shas: Optional[Dict[int, str]] = None,
+    cache: Optional[DetailsCache] = None,
+) -> Dict[int, Dict[str, List[dict]]]:
+    """
+    Fetch ``fields`` (files, check_runs, reviews) for ``numbers`` in aliased batches.
+
+    Batches are requested concurrently on up to ``max_workers`` threads. With a
+    ``cache`` and the PRs' ``head_shas``, files and check runs are read from the
+    cache first and only the PRs missing them are fetched; what is fetched is
+    stored for the next run.
+    """
+    fields = list(fields)
+    details: Dict[int, Dict[str, List[dict]]] = {}
+    missing: Dict[int, List[str]] = {number: list(fields) for number in numbers}
+
+    cached_fields = [f for f in fields if f in CACHEABLE_FIELDS]
+    if cache is not None and head_shas and cached_fields:
+        for field in cached_fields:
+            cached = cache.lookup(
+                repo.full_name,
+                field,
+                (head_shas[n] for n in numbers if n in head_shas),
+            )
+            for number in numbers:
+                entries = cached.get(head_shas.get(number))
+                if entries is not None:
+                    details.setdefault(number, {})[field] = entries
+                    missing[number].remove(field)
+        hits = sum(len(fields) - len(left) for left in missing.values())
+        if hits:
+            print(f"💾 Reused {hits} cached PR details for {repo.full_name}")
+
+    # Every PR of a batch is asked the same fields, so batch PRs missing the same ones.
+    groups: Dict[tuple, List[int]] = {}
+    for number, left in missing.items():
+        if left:
+            groups.setdefault(tuple(left), []).append(number)
+    batches = [
+        (list(group_fields), group[i : i + DETAIL_BATCH_SIZE])
+        for group_fields, group in groups.items()
+        for i in range(0, len(group), DETAIL_BATCH_SIZE)
+    ]
+    if not batches:
+        return details
+
+    client = get_graphql_client(repo)
+    batch_details = map_concurrently(
+        lambda batch: fetch_pull_request_details(
+            client, repo.full_name, batch[1], batch[0]
+        ),
+        batches,
+        max_workers=max_workers,
+        desc=desc,
+        weight=lambda batch: len(batch[1]),
+    )
+
+    for batch_result in batch_details:
+        for number, fetched in batch_result.items():
+            details.setdefault(number, {}).update(fetched)
+
+    if cache is not None and head_shas:
+        for field in cached_fields:
+            cache.store(
+                repo.full_name,
+                field,
+                {
+                    head_shas[number]: fetched[field]
+                    for number, fetched in details.items()
+                    if number in head_shas
+                    and field in missing.get(number, ())
+                    and field in fetched
+                },
+            )
+    return details
@@ -0,0 +1,275 @@
+"""
+Rate-limit-aware request scheduling for GitHub API calls.
+
+Every request sent through a :class:`RateLimitedAdapter` first takes a slot
+from a :class:`RateLimitScheduler`, which
+
+- spreads requests over a pool of tokens (``GITHUB_TOKENS``, comma separated,
+  falling back to ``GITHUB_TOKEN``), always picking the token with the most
+  remaining budget for the request's resource (core, search or graphql);
+- paces each token with a token bucket, bursting while plenty of budget is
+  left and slowing to the sustainable rate (remaining / time-to-reset) once
+  the budget runs low;
+- reads ``X-RateLimit-*`` and ``Retry-After`` headers after every response,
+  parks a token until its reset time when it is exhausted, and backs off
+  adaptively (halving the token's rate) on secondary rate limits.
+
+Rate-limited responses are retried transparently with the next available
+token, so long audits slow down instead of failing.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from repo_radar.metrics import metrics
+from repo_radar.utils.progress import check_cancelled
+
+# Sustained request rate per token while the rate-limit budget is healthy.
+DEFAULT_MAX_REQUESTS_PER_SECOND = 10.0
+# Below this fraction of the limit, pace requests to last until the reset.
+LOW_BUDGET_FRACTION = 0.1
+# Wait before retrying a secondary rate limit that carried no Retry-After.
+SECONDARY_BACKOFF_SECONDS = 60.0
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Connection-level retries only; rate-limit responses are handled by the scheduler
+# rather than by PyGithub's GithubRetry, which would sleep inside urllib3.
+TRANSPORT_RETRY = Retry(total=3, backoff_factor=1, status_forcelist=(502, 503, 504))
+
+
+@lru_cache(maxsize=None)
+def _load_dotenv_once() -> None:
+    load_dotenv()
+
+
+def load_tokens() -> List[str]:
+    """Tokens from ``GITHUB_TOKENS`` (comma separated), else ``GITHUB_TOKEN``."""
+    _load_dotenv_once()
+    tokens = [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+    if not tokens and os.getenv("GITHUB_TOKEN"):
+        tokens = [os.getenv("GITHUB_TOKEN")]
+    return tokens
+
+
+def resource_for_url(url: str) -> str:
+    path = urlparse(url).path
+    if path.endswith("/graphql"):
+        return "graphql"
+    if "/search/" in path:
+        return "search"
+    return "core"
+
+
+@dataclass
+class _TokenBudget:
+    """Rate-limit state of one token for one resource."""
+
+    token: str
+    max_rate: float
+    rate: float
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+    secondary_strikes: int = 0
+    # token bucket
+    allowance: float = 1.0
+    last_refill: float = field(default_factory=time.monotonic)
+
+    def reserve(self, now: float) -> float:
+        """Take one slot from the bucket; return how long the caller must wait for it."""
+        capacity = max(1.0, self.rate)
+        self.allowance = min(capacity, self.allowance + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.allowance -= 1.0
+        if self.remaining is not None:
+            self.remaining -= 1
+        return 0.0 if self.allowance >= 0 else -self.allowance / self.rate
+
+    def available_at(self, wall_now: float) -> float:
+        if self.blocked_until > wall_now:
+            return self.blocked_until
+        if self.remaining is not None and self.remaining <= 0 and self.reset_at > wall_now:
+            return self.reset_at
+        return wall_now
+
+
+class RateLimitScheduler:
+    def __init__(
+        self,
+        tokens: List[str],
+        max_requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+    ):
+        if not tokens:
+            raise ValueError("Missing GITHUB_TOKEN or GITHUB_TOKENS in environment")
+        self.tokens = list(tokens)
+        self.max_requests_per_second = max_requests_per_second
+        self._lock = threading.Lock()
+        self._budgets: Dict[Tuple[str, str], _TokenBudget] = {}
+
+    def set_max_requests_per_second(self, max_requests_per_second: float) -> None:
+        """Change the healthy per-token rate, keeping any back-off in proportion."""
+        with self._lock:
+            if max_requests_per_second == self.max_requests_per_second:
+                return
+            self.max_requests_per_second = max_requests_per_second
+            for budget in self._budgets.values():
+                budget.rate *= max_requests_per_second / budget.max_rate
+                budget.max_rate = max_requests_per_second
+
+    def _budget(self, token: str, resource: str) -> _TokenBudget:
+        key = (token, resource)
+        if key not in self._budgets:
+            rate = self.max_requests_per_second
+            self._budgets[key] = _TokenBudget(token=token, max_rate=rate, rate=rate)
+        return self._budgets[key]
+
+    def acquire(self, resource: str) -> str:
+        """Block until a token may send a ``resource`` request, and return that token."""
+        while True:
+            with self._lock:
+                wall_now = time.time()
+                budgets = [self._budget(t, resource) for t in self.tokens]
+                ready = [b for b in budgets if b.available_at(wall_now) <= wall_now]
+                if ready:
+                    budget = max(
+                        ready,
+                        key=lambda b: (
+                            b.remaining if b.remaining is not None else float("inf"),
+                            b.allowance,
+                        ),
+                    )
+                    delay = budget.reserve(time.monotonic())
+                    token = budget.token
+                else:
+                    token = None
+                    delay = min(b.available_at(wall_now) for b in budgets) - wall_now
+
+            time.sleep(max(0.0, delay))
+            if token is not None:
+                return token
+
+    def record_response(self, token: str, resource: str, response) -> Optional[float]:
+        """
+        Update the token's budget from ``response`` headers.
+
+        Returns ``None`` when the response can be used, or the number of seconds
+        the token is parked for when the request hit a rate limit and should be
+        retried.
+        """
+        headers = response.headers
+        wall_now = time.time()
+        with self._lock:
+            budget = self._budget(token, resource)
+            if "X-RateLimit-Remaining" in headers:
+                budget.limit = int(headers.get("X-RateLimit-Limit", 0)) or budget.limit
+                budget.remaining = int(headers["X-RateLimit-Remaining"])
+                budget.reset_at = float(headers.get("X-RateLimit-Reset", 0))
+
+            if not _is_rate_limited(response):
+                # Recover gradually after a secondary limit, capped by the budget pace.
+                budget.secondary_strikes = 0
+                budget.rate = min(budget.max_rate, budget.rate * 1.1)
+                self._repace(budget, wall_now)
+                return None
+
+            retry_after = headers.get("Retry-After")
+            if budget.remaining == 0 and not retry_after:
+                # Primary limit: park the token until the window resets.
+                budget.blocked_until = max(budget.reset_at, wall_now + 1)
+            else:
+                # Secondary limit: honour Retry-After, else back off exponentially.
+                budget.secondary_strikes += 1
+                wait = (
+                    float(retry_after)
+                    if retry_after
+                    else SECONDARY_BACKOFF_SECONDS * 2 ** (budget.secondary_strikes - 1)
+                )
+                budget.blocked_until = wall_now + wait
+                budget.rate = max(budget.max_rate / 64, budget.rate / 2)
+            return budget.blocked_until - wall_now
+
+    @staticmethod
+    def _repace(budget: _TokenBudget, wall_now: float) -> None:
+        if not budget.limit or budget.remaining is None:
+            return
+        if budget.remaining > budget.limit * LOW_BUDGET_FRACTION:
+            return
+        seconds_to_reset = max(1.0, budget.reset_at - wall_now)
+        sustainable = max(budget.remaining, 1) / seconds_to_reset
+        budget.rate = min(budget.rate, sustainable)
+
+
+def _is_rate_limited(response) -> bool:
+    if response.status_code == 429:
+        return True
+    if response.status_code == 403:
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return True
+        if "Retry-After" in response.headers:
+            return True
+        return b"rate limit" in (response.content or b"").lower()
+    if response.status_code == 200 and resource_for_url(response.url) == "graphql":
+        # GraphQL reports exhausted budgets as a 200 with a RATE_LIMITED error.
+        return b'"RATE_LIMITED"' in (response.content or b"")
+    return False
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``requests`` adapter that routes every request through a :class:`RateLimitScheduler`."""
+
+    def __init__(self, scheduler: RateLimitScheduler, **kwargs):
+        self.scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        resource = resource_for_url(request.url)
+        response = None
+        for _ in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # Stop fetching as soon as the request that started the work is cancelled.
+            check_cancelled()
+            token = self.scheduler.acquire(resource)
+            request.headers["Authorization"] = f"token {token}"
+            started = time.perf_counter()
+            response = super().send(request, **kwargs)
+            metrics.record_request(
+                request, response, time.perf_counter() - started, token, resource
+            )
+            if self.scheduler.record_response(token, resource, response) is None:
+                return response
+            print(f"⏳ Rate limited on {resource} API, retrying with the next available token")
+        return response
+
+
+_schedulers: Dict[str, RateLimitScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(
+    host: str, max_requests_per_second: Optional[float] = None
+) -> RateLimitScheduler:
+    """
+    Process-wide scheduler for ``host``, shared by the REST and GraphQL clients.
+
+    A given ``max_requests_per_second`` also applies to an existing scheduler,
+    so the rate of the latest config wins; ``None`` keeps the current rate
+    (``DEFAULT_MAX_REQUESTS_PER_SECOND`` for a new scheduler).
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(host)
+        if scheduler is None:
+            scheduler = _schedulers[host] = RateLimitScheduler(
+                load_tokens(), max_requests_per_second or DEFAULT_MAX_REQUESTS_PER_SECOND
+            )
+        elif max_requests_per_second is not None:
+            scheduler.set_max_requests_per_second(max_requests_per_second)
+        return scheduler
@@ -0,0 +1,90 @@
+"""
+Predicates pushed down into GitHub search qualifiers.
+
+A query module may declare, through a module-level ``search_filters(config)``
+function, which PRs it can possibly report, e.g. only merged PRs, or only PRs
+created long enough ago to exceed an age threshold. The dataset adds those
+predicates to its searches as qualifiers (``is:merged``, ``created:<=``), so
+GitHub returns fewer PRs. Queries keep evaluating every predicate locally, so
+a filter only has to match a superset of what the query reports; predicates
+that search cannot express (e.g. changed file counts) stay local only.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+
+from repo_radar.records import PullRequestRecord
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """Conjunction of search predicates; the default filter matches every PR."""
+
+    # is:merged
+    merged: bool = False
+    # created:<=YYYY-MM-DD
+    created_on_or_before: Optional[date] = None
+    # -base:<branch>
+    excluded_base: Optional[str] = None
+
+    def qualifiers(self) -> str:
+        """The filter as search qualifiers, with a leading space, or ``""``."""
+        parts = []
+        if self.merged:
+            parts.append("is:merged")
+        if self.created_on_or_before is not None:
+            parts.append(f"created:<={self.created_on_or_before.isoformat()}")
+        if self.excluded_base is not None:
+            parts.append(f"-base:{self.excluded_base}")
+        return "".join(f" {part}" for part in parts)
+
+    def matches(self, record: PullRequestRecord) -> bool:
+        """Local evaluation, for records that did not come from a search (the PR store)."""
+        if self.merged and not record.merged:
+            return False
+        if self.created_on_or_before is not None and (
+            record.created_at is None
+            or record.created_at.date() > self.created_on_or_before
+        ):
+            return False
+        if self.excluded_base is not None and record.base_ref == self.excluded_base:
+            return False
+        return True
+
+    def includes(self, other: "SearchFilter") -> bool:
+        """Whether every PR matched by ``other`` is also matched by this filter."""
+        if self.merged and not other.merged:
+            return False
+        if self.created_on_or_before is not None and (
+            other.created_on_or_before is None
+            or other.created_on_or_before > self.created_on_or_before
+        ):
+            return False
+        if self.excluded_base is not None and other.excluded_base != self.excluded_base:
+            return False
+        return True
+
+    @classmethod
+    def covering(cls, filters: Iterable["SearchFilter"]) -> "SearchFilter":
+        """The most selective filter that still matches every PR any of ``filters`` matches."""
+        filters = list(filters)
+        if not filters:
+            return cls()
+        bounds = [f.created_on_or_before for f in filters]
+        excluded_bases = {f.excluded_base for f in filters}
+        return cls(
+            merged=all(f.merged for f in filters),
+            created_on_or_before=None if None in bounds else max(bounds),
+            excluded_base=excluded_bases.pop() if len(excluded_bases) == 1 else None,
+        )
+
+
+def created_bound_for_age(latest: datetime, age_days: int) -> date:
+    """
+    Last creation date of a PR whose age at ``latest`` can exceed ``age_days``.
+
+    A PR is older than ``age_days`` whole days at ``latest`` only when it was
+    created at least ``age_days + 1`` days before it.
+    """
+    return (latest - timedelta(days=age_days + 1)).date()
@@ -0,0 +1,158 @@
+"""
+Search planner that gets past GitHub's 1,000-result search cap.
+
+GitHub search (REST and GraphQL alike) never returns more than 1,000 results
+for one query, and busy repositories easily close more PRs than that in a
+quarter. The planner splits a date-qualified query (e.g. ``closed:`` or
+``created:``) into shards, halving each range until every shard is under the
+cap, runs the shards concurrently and merges the de-duplicated results.
+
+Scans that only need a stream in date order (e.g. the open PRs, oldest first)
+use :func:`iter_sorted_search` instead, which pages through one sorted query
+and re-issues it from the last timestamp seen whenever it hits the cap.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterator, List, Tuple
+
+from repo_radar.github_client.graphql import GraphQLClient, search_pull_requests
+from repo_radar.records import PullRequestRecord
+from repo_radar.utils.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+
+SEARCH_RESULT_LIMIT = 1000
+
+COUNT_QUERY = """
+query($q: String!) {
+  search(query: $q, type: ISSUE, first: 1) { issueCount }
+}
+"""
+
+_ONE_SECOND = timedelta(seconds=1)
+_ONE_DAY = timedelta(days=1)
+
+Shard = Tuple[datetime, datetime]
+
+
+def count_results(client: GraphQLClient, query: str) -> int:
+    return client.execute(COUNT_QUERY, {"q": query})["search"]["issueCount"]
+
+
+def _is_whole_days(start: datetime, end: datetime) -> bool:
+    return start.time() == time.min and end.time() == time(23, 59, 59)
+
+
+def format_range(start: datetime, end: datetime) -> str:
+    """Render an inclusive range as a search qualifier value, using plain dates when possible."""
+    if _is_whole_days(start, end):
+        return f"{start.date().isoformat()}..{end.date().isoformat()}"
+    fmt = "%Y-%m-%dT%H:%M:%SZ"
+    return f"{start.strftime(fmt)}..{end.strftime(fmt)}"
+
+
+def day_range(start_date: str, end_date: str) -> Shard:
+    """Inclusive UTC range covering the days ``start_date..end_date``."""
+    start = datetime.combine(date.fromisoformat(start_date), time.min, timezone.utc)
+    end = datetime.combine(date.fromisoformat(end_date), time(23, 59, 59), timezone.utc)
+    return start, end
+
+
+def _split(start: datetime, end: datetime) -> Tuple[Shard, Shard]:
+    if _is_whole_days(start, end) and end - start > _ONE_DAY:
+        days = (end.date() - start.date()).days + 1
+        mid = start + timedelta(days=days // 2) - _ONE_SECOND
+    else:
+        mid = start + (end - start) / 2
+        mid = mid.replace(microsecond=0)
+    return (start, mid), (mid + _ONE_SECOND, end)
+
+
+def plan_shards(
+    client: GraphQLClient, base_query: str, field: str, start: datetime, end: datetime
+) -> List[Tuple[str, int]]:
+    """
+    Split ``base_query`` on ``field`` over ``start..end`` into shards under the cap.
+
+    Returns
+    -------
+    List[Tuple[str, int]]
+        ``(shard query, expected result count)`` pairs in chronological order.
+    """
+    query = f"{base_query} {field}:{format_range(start, end)}"
+    count = count_results(client, query)
+    if count <= SEARCH_RESULT_LIMIT or end - start < _ONE_SECOND:
+        if count > SEARCH_RESULT_LIMIT:
+            print(f"⚠️ More than {SEARCH_RESULT_LIMIT} PRs within one second: {query}")
+        return [(query, count)] if count else []
+
+    first, second = _split(start, end)
+    return plan_shards(client, base_query, field, *first) + plan_shards(
+        client, base_query, field, *second
+    )
+
+
+def search_all_pull_requests(
+    client: GraphQLClient,
+    base_query: str,
+    field: str,
+    start: datetime,
+    end: datetime,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    desc: str = "🔍 Searching PRs",
+) -> List[PullRequestRecord]:
+    """
+    Every PR matching ``base_query`` with ``field`` in ``start..end``, past the search cap.
+
+    Shards are fetched concurrently; the merged records are de-duplicated by
+    PR number and returned in shard (chronological) order.
+    """
+    shards = plan_shards(client, base_query, field, start, end)
+    counts = {query: count for query, count in shards}
+    pages = map_concurrently(
+        lambda query: list(search_pull_requests(client, query)),
+        [query for query, _ in shards],
+        max_workers=max_workers,
+        desc=desc,
+        weight=counts.get,
+    )
+
+    records = {}
+    for page in pages:
+        for record in page:
+            records.setdefault(record.number, record)
+    return list(records.values())
+
+
+def iter_sorted_search(
+    client: GraphQLClient, base_query: str, field: str
+) -> Iterator[PullRequestRecord]:
+    """
+    Stream every PR matching ``base_query`` in ascending ``field`` order, past the search cap.
+
+    Results arrive one page (100 PRs) at a time, so a caller can stop early
+    without fetching the rest. Whenever a query is exhausted at the cap, it is
+    re-issued starting from the last timestamp seen; PRs repeated across the
+    boundary are yielded once.
+    """
+    seen_numbers = set()
+    lower_bound = None
+    while True:
+        query = f"{base_query} sort:{field}-asc"
+        if lower_bound:
+            query += f" {field}:>={lower_bound}"
+
+        seen = 0
+        last_value = None
+        for record in search_pull_requests(client, query):
+            seen += 1
+            last_value = getattr(record, f"{field}_at")
+            if record.number not in seen_numbers:
+                seen_numbers.add(record.number)
+                yield record
+
+        if seen < SEARCH_RESULT_LIMIT or last_value is None:
+            return
+        next_bound = last_value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if next_bound == lower_bound:
+            # More than a full page of PRs share one timestamp; nothing left to narrow.
+            return
+        lower_bound = next_bound
@@ -0,0 +1,213 @@
+"""
+Append-only history of audit summaries, for trends without re-running audits.
+
+Every CLI audit appends one row per repository, team and check: the number
+of results and their median / p90 age and size (from the ``by_repository``
+rollups of :func:`repo_radar.aggregation.audit_rollups`), dated by the audit
+window's ``end_date``. Configured teams without results are recorded with
+zero, so a count dropping to nothing shows up in the trend. A check that
+failed for a repository records nothing for it, so an earlier complete run
+stays the latest. Rows are never updated; when a window is audited again,
+the latest run of a check wins.
+
+:meth:`HistoryStore.trend` reads series over any date range from the local
+store only; the CLI exposes it as the ``trend`` subcommand and the MCP server
+as the ``get_audit_trend`` tool.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from repo_radar.utils.path_utils import get_cache_dir, resolve_path
+
+# Stats copied from each rollup next to the result count
+STAT_FIELDS = (
+    "age_days_median",
+    "age_days_p90",
+    "changed_files_median",
+    "changed_files_p90",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summary_history (
+    repo TEXT NOT NULL,
+    team TEXT NOT NULL,
+    check_name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    results INTEGER NOT NULL,
+    age_days_median REAL,
+    age_days_p90 REAL,
+    changed_files_median REAL,
+    changed_files_p90 REAL,
+    PRIMARY KEY (repo, team, check_name, date, recorded_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_summary_history_runs
+    ON summary_history (repo, check_name, date, recorded_at);
+"""
+
+
+class HistoryStore:
+    """SQLite time series of per-team, per-check audit summaries."""
+
+    def __init__(self, path: str):
+        self.path = resolve_path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "HistoryStore":
+        """The store at ``history_path``, by default in the repo-radar cache directory."""
+        return cls(
+            config.get("history_path") or str(get_cache_dir() / "audit_history.sqlite3")
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def append(
+        self,
+        start_date: str,
+        end_date: str,
+        repositories: Iterable[str],
+        teams: Iterable[str],
+        checks: Iterable[str],
+        repository_rollups: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]],
+        failed_checks: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> int:
+        """
+        Record one audit of ``start_date..end_date``; returns the rows written.
+
+        ``repository_rollups`` is ``{repository: {team: {check: stats}}}``;
+        every configured team and enabled check of each audited repository is
+        recorded, with zero results when the rollups have none. The checks in
+        ``failed_checks`` (``{repository: checks}``) are skipped for that
+        repository.
+        """
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        checks = list(checks)
+        failed_checks = failed_checks or {}
+        rows = []
+        for repo in repositories:
+            team_rollups = repository_rollups.get(repo, {})
+            failed = set(failed_checks.get(repo, ()))
+            completed = [check for check in checks if check not in failed]
+            for team in dict.fromkeys([*teams, *team_rollups]):
+                for check in completed:
+                    stats = team_rollups.get(team, {}).get(check, {})
+                    rows.append(
+                        (
+                            repo,
+                            team,
+                            check,
+                            end_date,
+                            recorded_at,
+                            start_date,
+                            stats.get("prs", 0),
+                            *(stats.get(field) for field in STAT_FIELDS),
+                        )
+                    )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO summary_history "
+                "(repo, team, check_name, date, recorded_at, start_date, results, "
+                f"{', '.join(STAT_FIELDS)}) VALUES ({', '.join('?' * (7 + len(STAT_FIELDS)))})",
+                rows,
+            )
+        return len(rows)
+
+    def trend(
+        self,
+        repository: Optional[str] = None,
+        team: Optional[str] = None,
+        check: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stored series matching the optional filters, audits dated within ``start_date..end_date``.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One ``{"repository", "team", "check", "points"}`` series per
+            repository, team and check, its points (``date``, ``start_date``,
+            ``results`` and the stats) in date order.
+        """
+        conditions, params = [], []
+        for column, value in (("repo", repository), ("team", team), ("check_name", check)):
+            if value is not None:
+                conditions.append(f"h.{column} = ?")
+                params.append(value)
+        if start_date is not None:
+            conditions.append("h.date >= ?")
+            params.append(start_date)
+        if end_date is not None:
+            conditions.append("h.date <= ?")
+            params.append(end_date)
+        # Latest run of each check per repository and date
+        conditions.append(
+            "h.recorded_at = (SELECT MAX(recorded_at) FROM summary_history "
+            "WHERE repo = h.repo AND check_name = h.check_name AND date = h.date)"
+        )
+        query = (
+            "SELECT h.repo, h.team, h.check_name, h.date, h.start_date, h.results, "
+            f"{', '.join('h.' + field for field in STAT_FIELDS)} FROM summary_history h "
+            f"WHERE {' AND '.join(conditions)} "
+            "ORDER BY h.repo, h.team, h.check_name, h.date"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        series: Dict[tuple, Dict[str, Any]] = {}
+        for repo, team_name, check_name, date, window_start, results, *stats in rows:
+            entry = series.setdefault(
+                (repo, team_name, check_name),
+                {"repository": repo, "team": team_name, "check": check_name, "points": []},
+            )
+            entry["points"].append(
+                {
+                    "date": date,
+                    "start_date": window_start,
+                    "results": results,
+                    **dict(zip(STAT_FIELDS, stats)),
+                }
+            )
+        return list(series.values())
+
+
+def record_audit(
+    config: dict,
+    enabled_checks: List[str],
+    repositories: List[str],
+    repository_rollups: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]],
+    failed_checks: Optional[Dict[str, Iterable[str]]] = None,
+) -> None:
+    """
+    Append the audit's summary to the history store, unless ``history`` is false.
+
+    ``failed_checks`` maps a repository to the checks that failed for it,
+    which are not recorded.
+    """
+    if not config.get("history", True):
+        return
+    store = HistoryStore.from_config(config)
+    try:
+        written = store.append(
+            config["start_date"],
+            config["end_date"],
+            repositories,
+            config.get("teams") or {},
+            enabled_checks,
+            repository_rollups,
+            failed_checks,
+        )
+    finally:
+        store.close()
+    print(f"🗃️ Recorded {written} summary rows in {store.path}")
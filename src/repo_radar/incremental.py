@@ -0,0 +1,344 @@
+"""
+Incremental audits over a rolling window.
+
+A daily audit of the last 30 days repeats almost all of the previous day's
+work. In incremental mode the results of closed PRs are stored per repository
+together with a watermark (the time the run started). The next run
+
+- evaluates the checks only on closed PRs updated since the watermark (which
+  includes every PR closed since then) and on all open PRs, whose results
+  depend on the current time and are never stored;
+- replaces the stored results of every re-evaluated PR, drops those of PRs
+  that were reopened, and expires results closed outside the new window;
+- emits each check's results in a canonical order: closed PRs by
+  ``(closed_at, number)``, then open PRs.
+
+The first run, a changed config or team membership (see
+:func:`config_fingerprint`) or a window that starts earlier or ends earlier
+than the stored one falls back to a full evaluation, which goes through the
+same merge and ordering. Non-incremental audits read the closed PRs in the
+same order, so the output is identical to a full run either way. Results are
+assumed to depend only on the PR and the config, which holds for the built-in
+checks; incremental checks must yield :class:`~repo_radar.records.Finding`
+objects. Checks that do not
+select PRs by the closed-PR window declare ``INCREMENTAL = False`` and are
+re-evaluated in full on every run, their results emitted as produced.
+
+Stored results keep their PR record and team
+(:class:`~repo_radar.records.RenderedFinding`), so rollups of a resumed run
+see the same PR facts as a full one. State written before results carried
+them is discarded.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from repo_radar.audit_runner import (
+    dataset_search_filters,
+    iter_dynamic_query,
+    load_query_module,
+)
+from repo_radar.dataset import PRDataset
+from repo_radar.github_client import get_github_and_repo
+from repo_radar.metrics import scope, stage
+from repo_radar.query_manifest import required_fields_for
+from repo_radar.records import PullRequestRecord, RenderedFinding
+from repo_radar.utils.path_utils import get_cache_dir, resolve_path
+from repo_radar.utils.team_utils import TeamDirectory
+
+# Keys that do not change what the checks find, so changing them keeps the state.
+_NON_SEMANTIC_KEYS = {
+    "start_date",
+    "end_date",
+    "output_format",
+    "output_path",
+    "output_compression",
+    "summary_format",
+    "summary_output_path",
+    "metrics_output_path",
+    "rollups_output_path",
+    "history",
+    "history_path",
+    "incremental",
+    "incremental_state_path",
+    "parallelism",
+    "max_workers",
+    "max_requests_per_second",
+    "http_cache",
+    "http_cache_path",
+    "http_cache_max_mb",
+    "details_cache",
+    "details_cache_path",
+    "details_cache_max_mb",
+    "github_pool_size",
+    "repo_cache_ttl_seconds",
+    # The state is stored per repository already
+    "repository",
+    "repositories",
+    "organization",
+    "repository_filter",
+}
+
+# Searches may lag behind updates; look back this far before the last run's start.
+WATERMARK_OVERLAP = timedelta(minutes=10)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_state (
+    repo TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    watermark TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS audit_results (
+    repo TEXT NOT NULL,
+    check_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    closed_at TEXT NOT NULL,
+    result TEXT NOT NULL,
+    pr TEXT,
+    team TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_results_repo ON audit_results (repo, check_name);
+"""
+
+
+def config_fingerprint(
+    raw_config: dict, enabled_checks: List[str], teams: Optional[TeamDirectory] = None
+) -> str:
+    """
+    Hash of everything in the config that can change the checks' results.
+
+    ``teams`` adds the resolved team members, so a change in a GitHub org
+    team's membership (seen through its snapshot) relabels stored results.
+    """
+    semantic = {k: v for k, v in raw_config.items() if k not in _NON_SEMANTIC_KEYS}
+    canonical = json.dumps(
+        {
+            "config": semantic,
+            "checks": enabled_checks,
+            "team_members": teams.membership() if teams is not None else None,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class AuditState:
+    fingerprint: str
+    start_date: str
+    end_date: str
+    watermark: str
+    # check name -> stored closed-PR results
+    results: Dict[str, List[RenderedFinding]]
+
+
+class IncrementalStateStore:
+    """SQLite store of :class:`AuditState` per repository."""
+
+    def __init__(self, path: str):
+        self.path = resolve_path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(audit_results)")
+            }
+            for column in ("pr", "team"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE audit_results ADD COLUMN {column} TEXT")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def load(self, repo_name: str) -> Optional[AuditState]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, start_date, end_date, watermark FROM audit_state "
+                "WHERE repo = ?",
+                (repo_name,),
+            ).fetchone()
+            if row is None:
+                return None
+            results: Dict[str, List[RenderedFinding]] = {}
+            for check_name, result, pr, team in self._conn.execute(
+                "SELECT check_name, result, pr, team FROM audit_results WHERE repo = ?",
+                (repo_name,),
+            ):
+                if pr is None:
+                    # Stored before results kept their PR record
+                    return None
+                results.setdefault(check_name, []).append(
+                    RenderedFinding(
+                        json.loads(result), PullRequestRecord.from_row(json.loads(pr)), team
+                    )
+                )
+        return AuditState(*row, results=results)
+
+    def save(self, repo_name: str, state: AuditState) -> None:
+        rows = [
+            (
+                repo_name,
+                check_name,
+                r.pr.number,
+                r.pr.closed_at.isoformat(),
+                json.dumps(r.result),
+                json.dumps(r.pr.to_row()),
+                r.team,
+            )
+            for check_name, results in state.results.items()
+            for r in results
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM audit_results WHERE repo = ?", (repo_name,))
+            self._conn.executemany(
+                "INSERT INTO audit_results "
+                "(repo, check_name, number, closed_at, result, pr, team) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO audit_state "
+                "(repo, fingerprint, start_date, end_date, watermark) VALUES (?, ?, ?, ?, ?)",
+                (
+                    repo_name,
+                    state.fingerprint,
+                    state.start_date,
+                    state.end_date,
+                    state.watermark,
+                ),
+            )
+
+
+def _can_resume(state: Optional[AuditState], fingerprint: str, raw_config: dict) -> bool:
+    return (
+        state is not None
+        and state.fingerprint == fingerprint
+        and raw_config["start_date"] >= state.start_date
+        and raw_config["end_date"] >= state.end_date
+    )
+
+
+def _in_window(result: RenderedFinding, start_date: str, end_date: str) -> bool:
+    return start_date <= result.pr.closed_at.date().isoformat() <= end_date
+
+
+def _canonical_order(result: RenderedFinding) -> Tuple[datetime, int]:
+    return result.pr.closed_at, result.pr.number
+
+
+def iter_incremental_audit(
+    raw_config: dict,
+    enabled_checks_config: dict,
+    on_failure: Optional[Callable[[str, str], None]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Incremental counterpart of ``iter_config_audit``: yield ``(check name, result)``
+    pairs, evaluating only what changed since the previous run. Checks that
+    raise are reported to ``on_failure(check name, error)``.
+    """
+    enabled_checks = enabled_checks_config["enabled_checks"]
+    start_date, end_date = raw_config["start_date"], raw_config["end_date"]
+    started_at = datetime.now(timezone.utc)
+
+    gh, repo = get_github_and_repo(raw_config)
+    store = IncrementalStateStore(
+        raw_config.get("incremental_state_path")
+        or str(get_cache_dir() / "incremental_audits.sqlite3")
+    )
+    try:
+        with scope("dataset"), stage("load_teams"):
+            teams = TeamDirectory.from_config(raw_config, gh)
+        fingerprint = config_fingerprint(raw_config, enabled_checks, teams)
+        state = store.load(repo.full_name)
+        if _can_resume(state, fingerprint, raw_config):
+            # PRs closed after the stored window but before the watermark were
+            # never evaluated, so never look back less than to the window's end.
+            window_end = f"{date.fromisoformat(state.end_date) + timedelta(days=1)}T00:00:00Z"
+            updated_since = min(state.watermark, window_end)
+            stored = state.results
+            print(f"♻️ Incremental audit of {repo.full_name} since {updated_since}")
+        else:
+            updated_since = None
+            stored = {}
+            print(f"🆕 Full audit of {repo.full_name} (no reusable incremental state)")
+
+        with scope("dataset"):
+            # Every open PR is fetched: reopened PRs must be recognised whatever they are
+            filters = dataset_search_filters(enabled_checks, raw_config)
+            filters.pop("open")
+            dataset = PRDataset.from_config(
+                gh,
+                repo,
+                raw_config,
+                updated_since=updated_since,
+                filters=filters,
+                teams=teams,
+            )
+            dataset.prefetch(required_fields_for(enabled_checks))
+        reevaluated = set(dataset.closed.column("number"))
+        reopened = set(dataset.open.column("number"))
+
+        merged: Dict[str, List[RenderedFinding]] = {}
+        failed = False
+        for check_name in enabled_checks:
+            print(f"🔍 Running audit check: {check_name}...")
+            if not getattr(load_query_module(check_name), "INCREMENTAL", True):
+                try:
+                    for item in iter_dynamic_query(
+                        check_name, raw_config, gh=gh, repo=repo, dataset=dataset
+                    ):
+                        yield check_name, item
+                except Exception as e:
+                    print(f"❌ Audit check {check_name} failed: {e}")
+                    if on_failure is not None:
+                        on_failure(check_name, str(e))
+                continue
+
+            closed = [
+                r
+                for r in stored.get(check_name, [])
+                if r.pr.number not in reevaluated
+                and r.pr.number not in reopened
+                and _in_window(r, start_date, end_date)
+            ]
+            open_results = []
+            try:
+                for item in iter_dynamic_query(
+                    check_name, raw_config, gh=gh, repo=repo, dataset=dataset
+                ):
+                    result = RenderedFinding.from_finding(item)
+                    if result.pr.closed_at is not None:
+                        closed.append(result)
+                    else:
+                        open_results.append(result)
+            except Exception as e:
+                # Leave the stored state alone so the next run covers this one's changes
+                print(f"❌ Audit check {check_name} failed: {e}")
+                if on_failure is not None:
+                    on_failure(check_name, str(e))
+                failed = True
+                continue
+
+            closed.sort(key=_canonical_order)
+            merged[check_name] = closed
+            for result in closed + open_results:
+                yield check_name, result
+
+        if not failed:
+            watermark = (started_at - WATERMARK_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+            store.save(
+                repo.full_name,
+                AuditState(fingerprint, start_date, end_date, watermark, merged),
+            )
+    finally:
+        store.close()
@@ -0,0 +1,99 @@
+"""
+Config files loaded once for the MCP server and reloaded only when they change.
+
+The config paths are resolved from the command line (or
+``REPO_RADAR_CONFIG_DIR``) a single time. Tool calls then only compare the
+files' modification times, at most once per ``poll_interval`` seconds, and
+re-read the JSON when one of them changed. Each tool's defaults are merged
+and validated against its ``Config`` model once per load, so a call only has
+to merge and validate the LLM's overrides.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from repo_radar.audit_runner import build_query_config
+
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+class ConfigCache:
+    def __init__(
+        self,
+        config_path: str,
+        enabled_checks_config_path: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ):
+        self.config_path = config_path
+        self.enabled_checks_config_path = enabled_checks_config_path
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._mtimes: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._checked_at = float("-inf")
+        self._raw_config: Dict[str, Any] = {}
+        self._enabled_checks_config: Dict[str, Any] = {}
+        self._tool_defaults: Dict[str, Tuple[Dict[str, Any], Optional[BaseModel]]] = {}
+
+    def _refresh(self) -> None:
+        """Re-read the files if their mtimes changed; caller holds the lock."""
+        now = time.monotonic()
+        if now - self._checked_at < self.poll_interval:
+            return
+        self._checked_at = now
+        mtimes = (_mtime(self.config_path), _mtime(self.enabled_checks_config_path))
+        if mtimes == self._mtimes and self._raw_config:
+            return
+
+        with open(self.config_path) as f:
+            raw_config = json.load(f)
+        with open(self.enabled_checks_config_path) as f:
+            # Currently this is not used
+            enabled_checks_config = json.load(f)
+
+        self._raw_config = raw_config
+        self._enabled_checks_config = enabled_checks_config
+        self._tool_defaults = {}
+        self._mtimes = mtimes
+        print(f"🔄 Loaded config from {self.config_path}")
+
+    def get(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Current ``(raw config, enabled checks config)``; treat both as read-only."""
+        with self._lock:
+            self._refresh()
+            return self._raw_config, self._enabled_checks_config
+
+    def tool_config(
+        self, tool_name: str, config_class: Type[BaseModel], overrides: Dict[str, Any]
+    ) -> BaseModel:
+        """
+        ``config_class`` for ``tool_name`` with ``overrides`` applied on top of the file defaults.
+
+        Raises ``pydantic.ValidationError`` when the merged config is invalid.
+        """
+        with self._lock:
+            self._refresh()
+            if tool_name not in self._tool_defaults:
+                merged = build_query_config(tool_name, self._raw_config)
+                try:
+                    validated = config_class.model_validate(merged)
+                except ValidationError:
+                    # The defaults may rely on the caller supplying required fields.
+                    validated = None
+                self._tool_defaults[tool_name] = (merged, validated)
+            defaults, validated = self._tool_defaults[tool_name]
+
+        if not overrides and validated is not None:
+            return validated.model_copy(deep=True)
+        return config_class.model_validate({**defaults, **overrides})
@@ -1,19 +1,59 @@
-from fastmcp import FastMCP
-from fastapi import FastAPI
-from fastapi import APIRouter
-import uvicorn
+from typing import Optional
 
-import repo_radar.mcp_server.tool_loader  # this registers all tools
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
-from repo_radar.mcp_server.tool_loader import mcp, load_tools_for_mcp
+from repo_radar.history import HistoryStore
+from repo_radar.mcp_server.tool_loader import mcp, load_tools_for_mcp, get_config_cache
+from repo_radar.metrics import metrics
 
 load_tools_for_mcp()
 
 
+@mcp.tool(
+    name="get_audit_trend",
+    description=(
+        "Trend of past audit summaries from the local history, without calling GitHub: "
+        "per repository (owner/name), team and check, the number of results and their "
+        "median / p90 age and size for every audit whose end date is within "
+        "start_date..end_date (YYYY-MM-DD). All filters are optional."
+    ),
+)
+def get_audit_trend(
+    repository: Optional[str] = None,
+    team: Optional[str] = None,
+    check: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> dict:
+    raw_config, _ = get_config_cache().get()
+    store = HistoryStore.from_config(raw_config)
+    try:
+        series = store.trend(
+            repository=repository,
+            team=team,
+            check=check,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    finally:
+        store.close()
+    return {"results": series, "metadata": {"cached": False}}
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """GitHub API and pipeline metrics of the tool calls served so far."""
+    return PlainTextResponse(
+        metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 def main():
+    # Load and validate the config files once at startup instead of on the first call.
+    get_config_cache().get()
     mcp.run(transport="http", host="127.0.0.1", port=8000)
 
 
 if __name__ == "__main__":
-    # uvicorn.run(mcp, host="0.0.0.0", port=8000)
     main()
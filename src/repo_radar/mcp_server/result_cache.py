@@ -0,0 +1,84 @@
+"""
+Memoization of MCP tool results.
+
+Agents often ask the same question several times in one conversation. Results
+are kept in memory for ``ttl_seconds``, keyed on the tool, the repository and
+the fully merged, validated config in canonical JSON form (sorted keys,
+defaults filled in), so the same question asked with differently ordered or
+partially defaulted inputs hits the same entry. At most ``max_entries``
+results are kept, dropping the least recently used first.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 128
+
+
+def cache_key(tool_name: str, repository: Optional[str], config: BaseModel) -> str:
+    canonical = json.dumps(
+        {
+            "tool": tool_name,
+            "repository": (repository or "").rstrip("/").lower(),
+            "config": config.model_dump(mode="json"),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(
+        self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires at (monotonic), stored at (epoch), result)
+        self._entries: "OrderedDict[str, Tuple[float, float, Any]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """``(result, metadata)`` for a live entry, else ``None``."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, stored_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return result, {
+            "cached": True,
+            "cached_at": datetime.fromtimestamp(stored_at, timezone.utc).isoformat(),
+            "age_seconds": round(time.time() - stored_at, 3),
+        }
+
+    def put(self, key: str, result: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, time.time(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,7 +1,11 @@
-import importlib.util
+import asyncio
+import contextvars
+import functools
 import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from typing import Callable, Tuple, Type
 from pydantic import BaseModel
 from pydantic import ValidationError
@@ -10,10 +14,17 @@ from fastmcp.exceptions import ToolError
 
 import argparse
 import json
-from repo_radar.github_client import get_repo, get_github_and_repo
-from repo_radar.audit_runner import run_dynamic_query
-from repo_radar.utils.path_utils import get_queries_dir
-from typing import Dict, List, Any
+from repo_radar.mcp_server.config_cache import ConfigCache
+from repo_radar.metrics import scope, stage
+from repo_radar.mcp_server.result_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    ResultCache,
+    cache_key,
+)
+from repo_radar.query_manifest import load_manifest, load_query_file
+from repo_radar.utils.progress import reporting
+from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 import os
 
@@ -38,12 +49,12 @@ def load_cli_arguments():
     config_path = (
         config_path
         if config_path
-        else os.path.join(repo_radar_config_dir, "config.json")
+        else os.path.join(repo_radar_config_dir or "", "config.json")
     )
     enabled_checks_config = (
         enabled_checks_config
         if enabled_checks_config
-        else os.path.join(repo_radar_config_dir, "enabled_checks_config.json")
+        else os.path.join(repo_radar_config_dir or "", "enabled_checks_config.json")
     )
 
     return config_path, enabled_checks_config
@@ -52,37 +63,125 @@ def load_cli_arguments():
 mcp = FastMCP("RepoRadarMCP")
 
 
+_config_cache: Optional[ConfigCache] = None
+
+
+def get_config_cache() -> ConfigCache:
+    """Config cache for the paths given on the command line, created on first use."""
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = ConfigCache(*load_cli_arguments())
+    return _config_cache
+
+
 def get_config_from_files():
-    config_path, enabled_checks_config_path = load_cli_arguments()
+    return get_config_cache().get()
 
-    with open(config_path) as f:
-        raw_config = json.load(f)
 
-    with open(enabled_checks_config_path) as f:
-        # Currently this is not used
-        enabled_checks_config = json.load(f)
+# Query calls running at once; further calls wait for a free worker.
+DEFAULT_MAX_CONCURRENT_TOOLS = 8
 
-    return raw_config, enabled_checks_config
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_executor_lock = threading.Lock()
 
 
-def insert_default_config_from_file(func, config_class):
-    def wrapper(config: str):
-        try:
-            # Load defaults
-            configs_from_file, _ = get_config_from_files()
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Executor running the (blocking) query functions off the event loop."""
+    global _tool_executor
+    with _tool_executor_lock:
+        if _tool_executor is None:
+            raw_config, _ = get_config_from_files()
+            _tool_executor = ThreadPoolExecutor(
+                max_workers=raw_config.get(
+                    "mcp_max_concurrent_tools", DEFAULT_MAX_CONCURRENT_TOOLS
+                ),
+                thread_name_prefix="repo-radar-tool",
+            )
+        return _tool_executor
+
+
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Result cache sized by ``mcp_result_cache_ttl_seconds`` / ``mcp_result_cache_max_entries``."""
+    global _result_cache
+    if _result_cache is None:
+        raw_config, _ = get_config_from_files()
+        _result_cache = ResultCache(
+            ttl_seconds=raw_config.get("mcp_result_cache_ttl_seconds", DEFAULT_TTL_SECONDS),
+            max_entries=raw_config.get("mcp_result_cache_max_entries", DEFAULT_MAX_ENTRIES),
+        )
+    return _result_cache
+
 
-            # Merge: LLM overrides defaults
-            config = json.loads(config)
-            merged_config = {**configs_from_file, **config}
+def _progress_reporter(ctx: Context, loop: asyncio.AbstractEventLoop):
+    """Forward progress counts from a worker thread as MCP progress notifications."""
 
-            # Convert to model
-            parsed_config = config_class(**merged_config)
+    def report(completed, total, description):
+        asyncio.run_coroutine_threadsafe(
+            ctx.report_progress(completed, total, description), loop
+        )
 
-            # 🔧 Auto-create internal dependencies
-            gh, repo = get_github_and_repo(configs_from_file)
+    return report
 
-            # Call tool with just config, and inject gh/repo internally
-            return func(gh, repo, parsed_config)
+
+@functools.lru_cache(maxsize=None)
+def load_query(query_name: str, path: str) -> Tuple[Callable, Type[BaseModel]]:
+    """The query function and its ``Config`` class, importing the module on first use."""
+    module = load_query_file(query_name, Path(path))
+    return getattr(module, query_name), getattr(module, "Config")
+
+
+def insert_default_config_from_file(query_name: str, path: str):
+    async def wrapper(config: str, ctx: Context):
+        cancel_event = threading.Event()
+        try:
+            func, config_class = load_query(query_name, path)
+            config_cache = get_config_cache()
+            configs_from_file, _ = config_cache.get()
+
+            # Merge: LLM overrides the cached, pre-validated defaults
+            parsed_config = config_cache.tool_config(
+                query_name, config_class, json.loads(config)
+            )
+
+            result_cache = get_result_cache()
+            key = cache_key(
+                query_name, configs_from_file.get("repository"), parsed_config
+            )
+            cached = result_cache.get(key)
+            if cached is not None:
+                results, metadata = cached
+                return {"results": results, "metadata": metadata}
+
+            loop = asyncio.get_running_loop()
+
+            def run():
+                # Imported here so that registering the tools does not load PyGithub
+                from repo_radar.github_client import get_github_and_repo
+
+                with reporting(_progress_reporter(ctx, loop), cancel_event), scope(
+                    query_name
+                ):
+                    # 🔧 Auto-create internal dependencies
+                    gh, repo = get_github_and_repo(configs_from_file)
+
+                    # Call tool with just config, and inject gh/repo internally
+                    with stage("evaluate"):
+                        result = func(gh, repo, parsed_config)
+                        return list(result) if inspect.isgenerator(result) else result
+
+            results = await loop.run_in_executor(
+                get_tool_executor(), contextvars.copy_context().run, run
+            )
+            result_cache.put(key, results)
+            return {"results": results, "metadata": {"cached": False}}
+        except asyncio.CancelledError:
+            # The client cancelled or disconnected: stop the worker at its next request.
+            cancel_event.set()
+            print(f"Tool {query_name} cancelled")
+            raise
         except ValidationError as ve:
             # Show Pydantic validation error nicely
             print(f"Input validation failed: {ve.json(indent=2)}")
@@ -95,24 +194,8 @@ def insert_default_config_from_file(func, config_class):
 
 
 def load_tools_for_mcp():
-
-    QUERIES_DIR = get_queries_dir()
-
-    for file in QUERIES_DIR.glob("*.py"):
-        mod_name = f"repo_radar.queries.{file.stem}"
-        spec = importlib.util.spec_from_file_location(mod_name, file)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        if hasattr(module, file.stem) and hasattr(module, "Config"):
-            func = getattr(module, file.stem)
-            doc = inspect.getdoc(func)
-
-            config_class: Type[BaseModel] = getattr(module, "Config")
-            config_doc = inspect.getdoc(config_class) or ""
-            full_description = doc or ""
-            if config_doc:
-                full_description += f"\n\nConfig Schema:\n{config_doc}"
-
-            wrapped_func = insert_default_config_from_file(func, config_class)
-            mcp.tool(name=file.stem, description=full_description)(wrapped_func)
+    # Registered from the cached manifest; query modules are imported on their first call
+    for query_name, entry in load_manifest().items():
+        if entry["tool"]:
+            wrapped_func = insert_default_config_from_file(query_name, entry["path"])
+            mcp.tool(name=query_name, description=entry["description"])(wrapped_func)
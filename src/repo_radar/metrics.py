@@ -0,0 +1,305 @@
+"""
+Request and pipeline instrumentation.
+
+Every GitHub request sent through the rate-limited adapter is recorded with
+its endpoint, latency, response size and the rate-limit units it consumed,
+under the current *scope*: the check being evaluated (``get_large_prs``...),
+or a pipeline scope such as ``dataset``. Pipeline stages (fetching closed and
+open PRs, detail prefetch, check evaluation, writing the report) are timed
+with :func:`stage`; stages nest, so a check's ``evaluate`` time includes a
+search it triggered lazily, and that search is counted under the check.
+Scopes are context variables, so they follow the work into the threads
+started by ``map_concurrently``.
+
+The CLI writes :meth:`MetricsRegistry.snapshot` as JSON next to the summary
+report; the MCP server exposes :meth:`MetricsRegistry.render_prometheus` at
+``/metrics``.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from repo_radar.utils.path_utils import resolve_path
+
+# Latency samples kept per (scope, endpoint) for percentiles; counts and sums are exact.
+MAX_LATENCY_SAMPLES = 2000
+PERCENTILES = (0.5, 0.9, 0.99)
+
+_scope: ContextVar[str] = ContextVar("repo_radar_metrics_scope", default="other")
+
+_REPO_PATH = re.compile(r"^/repos/[^/]+/[^/]+")
+_NUMBER = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_for(request) -> str:
+    """Low-cardinality endpoint name, e.g. ``rest:/repos/:repo/pulls/:n`` or ``graphql:search``."""
+    path = urlparse(request.url).path
+    if path.endswith("/graphql"):
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        if b"search(" in body:
+            return "graphql:count" if b"nodes" not in body else "graphql:search"
+        if b"pullRequest(" in body:
+            return "graphql:details"
+        return "graphql:other"
+    if path.startswith("/api/v3"):
+        path = path[len("/api/v3") :]
+    path = _REPO_PATH.sub("/repos/:repo", path)
+    return "rest:" + _NUMBER.sub("/:n", path)
+
+
+def _percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _EndpointStats:
+    __slots__ = ("count", "errors", "not_modified", "bytes", "latency_sum", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.samples: Deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests: Dict[Tuple[str, str], _EndpointStats] = defaultdict(
+                _EndpointStats
+            )
+            self._units: Dict[Tuple[str, str], int] = defaultdict(int)
+            self._stages: Dict[Tuple[str, str], float] = defaultdict(float)
+            # (token, resource) -> (remaining, reset) seen last, to derive units spent
+            self._budgets: Dict[Tuple[str, str], Tuple[int, str]] = {}
+
+    def record_request(
+        self, request, response, elapsed: float, token: str, resource: str
+    ) -> None:
+        scope = _scope.get()
+        endpoint = endpoint_for(request)
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_at = response.headers.get("X-RateLimit-Reset", "")
+        with self._lock:
+            stats = self._requests[(scope, endpoint)]
+            stats.count += 1
+            stats.errors += response.status_code >= 400
+            stats.not_modified += response.status_code == 304
+            stats.bytes += len(response.content or b"")
+            stats.latency_sum += elapsed
+            stats.samples.append(elapsed)
+
+            if remaining is not None:
+                remaining = int(remaining)
+                previous = self._budgets.get((token, resource))
+                if previous is not None and previous[1] == reset_at:
+                    self._units[(scope, resource)] += max(0, previous[0] - remaining)
+                elif previous is None and response.status_code != 304:
+                    self._units[(scope, resource)] += 1
+                self._budgets[(token, resource)] = (remaining, reset_at)
+
+    def record_stage(self, stage_name: str, seconds: float, scope: Optional[str] = None) -> None:
+        with self._lock:
+            self._stages[(scope or _scope.get(), stage_name)] += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-scope request, rate-limit and stage metrics as plain JSON data."""
+        scopes: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"requests": {}, "rate_limit_units": {}, "stages_seconds": {}}
+        )
+        with self._lock:
+            for (scope, endpoint), stats in self._requests.items():
+                samples = sorted(stats.samples)
+                scopes[scope]["requests"][endpoint] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "not_modified": stats.not_modified,
+                    "bytes": stats.bytes,
+                    "latency_ms": {
+                        "mean": round(1000 * stats.latency_sum / stats.count, 2),
+                        **{
+                            f"p{int(p * 100)}": round(1000 * _percentile(samples, p), 2)
+                            for p in PERCENTILES
+                        },
+                        "max": round(1000 * samples[-1], 2) if samples else 0.0,
+                    },
+                }
+            for (scope, resource), units in self._units.items():
+                scopes[scope]["rate_limit_units"][resource] = units
+            for (scope, stage_name), seconds in self._stages.items():
+                scopes[scope]["stages_seconds"][stage_name] = round(seconds, 4)
+
+        totals = {
+            "requests": sum(
+                r["count"] for s in scopes.values() for r in s["requests"].values()
+            ),
+            "bytes": sum(r["bytes"] for s in scopes.values() for r in s["requests"].values()),
+            "rate_limit_units": sum(
+                u for s in scopes.values() for u in s["rate_limit_units"].values()
+            ),
+        }
+        return {"scopes": dict(scopes), "totals": totals}
+
+    def export_state(self) -> Dict[str, Any]:
+        """Raw counters, for :meth:`merge_state` in another process."""
+        with self._lock:
+            return {
+                "requests": [
+                    (key, s.count, s.errors, s.not_modified, s.bytes, s.latency_sum, list(s.samples))
+                    for key, s in self._requests.items()
+                ],
+                "units": list(self._units.items()),
+                "stages": list(self._stages.items()),
+            }
+
+    def merge_state(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            for key, count, errors, not_modified, size, latency_sum, samples in state["requests"]:
+                stats = self._requests[tuple(key)]
+                stats.count += count
+                stats.errors += errors
+                stats.not_modified += not_modified
+                stats.bytes += size
+                stats.latency_sum += latency_sum
+                stats.samples.extend(samples)
+            for key, units in state["units"]:
+                self._units[tuple(key)] += units
+            for key, seconds in state["stages"]:
+                self._stages[tuple(key)] += seconds
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition of the current metrics."""
+
+        def labels(**values) -> str:
+            return ",".join(f'{k}="{v}"' for k, v in values.items())
+
+        lines = [
+            "# HELP repo_radar_requests_total GitHub API requests by scope and endpoint.",
+            "# TYPE repo_radar_requests_total counter",
+        ]
+        with self._lock:
+            requests = {key: stats for key, stats in self._requests.items()}
+            for (scope, endpoint), s in requests.items():
+                lines.append(
+                    f"repo_radar_requests_total{{{labels(scope=scope, endpoint=endpoint)}}} {s.count}"
+                )
+            lines += [
+                "# HELP repo_radar_request_errors_total GitHub API responses with status >= 400.",
+                "# TYPE repo_radar_request_errors_total counter",
+            ]
+            for (scope, endpoint), s in requests.items():
+                lines.append(
+                    f"repo_radar_request_errors_total{{{labels(scope=scope, endpoint=endpoint)}}} {s.errors}"
+                )
+            lines += [
+                "# HELP repo_radar_response_bytes_total Response body bytes received.",
+                "# TYPE repo_radar_response_bytes_total counter",
+            ]
+            for (scope, endpoint), s in requests.items():
+                lines.append(
+                    f"repo_radar_response_bytes_total{{{labels(scope=scope, endpoint=endpoint)}}} {s.bytes}"
+                )
+            lines += [
+                "# HELP repo_radar_request_latency_seconds GitHub API request latency.",
+                "# TYPE repo_radar_request_latency_seconds summary",
+            ]
+            for (scope, endpoint), s in requests.items():
+                samples = sorted(s.samples)
+                base = labels(scope=scope, endpoint=endpoint)
+                for p in PERCENTILES:
+                    lines.append(
+                        f'repo_radar_request_latency_seconds{{{base},quantile="{p}"}} '
+                        f"{_percentile(samples, p):.6f}"
+                    )
+                lines.append(f"repo_radar_request_latency_seconds_sum{{{base}}} {s.latency_sum:.6f}")
+                lines.append(f"repo_radar_request_latency_seconds_count{{{base}}} {s.count}")
+            lines += [
+                "# HELP repo_radar_rate_limit_units_total Rate-limit budget consumed.",
+                "# TYPE repo_radar_rate_limit_units_total counter",
+            ]
+            for (scope, resource), units in self._units.items():
+                lines.append(
+                    f"repo_radar_rate_limit_units_total{{{labels(scope=scope, resource=resource)}}} {units}"
+                )
+            lines += [
+                "# HELP repo_radar_stage_seconds_total Time spent per pipeline stage.",
+                "# TYPE repo_radar_stage_seconds_total counter",
+            ]
+            for (scope, stage_name), seconds in self._stages.items():
+                lines.append(
+                    f"repo_radar_stage_seconds_total{{{labels(scope=scope, stage=stage_name)}}} {seconds:.6f}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+@contextmanager
+def scope(name: str) -> Iterator[None]:
+    """Attribute the requests and stages of the enclosed work to ``name``."""
+    token = _scope.set(name)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Add the enclosed wall time to stage ``name`` of the current scope."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.record_stage(name, time.perf_counter() - started)
+
+
+def instrument(items: Iterable[Any], scope_name: str, stage_name: str = "evaluate") -> Iterator[Any]:
+    """
+    Iterate ``items`` under ``scope_name``, timing only the work of producing
+    each item as ``stage_name``; the consumer's work between items is not
+    attributed to the scope.
+    """
+    iterator = iter(items)
+    while True:
+        with scope(scope_name), stage(stage_name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def metrics_output_path(config: dict) -> str:
+    """``metrics_output_path``, else ``<summary_output_path stem>_metrics.json`` beside it."""
+    if config.get("metrics_output_path"):
+        return resolve_path(config["metrics_output_path"])
+    summary_path = config.get("summary_output_path", "summary_output.json")
+    stem, _ = os.path.splitext(summary_path)
+    return resolve_path(f"{stem}_metrics.json")
+
+
+def save_metrics(config: dict) -> None:
+    path = metrics_output_path(config)
+    with open(path, "w") as f:
+        json.dump(metrics.snapshot(), f, indent=2)
+    print(f"📈 Metrics saved to {path}")
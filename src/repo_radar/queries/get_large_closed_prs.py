@@ -0,0 +1,82 @@
+"""
+Identify closed pull requests that changed more files than a threshold.
+
+Unlike ``get_large_prs`` this covers closed PRs only, merged or not.
+"""
+
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("closed",)
+
+# "pr" and "files" are the keys the check has always reported
+LAYOUT = FindingLayout(
+    fields=(
+        "pr",
+        "files",
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "html_url",
+        "team",
+    ),
+    extra_fields=("pr", "files"),
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for large closed PRs.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date for filtering closed PRs (YYYY-MM-DD).
+    end_date : str
+        End date for filtering closed PRs (YYYY-MM-DD).
+    file_threshold : int, optional
+        A PR is large when it changed more files than this (default is 20).
+    """
+
+    start_date: str
+    end_date: str
+    file_threshold: int = 20
+
+
+def get_large_closed_prs(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Identify PRs closed within the date range that changed more than ``file_threshold`` files.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters controlling the date range and threshold. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+    """
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield the large closed PRs one at a time; see :func:`get_large_closed_prs`."""
+    for pr in dataset.closed:
+        if pr.changed_files > config.file_threshold:
+            yield Finding(
+                LAYOUT, pr, teams.team_for(pr.user), (pr.number, pr.changed_files)
+            )
@@ -1,11 +1,31 @@
 # repo_radar/queries/get_large_prs.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from github import Github, Repository
 from pydantic import BaseModel, Extra, ConfigDict
-from tqdm import tqdm
-from repo_radar.utils.team_utils import get_team_for_user
 from repo_radar.github_client import get_github_and_repo
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.github_client.search_filter import SearchFilter
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("closed", "open")
+
+LAYOUT = FindingLayout(
+    fields=(
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "merged",
+        "state",
+        "changed_files",
+        "html_url",
+        "team",
+    )
+)
 
 
 class Config(BaseModel, extra=Extra.allow):
@@ -33,8 +53,16 @@ class Config(BaseModel, extra=Extra.allow):
     include_open: bool = True
 
 
+def search_filters(config: Config) -> Dict[str, SearchFilter]:
+    """PRs this check can report, as search predicates (file counts are not searchable)."""
+    return {"closed": SearchFilter(merged=config.merged_only), "open": SearchFilter()}
+
+
 def get_large_prs(
-    gh: Github, repo: Repository.Repository, config: Config
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
 ) -> List[Dict[str, Any]]:
     """
     Identify large pull requests by file count.
@@ -47,6 +75,8 @@ def get_large_prs(
         The repository to inspect.
     config : Config
         Parameters controlling date range and thresholds. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
 
     Returns
     -------
@@ -54,64 +84,25 @@ def get_large_prs(
         List of PR metadata exceeding the file threshold.
     """
 
-    if type(config) == "dict":
-        config = Config(**config)
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
+
 
-    results = []
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield the large PRs one at a time; see :func:`get_large_prs`."""
     file_threshold = config.pr_file_threshold
 
     # Closed PRs
-    closed_query = f"repo:{repo.full_name} is:pr is:closed closed:{config.start_date}..{config.end_date}"
-    closed_issues = gh.search_issues(closed_query)
-    for issue in tqdm(
-        closed_issues, total=closed_issues.totalCount, desc="🔍 Checking closed PRs"
-    ):
-        pr = repo.get_pull(issue.number)
+    for pr in dataset.closed:
         if config.merged_only and not pr.merged:
             continue
         if pr.changed_files > file_threshold:
-            results.append(
-                {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "user": pr.user.login,
-                    "created_at": pr.created_at.isoformat(),
-                    "closed_at": pr.closed_at.isoformat() if pr.closed_at else None,
-                    "merged": pr.merged,
-                    "state": pr.state,
-                    "changed_files": pr.changed_files,
-                    "html_url": pr.html_url,
-                    "team": get_team_for_user(pr.user.login, config.get("teams", {})),
-                }
-            )
-
-    # Open PRs
+            yield Finding(LAYOUT, pr, teams.team_for(pr.user))
+
+    # Open PRs (closed_at is None and merged is False on their records)
     if config.include_open:
-        open_query = f"repo:{repo.full_name} is:pr is:open"
-        open_issues = gh.search_issues(open_query)
-        for i, issue in enumerate(
-            tqdm(open_issues, total=open_issues.totalCount, desc="📂 Checking open PRs")
-        ):
-            pr = repo.get_pull(issue.number)
+        for pr in dataset.open:
             if pr.changed_files > file_threshold:
-                results.append(
-                    {
-                        "number": pr.number,
-                        "title": pr.title,
-                        "user": pr.user.login,
-                        "created_at": pr.created_at.isoformat(),
-                        "closed_at": None,
-                        "merged": False,
-                        "state": pr.state,
-                        "changed_files": pr.changed_files,
-                        "html_url": pr.html_url,
-                        "team": get_team_for_user(
-                            pr.user.login, getattr(config, "teams", {})
-                        ),
-                    }
-                )
-            if i >= getattr(config, "max_open_prs_to_analyse", 200):
-                print(f"Too many open PRs, stopping analysis after {i+1} PRs")
-                break
-
-    return results
+                yield Finding(LAYOUT, pr, teams.team_for(pr.user))
@@ -0,0 +1,91 @@
+"""
+Identify pull requests created within a date range that target a branch other than main.
+
+PRs are selected by creation date, whatever their state, so this check reads
+the dataset's ``created`` PRs; the target branch is pushed down to the
+search as ``-base:<main_branch>``.
+"""
+
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.github_client.search_filter import SearchFilter
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("created",)
+
+# Results follow the creation window, not the closed-PR window incremental audits track
+INCREMENTAL = False
+
+# "pr" repeats the number under the key the check has always reported it as
+LAYOUT = FindingLayout(
+    fields=(
+        "pr",
+        "number",
+        "title",
+        "user",
+        "state",
+        "base_ref",
+        "created_at",
+        "closed_at",
+        "html_url",
+        "team",
+    ),
+    extra_fields=("pr",),
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for PRs targeting a non-main branch.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date for filtering PRs by creation date (YYYY-MM-DD).
+    end_date : str
+        End date for filtering PRs by creation date (YYYY-MM-DD).
+    main_branch : str, optional
+        Name of the main branch (default is "main").
+    """
+
+    start_date: str
+    end_date: str
+    main_branch: str = "main"
+
+
+def search_filters(config: Config) -> Dict[str, SearchFilter]:
+    return {"created": SearchFilter(excluded_base=config.main_branch)}
+
+
+def get_non_main_branch_prs(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Identify PRs created within the date range whose base branch is not the main branch.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters controlling the date range and main branch. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+    """
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield the non-main PRs one at a time; see :func:`get_non_main_branch_prs`."""
+    for pr in dataset.created:
+        if pr.base_ref != config.main_branch:
+            yield Finding(LAYOUT, pr, teams.team_for(pr.user), (pr.number,))
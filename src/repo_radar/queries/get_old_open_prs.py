@@ -0,0 +1,91 @@
+"""
+List the open pull requests created more than ``age_days`` ago.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.github_client.search_filter import SearchFilter, created_bound_for_age
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("open",)
+
+# "pr" repeats the number under the key the check has always reported it as
+LAYOUT = FindingLayout(
+    fields=(
+        "pr",
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "html_url",
+        "team",
+    ),
+    extra_fields=("pr",),
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for old open PRs.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date of the audit window (YYYY-MM-DD); open PRs are listed whatever their dates.
+    end_date : str
+        End date of the audit window (YYYY-MM-DD).
+    age_days : int, optional
+        A PR is old when it was opened more than this many days ago (default is 7).
+    """
+
+    start_date: str
+    end_date: str
+    age_days: int = 7
+
+
+def search_filters(config: Config) -> Dict[str, SearchFilter]:
+    """Only open PRs created at least ``age_days`` ago can match."""
+    # A day of slack, so an audit running past midnight still sees every old PR
+    latest = datetime.now(timezone.utc) + timedelta(days=1)
+    return {
+        "open": SearchFilter(
+            created_on_or_before=created_bound_for_age(latest, config.age_days)
+        )
+    }
+
+
+def get_old_open_prs(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List the open PRs created more than ``age_days`` ago.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters controlling the age threshold. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+    """
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield the old open PRs one at a time; see :func:`get_old_open_prs`."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=config.age_days)
+    for pr in dataset.open:
+        if pr.created_at < cutoff:
+            yield Finding(LAYOUT, pr, teams.team_for(pr.user), (pr.number,))
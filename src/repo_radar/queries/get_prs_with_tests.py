@@ -0,0 +1,79 @@
+"""
+Identify closed pull requests that touched test files.
+
+A file counts as a test when its path contains ``test`` (case-insensitive).
+File lists are fetched for all PRs of the window in batched GraphQL requests
+instead of one ``get_files`` call per PR.
+"""
+
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = {"files"}
+PR_BATCHES: Tuple[str, ...] = ("closed",)
+
+# "pr" repeats the number under the key the check has always reported it as
+LAYOUT = FindingLayout(
+    fields=(
+        "pr",
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "html_url",
+        "team",
+    ),
+    extra_fields=("pr",),
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for closed PRs with tests.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date for filtering closed PRs (YYYY-MM-DD).
+    end_date : str
+        End date for filtering closed PRs (YYYY-MM-DD).
+    """
+
+    start_date: str
+    end_date: str
+
+
+def get_prs_with_tests(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Identify PRs closed within the date range that added or changed test files.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters controlling the date range. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+    """
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield the PRs with tests one at a time; see :func:`get_prs_with_tests`."""
+    for pr in dataset.closed:
+        files = dataset.details(pr.number, "files")
+        if any("test" in f["filename"].lower() for f in files):
+            yield Finding(LAYOUT, pr, teams.team_for(pr.user), (pr.number,))
@@ -6,15 +6,37 @@ Finds:
 - Closed PRs that were open longer than `age_threshold_days` and closed within a date range.
 """
 
-from datetime import datetime, timezone
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 
 from github import Github, Repository
 from pydantic import BaseModel, Field, Extra
-from tqdm import tqdm
 
-from repo_radar.utils.team_utils import get_team_for_user
 from repo_radar.github_client import get_github_and_repo
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.github_client.search_filter import SearchFilter, created_bound_for_age
+from repo_radar.github_client.search_planner import day_range
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("closed", "open")
+
+# "state" comes from the record: "closed" for long-lived, "open" for stale PRs
+LAYOUT = FindingLayout(
+    fields=(
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "age_days",
+        "state",
+        "type",
+        "team",
+    ),
+    extra_fields=("age_days", "type"),
+)
 
 
 class Config(BaseModel, extra=Extra.allow):
@@ -35,10 +57,26 @@ class Config(BaseModel, extra=Extra.allow):
     age_threshold_days: int = 7
 
 
+def search_filters(config: Config) -> Dict[str, SearchFilter]:
+    """Only PRs created more than ``age_threshold_days`` before they closed (or now) can match."""
+    _, window_end = day_range(config.start_date, config.end_date)
+    # A day of slack, so an audit running past midnight still sees every stale PR
+    tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+    return {
+        "closed": SearchFilter(
+            created_on_or_before=created_bound_for_age(window_end, config.age_threshold_days)
+        ),
+        "open": SearchFilter(
+            created_on_or_before=created_bound_for_age(tomorrow, config.age_threshold_days)
+        ),
+    }
+
+
 def get_stale_or_long_lived_prs(
     gh: Github,
     repo: Repository.Repository,
     config: Config,
+    dataset: Optional[PRDataset] = None,
 ) -> List[Dict[str, Any]]:
     """
     Identify large pull requests by file count.
@@ -48,74 +86,30 @@ def get_stale_or_long_lived_prs(
     config : Config
         This is a Pydantic class type or dict with Parameters controlling date range and thresholds.
         Refer the Config class description and fill the start_date, end_date and age_threshold_days
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
     """
-    if type(config) == "dict":
-        config = Config(**config)
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
 
-    owner, repo_name = repo.full_name.split("/")
 
-    start_date = config.start_date
-    end_date = config.end_date
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield stale and long-lived PRs one at a time; see :func:`get_stale_or_long_lived_prs`."""
     age_threshold = config.age_threshold_days
 
-    results = []
-
-    query_closed = (
-        f"repo:{owner}/{repo_name} is:pr is:closed closed:{start_date}..{end_date}"
-    )
-    closed_issues = gh.search_issues(query=query_closed)
-
-    for issue in tqdm(
-        closed_issues, total=closed_issues.totalCount, desc="Checking Closed PRs"
-    ):
-        pr = repo.get_pull(issue.number)
+    for pr in dataset.closed:
         if not pr.created_at or not pr.closed_at:
             continue
 
         pr_age_days = (pr.closed_at - pr.created_at).days
         if pr_age_days > age_threshold:
-            results.append(
-                {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "user": pr.user.login,
-                    "created_at": pr.created_at.isoformat(),
-                    "closed_at": pr.closed_at.isoformat(),
-                    "age_days": pr_age_days,
-                    "state": "closed",
-                    "type": "long_lived",
-                    "team": get_team_for_user(
-                        pr.user.login, getattr(config, "teams", {})
-                    ),
-                }
+            yield Finding(
+                LAYOUT, pr, teams.team_for(pr.user), (pr_age_days, "long_lived")
             )
 
-    open_query = f"repo:{repo.full_name} is:pr is:open"
-    open_issues = gh.search_issues(open_query)
-
-    for i, pr in enumerate(
-        tqdm(open_issues, total=open_issues.totalCount, desc="Checking Open PRs")
-    ):
+    for pr in dataset.open:
         pr_age_days = (datetime.now(timezone.utc) - pr.created_at).days
         if pr_age_days > age_threshold:
-            results.append(
-                {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "user": pr.user.login,
-                    "created_at": pr.created_at.isoformat(),
-                    "closed_at": None,
-                    "age_days": pr_age_days,
-                    "state": "open",
-                    "type": "stale",
-                    "team": get_team_for_user(
-                        pr.user.login, getattr(config, "teams", {})
-                    ),
-                }
-            )
-
-        if i >= getattr(config, "max_open_prs_to_analyse", 200):
-            print(f"Too many open PRs, stopping analysis after {i+1} PRs")
-            break
-
-    return results
+            yield Finding(LAYOUT, pr, teams.team_for(pr.user), (pr_age_days, "stale"))
@@ -0,0 +1,85 @@
+"""
+Count the test files changed by the pull requests closed within a date range.
+
+A file counts as a test when its path contains ``test`` (case-insensitive).
+The query function returns the total, ``{"total_tests": n}``; in an audit,
+every closed PR that changed test files is reported with its own count so
+the totals can be grouped by team.
+"""
+
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = {"files"}
+PR_BATCHES: Tuple[str, ...] = ("closed",)
+
+LAYOUT = FindingLayout(
+    fields=(
+        "pr",
+        "test_files",
+        "number",
+        "title",
+        "user",
+        "closed_at",
+        "html_url",
+        "team",
+    ),
+    extra_fields=("pr", "test_files"),
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for counting changed test files.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date for filtering closed PRs (YYYY-MM-DD).
+    end_date : str
+        End date for filtering closed PRs (YYYY-MM-DD).
+    """
+
+    start_date: str
+    end_date: str
+
+
+def get_total_unit_tests(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> Dict[str, Any]:
+    """
+    Count the test files changed by PRs closed within the date range.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters controlling the date range. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``{"total_tests": <number of changed test files>}``.
+    """
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return {"total_tests": sum(finding.extras[1] for finding in results)}
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield every closed PR that changed test files, with its count; see :func:`get_total_unit_tests`."""
+    for pr in dataset.closed:
+        files = dataset.details(pr.number, "files")
+        count = sum(1 for f in files if "test" in f["filename"].lower())
+        if count:
+            yield Finding(LAYOUT, pr, teams.team_for(pr.user), (pr.number, count))
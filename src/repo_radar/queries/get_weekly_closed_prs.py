@@ -0,0 +1,74 @@
+"""
+List the pull requests closed within a date range (typically one week).
+"""
+
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("closed",)
+
+# "pr" repeats the number under the key the check has always reported it as
+LAYOUT = FindingLayout(
+    fields=(
+        "pr",
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "merged",
+        "html_url",
+        "team",
+    ),
+    extra_fields=("pr",),
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for closed PRs.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date for filtering closed PRs (YYYY-MM-DD).
+    end_date : str
+        End date for filtering closed PRs (YYYY-MM-DD).
+    """
+
+    start_date: str
+    end_date: str
+
+
+def get_weekly_closed_prs(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List the PRs closed within the date range.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters controlling the date range. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+    """
+    results = iter_findings(__name__, gh, repo, config, dataset)
+    return [finding.to_dict() for finding in results]
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield the closed PRs one at a time; see :func:`get_weekly_closed_prs`."""
+    for pr in dataset.closed:
+        yield Finding(LAYOUT, pr, teams.team_for(pr.user), (pr.number,))
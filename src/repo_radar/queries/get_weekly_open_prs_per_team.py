@@ -0,0 +1,87 @@
+"""
+Group the currently open pull requests by the team of their author.
+
+The query function returns ``{team: [PR numbers]}`` for every configured
+team; in an audit, every open PR is reported once per team its author
+belongs to. PRs by authors outside the configured teams are not reported.
+"""
+
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+from github import Github, Repository
+from pydantic import BaseModel, Extra
+
+from repo_radar.dataset import PRDataset, iter_findings
+from repo_radar.records import Finding, FindingLayout
+from repo_radar.utils.team_utils import TeamDirectory
+
+REQUIRED_FIELDS: Set[str] = set()
+PR_BATCHES: Tuple[str, ...] = ("open",)
+
+LAYOUT = FindingLayout(
+    fields=(
+        "number",
+        "title",
+        "user",
+        "created_at",
+        "closed_at",
+        "html_url",
+        "team",
+    )
+)
+
+
+class Config(BaseModel, extra=Extra.allow):
+    """Configuration for open PRs per team.
+
+    Parameters
+    ----------
+    start_date : str
+        Start date of the audit window (YYYY-MM-DD); all open PRs are grouped whatever their dates.
+    end_date : str
+        End date of the audit window (YYYY-MM-DD).
+    teams : Dict[str, List[str]]
+        Team name to member logins (see the ``teams`` config key).
+    """
+
+    start_date: str
+    end_date: str
+
+
+def get_weekly_open_prs_per_team(
+    gh: Github,
+    repo: Repository.Repository,
+    config: Config,
+    dataset: Optional[PRDataset] = None,
+) -> Dict[str, List[int]]:
+    """
+    Group the open PRs by team.
+
+    Parameters
+    ----------
+    config : Config
+        Parameters including the teams. Refer the Config class description.
+    dataset : PRDataset, optional
+        PR dataset shared across checks of one audit. Built on demand when omitted.
+
+    Returns
+    -------
+    Dict[str, List[int]]
+        Open PR numbers per configured team.
+    """
+    if isinstance(config, dict):
+        config = Config(**config)
+    configured_teams = getattr(config, "teams", None) or {}
+    results: Dict[str, List[int]] = {team: [] for team in configured_teams}
+    for finding in iter_findings(__name__, gh, repo, config, dataset):
+        results.setdefault(finding.team, []).append(finding.pr.number)
+    return results
+
+
+def findings(
+    dataset: PRDataset, config: Config, teams: TeamDirectory
+) -> Iterator[Finding]:
+    """Yield one finding per open PR and team of its author; see :func:`get_weekly_open_prs_per_team`."""
+    for pr in dataset.open:
+        for team in teams.teams_for(pr.user):
+            yield Finding(LAYOUT, pr, team)
@@ -0,0 +1,160 @@
+"""
+Cached manifest of the query modules.
+
+Registering the MCP tools and planning an audit only need each query's name,
+description, config JSON schema, ``REQUIRED_FIELDS`` and ``PR_BATCHES``, but
+reading them means importing the module, and with it PyGithub, the GitHub
+client and pydantic models. The manifest stores that metadata in
+``REPO_RADAR_CACHE_DIR/query_manifest.json``, keyed by a hash of each query
+file, so a query module is only imported once its file changes, or when it is
+first called.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, Optional, Set
+
+from repo_radar import __version__
+from repo_radar.utils.path_utils import get_cache_dir, get_queries_dir
+
+# Bump when the shape of a manifest entry changes.
+MANIFEST_VERSION = 2
+
+# PR batches a query module reads when it does not declare ``PR_BATCHES``
+DEFAULT_PR_BATCHES = ("closed", "open")
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def query_files(queries_dir: Optional[Path] = None) -> Dict[str, Path]:
+    """Query name -> file for every query module in ``queries_dir`` (default ``QUERIES_DIR``)."""
+    queries_dir = Path(queries_dir or get_queries_dir())
+    return {
+        file.stem: file
+        for file in sorted(queries_dir.glob("*.py"))
+        if not file.stem.startswith("_")
+    }
+
+
+def load_query_file(query_name: str, path: Path) -> ModuleType:
+    """Import the query module at ``path`` as ``repo_radar.queries.<query_name>``, once."""
+    mod_name = f"repo_radar.queries.{query_name}"
+    module = sys.modules.get(mod_name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(mod_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[mod_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[mod_name]
+        raise
+    return module
+
+
+def describe_query(query_name: str, path: Path) -> Dict[str, Any]:
+    """Manifest entry of one query module (imports it)."""
+    module = load_query_file(query_name, path)
+    func = getattr(module, query_name, None)
+    config_class = getattr(module, "Config", None)
+    if func is None or config_class is None:
+        # Helper modules without a query function are not tools
+        return {"tool": False}
+
+    description = inspect.getdoc(func) or ""
+    config_doc = inspect.getdoc(config_class) or ""
+    if config_doc:
+        description += f"\n\nConfig Schema:\n{config_doc}"
+    return {
+        "tool": True,
+        "description": description,
+        "config_schema": config_class.model_json_schema(),
+        "required_fields": sorted(getattr(module, "REQUIRED_FIELDS", ())),
+        "pr_batches": list(getattr(module, "PR_BATCHES", DEFAULT_PR_BATCHES)),
+    }
+
+
+def _read(manifest_path: Path) -> Dict[str, Any]:
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != [MANIFEST_VERSION, __version__]:
+        return {}
+    return manifest.get("queries", {})
+
+
+def _write(manifest_path: Path, entries: Dict[str, Any]) -> None:
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"version": [MANIFEST_VERSION, __version__], "queries": entries}, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        # A read-only cache only costs the imports on the next start
+        print(f"⚠️ Could not save the query manifest: {e}")
+
+
+def load_manifest(
+    queries_dir: Optional[Path] = None, manifest_path: Optional[Path] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Query name -> ``{"path", "hash", "tool", "description", "config_schema",
+    "required_fields", "pr_batches"}`` for every query file, describing (and so
+    importing) only the files that are new or changed since the manifest was
+    saved.
+    """
+    manifest_path = Path(manifest_path or get_cache_dir() / "query_manifest.json")
+    cached = _read(manifest_path)
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    changed = False
+    for query_name, path in query_files(queries_dir).items():
+        digest = file_hash(path)
+        entry = cached.get(query_name)
+        if entry is None or entry["hash"] != digest:
+            entry = {"hash": digest, **describe_query(query_name, path)}
+            changed = True
+        entries[query_name] = {**entry, "path": str(path)}
+
+    if changed or set(cached) != set(entries):
+        # Paths depend on the install location and QUERIES_DIR, so are not cached
+        _write(
+            manifest_path,
+            {
+                name: {k: v for k, v in entry.items() if k != "path"}
+                for name, entry in entries.items()
+            },
+        )
+    return entries
+
+
+def required_fields_for(
+    query_names: Iterable[str], manifest: Optional[Dict[str, Any]] = None
+) -> Dict[str, Set[str]]:
+    """
+    Batch name -> union of the ``REQUIRED_FIELDS`` of the given queries reading
+    that batch, read from the manifest.
+    """
+    manifest = manifest if manifest is not None else load_manifest()
+    fields: Dict[str, Set[str]] = {}
+    for query_name in query_names:
+        if query_name not in manifest:
+            raise ValueError(f"Unknown query '{query_name}'")
+        entry = manifest[query_name]
+        query_fields = set(entry.get("required_fields", ()))
+        if not query_fields:
+            continue
+        for name in entry.get("pr_batches", DEFAULT_PR_BATCHES):
+            fields.setdefault(name, set()).update(query_fields)
+    return fields
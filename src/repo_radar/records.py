@@ -0,0 +1,264 @@
+"""
+Compact record types shared by the fetch layer, the checks and the writers.
+
+:class:`PullRequestRecord` is an immutable, slotted PR holding only the
+fields the checks read. :class:`PullRequestBatch` stores many records column
+by column (numbers and timestamps in typed arrays), which is how the dataset
+keeps large windows in memory. :class:`Finding` is one check result: the
+record, its team and the check-specific values, with the output keys kept
+once per check in a :class:`FindingLayout` instead of once per result;
+a :class:`RenderedFinding` is one already rendered to its output dict.
+"""
+
+import math
+import sys
+from array import array
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+def parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO-8601 timestamp (e.g. "2024-01-01T10:00:00Z") as an aware datetime."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass(frozen=True, slots=True)
+class PullRequestRecord:
+    """
+    Normalized pull request record holding only the fields the audit queries use.
+
+    Records are produced either from the GitHub API or from the local PR store,
+    so query modules do not need to know where the data came from.
+    """
+
+    number: int
+    title: str
+    user: str
+    state: str
+    merged: bool
+    created_at: datetime
+    updated_at: datetime
+    closed_at: Optional[datetime]
+    changed_files: int
+    html_url: str
+    base_ref: str
+    head_sha: str
+
+    @classmethod
+    def from_pull(cls, pr: Any) -> "PullRequestRecord":
+        """Build a record from a PyGithub ``PullRequest`` object."""
+        return cls(
+            number=pr.number,
+            title=pr.title,
+            user=pr.user.login if pr.user else "ghost",
+            state=pr.state,
+            merged=bool(pr.merged),
+            created_at=pr.created_at,
+            updated_at=pr.updated_at,
+            closed_at=pr.closed_at,
+            changed_files=pr.changed_files,
+            html_url=pr.html_url,
+            base_ref=pr.base.ref,
+            head_sha=pr.head.sha,
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        """Serialize the record to a flat dict of JSON/SQLite friendly values."""
+        return {
+            "number": self.number,
+            "title": self.title,
+            "user": self.user,
+            "state": self.state,
+            "merged": int(self.merged),
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "closed_at": self.closed_at.isoformat() if self.closed_at else None,
+            "changed_files": self.changed_files,
+            "html_url": self.html_url,
+            "base_ref": self.base_ref,
+            "head_sha": self.head_sha,
+        }
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "PullRequestRecord":
+        """Inverse of :meth:`to_row`."""
+        return cls(
+            number=row["number"],
+            title=row["title"],
+            user=row["user"],
+            state=row["state"],
+            merged=bool(row["merged"]),
+            created_at=parse_github_datetime(row["created_at"]),
+            updated_at=parse_github_datetime(row["updated_at"]),
+            closed_at=parse_github_datetime(row["closed_at"]),
+            changed_files=row["changed_files"],
+            html_url=row["html_url"],
+            base_ref=row["base_ref"],
+            head_sha=row["head_sha"],
+        )
+
+
+_INT_COLUMNS = ("number", "changed_files")
+_DATETIME_COLUMNS = ("created_at", "updated_at", "closed_at")
+# Few distinct values; interned so each batch shares one string per value.
+_INTERNED_COLUMNS = ("state", "base_ref")
+
+
+def _to_timestamp(value: Optional[datetime]) -> float:
+    return value.timestamp() if value is not None else math.nan
+
+
+def _from_timestamp(value: float) -> Optional[datetime]:
+    return None if math.isnan(value) else datetime.fromtimestamp(value, timezone.utc)
+
+
+class PullRequestBatch:
+    """
+    Columnar container of :class:`PullRequestRecord` values.
+
+    Integers, flags and timestamps are stored in typed arrays and strings in
+    plain lists, so a batch costs a few machine words per PR instead of a
+    Python object per field. Iterating or indexing rebuilds records on the fly.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self):
+        self._columns: Dict[str, Any] = {}
+        for f in fields(PullRequestRecord):
+            if f.name in _INT_COLUMNS:
+                self._columns[f.name] = array("q")
+            elif f.name in _DATETIME_COLUMNS:
+                self._columns[f.name] = array("d")
+            elif f.name == "merged":
+                self._columns[f.name] = array("b")
+            else:
+                self._columns[f.name] = []
+
+    @classmethod
+    def from_records(cls, records: Iterable[PullRequestRecord]) -> "PullRequestBatch":
+        batch = cls()
+        batch.extend(records)
+        return batch
+
+    def append(self, record: PullRequestRecord) -> None:
+        for name, column in self._columns.items():
+            value = getattr(record, name)
+            if name in _DATETIME_COLUMNS:
+                value = _to_timestamp(value)
+            elif name in _INTERNED_COLUMNS and value is not None:
+                value = sys.intern(value)
+            column.append(value)
+
+    def extend(self, records: Iterable[PullRequestRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Raw column values (timestamps as POSIX seconds, ``nan`` for missing)."""
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        return len(self._columns["number"])
+
+    def __getitem__(self, index: int) -> PullRequestRecord:
+        values = {}
+        for name, column in self._columns.items():
+            value = column[index]
+            if name in _DATETIME_COLUMNS:
+                value = _from_timestamp(value)
+            elif name == "merged":
+                value = bool(value)
+            values[name] = value
+        return PullRequestRecord(**values)
+
+    def __iter__(self) -> Iterator[PullRequestRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+@dataclass(frozen=True)
+class FindingLayout:
+    """Output keys of one check's findings, shared by all of them."""
+
+    # Keys in output order; "team" is the finding's team, other keys not
+    # listed in ``extra_fields`` are read from the PR record.
+    fields: Tuple[str, ...]
+    # Keys whose values are carried in ``Finding.extras``, in that order.
+    extra_fields: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """One check result; :meth:`to_dict` renders it in the checks' output format."""
+
+    layout: FindingLayout
+    pr: PullRequestRecord
+    team: str
+    extras: Tuple[Any, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        extras = dict(zip(self.layout.extra_fields, self.extras))
+        result = {}
+        for name in self.layout.fields:
+            if name == "team":
+                value = self.team
+            elif name in extras:
+                value = extras[name]
+            else:
+                value = getattr(self.pr, name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            result[name] = value
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedFinding:
+    """
+    A finding already rendered to its output dict, still carrying its PR and team.
+
+    Incremental audits store results in this form and multi-repository audits
+    ship them between processes, so rollups keep the PR facts the output
+    layout does not include.
+    """
+
+    result: Dict[str, Any]
+    pr: PullRequestRecord
+    team: str
+    repository: Optional[str] = None
+
+    @classmethod
+    def from_finding(cls, item: Any, repository: Optional[str] = None) -> "RenderedFinding":
+        """Render a :class:`Finding` (or re-tag a rendered one), tagging it with ``repository``."""
+        result = item.to_dict()
+        if repository is not None:
+            result = {**result, "repository": repository}
+        return cls(result, item.pr, item.team, repository or getattr(item, "repository", None))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.result
+
+
+def with_repository(item: Any, repository: str) -> Any:
+    """``item`` tagged with ``"repository": repository``, rendered if it is a finding."""
+    if isinstance(item, (Finding, RenderedFinding)):
+        return RenderedFinding.from_finding(item, repository=repository)
+    return {**item, "repository": repository}
+
+
+def finding_to_dict(item: Any) -> Dict[str, Any]:
+    """``item`` as an output dict, whether it is a finding or already a dict."""
+    return item.to_dict() if isinstance(item, (Finding, RenderedFinding)) else item
+
+
+def finding_team(item: Any) -> str:
+    if isinstance(item, (Finding, RenderedFinding)):
+        return item.team
+    return item.get("team", "NA")
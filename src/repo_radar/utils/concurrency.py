@@ -0,0 +1,56 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from repo_radar.utils.progress import ProgressBar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default number of concurrent GitHub requests; override with the `max_workers` config key.
+DEFAULT_MAX_WORKERS = 4
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    desc: Optional[str] = None,
+    weight: Optional[Callable[[T], int]] = None,
+) -> List[R]:
+    """
+    Apply ``func`` to every item on a bounded thread pool.
+
+    Results are returned in the order of ``items`` regardless of completion
+    order. Progress is reported through a :class:`ProgressBar`; ``weight``
+    gives the number of progress units an item represents (e.g. the PRs in a
+    batch), default 1. With ``max_workers <= 1`` items are processed
+    sequentially. Worker threads run in a copy of the caller's context, so
+    progress reporting and cancellation carry over. The first exception
+    (including :class:`OperationCancelled`) cancels the pending items and is
+    re-raised.
+    """
+    weights = [weight(item) if weight else 1 for item in items]
+    results: List[R] = [None] * len(items)  # type: ignore[list-item]
+
+    with ProgressBar(total=sum(weights), desc=desc) as progress:
+        if max_workers <= 1 or len(items) <= 1:
+            for i, item in enumerate(items):
+                results[i] = func(item)
+                progress.update(weights[i])
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(contextvars.copy_context().run, func, item): i
+                for i, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                progress.update(weights[i])
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return results
@@ -42,3 +42,16 @@ def get_queries_dir():
 
         QUERIES_DIR = Path(spec.submodule_search_locations[0])
     return QUERIES_DIR
+
+
+def get_cache_dir() -> Path:
+    """
+    Directory for on-disk caches shared by the CLI and the MCP server.
+
+    Uses ``REPO_RADAR_CACHE_DIR`` when set, else ``~/.cache/repo_radar``.
+    """
+    load_dotenv()
+    cache_dir = os.getenv("REPO_RADAR_CACHE_DIR")
+    path = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "repo_radar"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
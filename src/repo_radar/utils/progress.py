@@ -0,0 +1,83 @@
+"""
+Progress reporting and cancellation for long-running queries.
+
+Fetch loops report progress through :class:`ProgressBar`, a ``tqdm`` bar that
+also forwards its counts to the reporter installed with :func:`reporting`
+(the MCP server sends them as progress notifications) and raises
+:class:`OperationCancelled` once the caller's cancel event is set. Both are
+carried in context variables, so they follow the work into the threads
+started by :func:`repo_radar.utils.concurrency.map_concurrently`.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from tqdm import tqdm
+
+# reporter(completed, total, description)
+ProgressReporter = Callable[[float, Optional[float], Optional[str]], None]
+
+# Minimum seconds between two reports of the same bar, besides the final one.
+REPORT_INTERVAL_SECONDS = 0.5
+
+_reporter: ContextVar[Optional[ProgressReporter]] = ContextVar(
+    "repo_radar_progress_reporter", default=None
+)
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar(
+    "repo_radar_cancel_event", default=None
+)
+
+
+class OperationCancelled(Exception):
+    """Raised inside a query when the request that started it was cancelled."""
+
+
+@contextmanager
+def reporting(
+    reporter: Optional[ProgressReporter], cancel_event: Optional[threading.Event] = None
+) -> Iterator[None]:
+    """Send progress of the enclosed work to ``reporter`` and stop it when ``cancel_event`` is set."""
+    reporter_token = _reporter.set(reporter)
+    cancel_token = _cancel_event.set(cancel_event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(cancel_token)
+        _reporter.reset(reporter_token)
+
+
+def check_cancelled() -> None:
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise OperationCancelled("Request was cancelled")
+
+
+class ProgressBar(tqdm):
+    """``tqdm`` bar that also reports to the current reporter and honours cancellation."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reporter = _reporter.get()
+        self._last_report = 0.0
+        # A disabled bar (e.g. TQDM_DISABLE) keeps neither count nor description
+        self._completed = 0
+        self._description = kwargs.get("desc")
+
+    def update(self, n=1):
+        check_cancelled()
+        displayed = super().update(n)
+        self._completed += n
+        self._report(final=self.total is not None and self._completed >= self.total)
+        return displayed
+
+    def _report(self, final: bool = False) -> None:
+        if self._reporter is None:
+            return
+        now = time.monotonic()
+        if not final and now - self._last_report < REPORT_INTERVAL_SECONDS:
+            return
+        self._last_report = now
+        self._reporter(self._completed, self.total, self._description or None)
@@ -1,13 +1,139 @@
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+import fnmatch
+import gzip
 import json, os
-from repo_radar.utils.path_utils import resolve_path
+import re
+import threading
+import time
+from urllib.parse import urlparse
+from repo_radar.aggregation import RollupColumns, audit_rollups
+from repo_radar.metrics import metrics, scope, stage
+from repo_radar.records import finding_team, finding_to_dict
+from repo_radar.utils.path_utils import get_cache_dir, resolve_path
+
+NO_TEAM = "NA"
+# How long a resolved GitHub org team membership snapshot is reused.
+DEFAULT_TEAM_SNAPSHOT_TTL_SECONDS = 24 * 60 * 60
 
 
 def get_team_for_user(username: str, teams: Dict[str, List[str]]) -> str:
     for team, members in teams.items():
         if username.lower() in [m.lower() for m in members]:
             return team
-    return "NA"
+    return NO_TEAM
+
+
+def _load_org_team_members(gh, org: str, slug: str, ttl_seconds: float) -> List[str]:
+    """Logins of GitHub team ``org/slug``, from an on-disk snapshot while it is fresh."""
+    snapshot_path = get_cache_dir() / "teams" / f"{org.lower()}__{slug.lower()}.json"
+    if snapshot_path.exists():
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        if time.time() - snapshot["fetched_at"] < ttl_seconds:
+            return snapshot["members"]
+
+    team = gh.get_organization(org).get_team_by_slug(slug)
+    members = [member.login for member in team.get_members()]
+    with open(resolve_path(str(snapshot_path)), "w") as f:
+        json.dump({"fetched_at": time.time(), "members": members}, f)
+    return members
+
+
+class TeamDirectory:
+    """
+    Case-insensitive login -> team(s) index built once per audit.
+
+    Team members in the ``teams`` config may be
+
+    - plain logins, matched case-insensitively;
+    - glob patterns such as ``"svc-*"``;
+    - regular expressions prefixed with ``re:``, e.g. ``"re:^ci-[0-9]+$"``;
+    - GitHub org teams written ``"@org/team-slug"``, resolved through ``gh``
+      and cached on disk for ``team_snapshot_ttl_seconds``.
+
+    A login may belong to several teams; :meth:`team_for` returns the first
+    one in config order, which is what the checks report.
+    """
+
+    def __init__(
+        self,
+        teams: Mapping[str, List[str]],
+        gh=None,
+        snapshot_ttl_seconds: float = DEFAULT_TEAM_SNAPSHOT_TTL_SECONDS,
+    ):
+        self.teams = dict(teams)
+        self._index: Dict[str, List[str]] = {}
+        # (matcher, team) for glob and regex members
+        self._rules: List[Tuple[Callable[[str], Any], str]] = []
+        self._gh = gh
+        self._snapshot_ttl_seconds = snapshot_ttl_seconds
+        self._memo: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+        for team, members in self.teams.items():
+            for member in members:
+                if member.startswith("@") and "/" in member:
+                    org, slug = member[1:].split("/", 1)
+                    if gh is None:
+                        print(f"⚠️ Cannot resolve GitHub team {member} without a client")
+                        continue
+                    for login in _load_org_team_members(gh, org, slug, snapshot_ttl_seconds):
+                        self._add_login(login, team)
+                elif member.startswith("re:"):
+                    self._rules.append((re.compile(member[3:], re.IGNORECASE).search, team))
+                elif any(c in member for c in "*?["):
+                    pattern = fnmatch.translate(member)
+                    self._rules.append((re.compile(pattern, re.IGNORECASE).match, team))
+                else:
+                    self._add_login(member, team)
+
+        self._order = {team: i for i, team in enumerate(self.teams)}
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], gh=None) -> "TeamDirectory":
+        return cls(
+            config.get("teams") or {},
+            gh=gh,
+            snapshot_ttl_seconds=config.get(
+                "team_snapshot_ttl_seconds", DEFAULT_TEAM_SNAPSHOT_TTL_SECONDS
+            ),
+        )
+
+    def with_teams(self, teams: Optional[Mapping[str, List[str]]]) -> "TeamDirectory":
+        """This directory when it was built from ``teams``, else a new one for them."""
+        if teams is None or dict(teams) == self.teams:
+            return self
+        return TeamDirectory(teams, self._gh, self._snapshot_ttl_seconds)
+
+    def membership(self) -> List[Tuple[str, List[str]]]:
+        """Resolved ``(login, teams)`` entries, sorted; they change with org team members."""
+        return sorted(self._index.items())
+
+    def _add_login(self, login: str, team: str) -> None:
+        teams = self._index.setdefault(login.lower(), [])
+        if team not in teams:
+            teams.append(team)
+
+    def teams_for(self, login: Optional[str]) -> Tuple[str, ...]:
+        """Every team ``login`` belongs to, in config order."""
+        if not login:
+            return ()
+        key = login.lower()
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        teams = set(self._index.get(key, ()))
+        teams.update(team for matches, team in self._rules if matches(login))
+        result = tuple(sorted(teams, key=self._order.__getitem__))
+        with self._lock:
+            self._memo[key] = result
+        return result
+
+    def team_for(self, login: Optional[str]) -> str:
+        """The first team ``login`` belongs to, or ``"NA"``."""
+        teams = self.teams_for(login)
+        return teams[0] if teams else NO_TEAM
 
 
 def group_results_by_team(
@@ -17,7 +143,7 @@ def group_results_by_team(
 
     for check_name, results in raw_results.items():
         for item in results:
-            team = item.get("team", "NA")
+            team = finding_team(item)
             if team not in summary:
                 summary[team] = {}
             if check_name not in summary[team]:
@@ -40,8 +166,38 @@ def summarize_failure_counts(
     return summary
 
 
-def generate_markdown_summary(summary: Dict[str, Dict[str, int]]) -> str:
+def _describe_rollup(stats: Dict[str, Any]) -> str:
+    parts = []
+    if stats.get("age_days_median") is not None:
+        parts.append(
+            f"age median {stats['age_days_median']}d / p90 {stats['age_days_p90']}d"
+        )
+    if stats.get("changed_files_median") is not None:
+        parts.append(
+            f"size median {stats['changed_files_median']} / p90 "
+            f"{stats['changed_files_p90']} files"
+        )
+    return f" ({', '.join(parts)})" if parts else ""
+
+
+def generate_markdown_summary(
+    summary: Dict[str, Dict[str, int]],
+    team_rollups: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    failed_checks: Optional[Dict[str, Dict[str, str]]] = None,
+) -> str:
     lines = ["# 🔍 Team-wise Audit Summary\n"]
+    team_rollups = team_rollups or {}
+
+    failures = [
+        (repository, check, error)
+        for repository, check_errors in (failed_checks or {}).items()
+        for check, error in check_errors.items()
+    ]
+    if failures:
+        lines.append("## ❌ Failed checks (not counted below)")
+        for repository, check, error in failures:
+            lines.append(f"- **{check}** on {repository}: {error}")
+        lines.append("")
 
     for team, checks in summary.items():
         lines.append(f"## 🧑‍🤝‍🧑 {team}")
@@ -50,7 +206,9 @@ def generate_markdown_summary(summary: Dict[str, Dict[str, int]]) -> str:
             continue
 
         for check, count in checks.items():
-            lines.append(f"- **{check}**: {count} failure(s)")
+            stats = team_rollups.get(team, {}).get(check)
+            details = _describe_rollup(stats) if stats else ""
+            lines.append(f"- **{check}**: {count} failure(s){details}")
 
         lines.append("")  # add a blank line between teams
 
@@ -58,12 +216,26 @@ def generate_markdown_summary(summary: Dict[str, Dict[str, int]]) -> str:
 
 
 def save_failure_counts(team_results: dict, config: dict) -> None:
+    save_summary(summarize_failure_counts(team_results), config)
+
+
+def save_summary(
+    summary: Dict[str, Dict[str, int]],
+    config: dict,
+    team_rollups: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    failed_checks: Optional[Dict[str, Dict[str, str]]] = None,
+) -> None:
+    """
+    Write the per-team failure counts; the markdown format also shows the
+    median and p90 age and size from ``team_rollups`` (the ``by_team``
+    rollups of :func:`repo_radar.aggregation.audit_rollups`) and lists the
+    ``failed_checks`` (``{repository: {check: error}}``).
+    """
     summary_format = config.get("summary_format", "json")
     summary_path = resolve_path(
         config.get("summary_output_path", "summary_output.json")
     )
 
-    summary = summarize_failure_counts(team_results)
     if summary_format == "json":
         # Save failure counts JSON
         with open(summary_path, "w") as f:
@@ -71,7 +243,7 @@ def save_failure_counts(team_results: dict, config: dict) -> None:
 
     elif summary_format == "markdown":
         with open(summary_path, "w") as f:
-            f.write(generate_markdown_summary(summary))
+            f.write(generate_markdown_summary(summary, team_rollups, failed_checks))
 
     else:
         raise ValueError("Unsupported summary_format. Use 'json' or 'markdown'.")
@@ -88,7 +260,7 @@ def save_all_results(team_results: dict, config: dict) -> None:
     if output_format == "json":
         # Save all results
         with open(output_path, "w") as f:
-            json.dump(team_results, f, indent=2)
+            json.dump(team_results, f, indent=2, default=finding_to_dict)
 
     elif output_format == "markdown":
         with open(output_path, "w") as f:
@@ -97,10 +269,119 @@ def save_all_results(team_results: dict, config: dict) -> None:
                 for check_name, results in checks.items():
                     f.write(f"## {check_name.replace('_', ' ').title()}\n")
                     f.write("```\n")
-                    f.write(json.dumps(results, indent=2))
+                    f.write(json.dumps(results, indent=2, default=finding_to_dict))
                     f.write("\n```\n\n")
 
     else:
         raise ValueError("Unsupported output_format. Use 'json' or 'markdown'.")
 
     print(f"✅ Audit report saved to {output_path}")
+
+
+class AuditResultWriter:
+    """
+    Group and count audit results as the checks produce them.
+
+    With ``output_format: "ndjson"`` every result is written as one JSON line
+    (``{"check": ..., **result}``) as soon as it arrives, gzip-compressed when
+    the output path ends in ``.gz`` or ``output_compression`` is ``"gzip"``,
+    so memory stays flat however many results an audit produces. The
+    ``json`` and ``markdown`` formats need the full team grouping and are
+    written by :func:`save_all_results` on close. Either way the facts the
+    rollups need are kept in ``columns``; :meth:`rollups` aggregates them.
+    Checks that fail are reported to :meth:`fail`.
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.output_format = config.get("output_format", "json")
+        self.columns = RollupColumns(
+            repository=urlparse(config.get("repository", "")).path.strip("/")
+        )
+        self.team_results: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._stream = None
+        # The check whose results are being added, and the row it started at
+        self._check: Optional[str] = None
+        self._check_start = 0
+        # Time spent grouping (and streaming) results, recorded once on close
+        self._add_seconds = 0.0
+
+        if self.output_format == "ndjson":
+            compress = config.get("output_compression") == "gzip"
+            default_path = "audit_output.ndjson.gz" if compress else "audit_output.ndjson"
+            self.output_path = resolve_path(config.get("output_path", default_path))
+            if compress or str(self.output_path).endswith(".gz"):
+                self._stream = gzip.open(self.output_path, "wt", encoding="utf-8")
+            else:
+                self._stream = open(self.output_path, "w", encoding="utf-8")
+        elif self.output_format not in ("json", "markdown"):
+            raise ValueError(
+                "Unsupported output_format. Use 'json', 'markdown' or 'ndjson'."
+            )
+
+    def add(self, check_name: str, item: Any) -> None:
+        """Record one result, a :class:`~repo_radar.records.Finding` or a plain dict."""
+        started = time.perf_counter()
+        if check_name != self._check:
+            self._check, self._check_start = check_name, len(self.columns)
+        team = finding_team(item)
+        self.columns.add(check_name, item)
+
+        if self._stream is not None:
+            record = {"check": check_name, **finding_to_dict(item)}
+            self._stream.write(json.dumps(record, default=str))
+            self._stream.write("\n")
+        else:
+            self.team_results.setdefault(team, {}).setdefault(check_name, []).append(item)
+        self._add_seconds += time.perf_counter() - started
+
+    def fail(self, check_name: str, error: str, repository: Optional[str] = None) -> None:
+        """
+        Mark ``check_name`` as failed, right after it raised.
+
+        Results it added so far are dropped from the rollups and the json and
+        markdown reports. The NDJSON stream has already written them, so a
+        ``{"check": ..., "failed": true, "error": ...}`` record follows them.
+        ``repository`` names the repository of a multi-repository audit,
+        whose failed checks never reach the writer.
+        """
+        if repository is None and check_name == self._check:
+            self.columns.truncate(self._check_start)
+            for team in list(self.team_results):
+                self.team_results[team].pop(check_name, None)
+                if not self.team_results[team]:
+                    del self.team_results[team]
+            self._check = None
+        if self._stream is not None:
+            record = {"check": check_name, "failed": True, "error": error}
+            if repository is not None:
+                record["repository"] = repository
+            self._stream.write(json.dumps(record))
+            self._stream.write("\n")
+
+    def rollups(self) -> Dict[str, Any]:
+        """Per-team, per-author and weekly rollups of the results added so far."""
+        with scope("output"), stage("aggregate"):
+            return audit_rollups(self.columns)
+
+    def close(self) -> None:
+        metrics.record_stage("group_results", self._add_seconds, scope="output")
+        self._add_seconds = 0.0
+        with scope("output"), stage("write_output"):
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+                print(f"✅ Audit report saved to {self.output_path}")
+            else:
+                save_all_results(self.team_results, self.config)
+
+    def __enter__(self) -> "AuditResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._stream is not None:
+            # Keep the results streamed so far
+            self._stream.close()
+            self._stream = None
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from repo_radar.aggregation import QUANTILES, RollupColumns, _grouped_quantiles, rollup
+from repo_radar.records import Finding, FindingLayout, PullRequestRecord, RenderedFinding
+
+NOW = datetime(2024, 6, 3, tzinfo=timezone.utc)
+LAYOUT = FindingLayout(fields=("number", "team"))
+
+
+def make_pr(number, user="dev", age_days=1.0, changed_files=1, closed=True, merged=True):
+    created_at = NOW - timedelta(days=10)
+    return PullRequestRecord(
+        number=number,
+        title=f"PR {number}",
+        user=user,
+        state="closed" if closed else "open",
+        merged=merged and closed,
+        created_at=created_at,
+        updated_at=created_at,
+        closed_at=created_at + timedelta(days=age_days) if closed else None,
+        changed_files=changed_files,
+        html_url=f"https://github.example/o/r/pull/{number}",
+        base_ref="main",
+        head_sha=f"{number:040x}",
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grouped_quantiles_match_numpy(seed):
+    rng = np.random.default_rng(seed)
+    n_groups = 7
+    group = rng.integers(0, n_groups, size=500)
+    values = rng.exponential(10.0, size=500)
+    values[rng.random(500) < 0.1] = np.nan
+
+    quantiles = _grouped_quantiles(group, values, n_groups)
+
+    for g in range(n_groups):
+        in_group = values[group == g]
+        in_group = in_group[~np.isnan(in_group)]
+        for name, fraction in QUANTILES.items():
+            expected = np.quantile(in_group, fraction) if len(in_group) else np.nan
+            np.testing.assert_allclose(quantiles[name][g], expected, equal_nan=True)
+
+
+def test_grouped_quantiles_of_group_without_values_is_nan():
+    group = np.array([0, 0, 1])
+    values = np.array([1.0, 3.0, np.nan])
+
+    quantiles = _grouped_quantiles(group, values, 2)
+
+    assert quantiles["median"][0] == 2.0
+    assert np.isnan(quantiles["median"][1])
+
+
+def test_rollup_counts_and_sizes_per_team_and_check():
+    columns = RollupColumns(repository="o/r")
+    columns.add("large", Finding(LAYOUT, make_pr(1, changed_files=10), "a"))
+    columns.add("large", Finding(LAYOUT, make_pr(2, changed_files=30, merged=False), "a"))
+    columns.add("large", Finding(LAYOUT, make_pr(3, closed=False), "b"))
+
+    stats = rollup(columns, ("team", "check"), now=NOW)
+
+    assert stats["a"]["large"]["prs"] == 2
+    assert stats["a"]["large"]["merged"] == 1
+    assert stats["a"]["large"]["changed_files"] == 40
+    assert stats["a"]["large"]["changed_files_median"] == 20.0
+    assert stats["b"]["large"]["open"] == 1
+    assert stats["b"]["large"]["age_days_median"] == 10.0
+
+
+def test_rendered_findings_roll_up_like_findings():
+    findings = [
+        Finding(LAYOUT, make_pr(n, user=f"dev{n % 3}", age_days=n, changed_files=n), f"t{n % 2}")
+        for n in range(1, 20)
+    ]
+    direct, rendered = RollupColumns(repository="o/r"), RollupColumns()
+    for finding in findings:
+        direct.add("check", finding)
+        rendered.add("check", RenderedFinding.from_finding(finding, repository="o/r"))
+
+    by = ("repository", "team", "author", "check")
+    assert rollup(rendered, by, now=NOW) == rollup(direct, by, now=NOW)
+
+
+def test_truncate_drops_trailing_rows():
+    columns = RollupColumns()
+    for number in range(5):
+        columns.add("check", Finding(LAYOUT, make_pr(number), "a"))
+
+    columns.truncate(2)
+
+    assert len(columns) == 2
+    assert len(columns.created_at) == len(columns.merged) == 2
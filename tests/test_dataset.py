@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from repo_radar import dataset as dataset_module
+from repo_radar.dataset import PRDataset
+from repo_radar.records import PullRequestBatch, PullRequestRecord
+
+NOW = datetime(2024, 6, 3, tzinfo=timezone.utc)
+
+
+def make_pr(number, closed=True):
+    return PullRequestRecord(
+        number=number,
+        title=f"PR {number}",
+        user="dev",
+        state="closed" if closed else "open",
+        merged=closed,
+        created_at=NOW,
+        updated_at=NOW,
+        closed_at=NOW if closed else None,
+        changed_files=1,
+        html_url=f"https://github.example/o/r/pull/{number}",
+        base_ref="main",
+        head_sha=f"{number:040x}",
+    )
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """PR numbers passed to each detail fetch."""
+    calls = []
+
+    def fake_details(repo, numbers, fields, **kwargs):
+        calls.append(sorted(numbers))
+        return {number: {field: [] for field in fields} for number in numbers}
+
+    monkeypatch.setattr(dataset_module, "get_pull_request_details", fake_details)
+    return calls
+
+
+@pytest.fixture
+def dataset():
+    repo = SimpleNamespace(full_name="o/r")
+    dataset = PRDataset(None, repo, "2024-06-01", "2024-06-03")
+    dataset._closed = PullRequestBatch.from_records([make_pr(1), make_pr(2)])
+    dataset._open = PullRequestBatch.from_records([make_pr(3, closed=False)])
+    return dataset
+
+
+def test_prefetch_covers_only_the_requested_batches(dataset, fetched):
+    dataset.prefetch({"closed": {"files"}})
+
+    assert fetched == [[1, 2]]
+    assert dataset.details(1, "files") == []
+    assert fetched == [[1, 2]]
+
+
+def test_details_fetch_the_batch_holding_the_pr(dataset, fetched):
+    dataset.details(3, "check_runs")
+    dataset.details(1, "check_runs")
+
+    assert fetched == [[3], [1, 2]]
+
+
+def test_details_of_an_unknown_pr_raise(dataset, fetched):
+    with pytest.raises(ValueError):
+        dataset.details(99, "files")
+    assert fetched == []
@@ -0,0 +1,46 @@
+from repo_radar.github_client.graphql import (
+    CHECK_RUNS_PAGE_QUERY,
+    CHECK_SUITES_PAGE_QUERY,
+    fetch_pull_request_details,
+)
+
+
+def _page(nodes, cursor=None):
+    return {"pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}, "nodes": nodes}
+
+
+def _run(name):
+    return {"name": name, "status": "COMPLETED", "conclusion": "SUCCESS"}
+
+
+class PagedClient:
+    """Serves one PR whose check suites and check runs each span two pages."""
+
+    def __init__(self):
+        self.queries = []
+
+    def execute(self, query, variables=None):
+        self.queries.append(query)
+        if query == CHECK_RUNS_PAGE_QUERY:
+            assert variables == {"id": "suite-1", "after": "runs-1"}
+            return {"node": {"checkRuns": _page([_run("lint")])}}
+        if query == CHECK_SUITES_PAGE_QUERY:
+            assert variables["oid"] == "abc" and variables["after"] == "suites-1"
+            suite = {"id": "suite-2", "checkRuns": _page([_run("deploy")])}
+            return {"repository": {"object": {"checkSuites": _page([suite])}}}
+        suite = {"id": "suite-1", "checkRuns": _page([_run("test")], "runs-1")}
+        commit = {"oid": "abc", "checkSuites": _page([suite], "suites-1")}
+        return {
+            "repository": {
+                "pr_7": {"number": 7, "commits": {"nodes": [{"commit": commit}]}}
+            }
+        }
+
+
+def test_check_runs_follow_suite_and_run_pages():
+    client = PagedClient()
+
+    details = fetch_pull_request_details(client, "acme/app", [7], ["check_runs"])
+
+    assert [run["name"] for run in details[7]["check_runs"]] == ["test", "lint", "deploy"]
+    assert len(client.queries) == 3
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from benchmarks.fake_github import start_server
+from benchmarks.run_benchmarks import benchmark_config
+from repo_radar.audit_scripts.run_config_audit import iter_audit
+from repo_radar.records import finding_to_dict
+from repo_radar.utils.path_utils import get_queries_dir
+
+SIZE = 500
+CHECKS = {
+    "enabled_checks": sorted(
+        name[:-3]
+        for name in os.listdir(get_queries_dir())
+        if name.startswith("get_")
+    )
+}
+
+
+@pytest.fixture(scope="module")
+def fake_github():
+    proc, port = start_server(SIZE)
+    yield port
+    proc.terminate()
+    proc.join()
+
+
+@pytest.fixture
+def config(fake_github, tmp_path, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKENS", "test-token")
+    monkeypatch.setenv("TQDM_DISABLE", "1")
+    monkeypatch.setenv("REPO_RADAR_CACHE_DIR", str(tmp_path))
+    return {
+        **benchmark_config(fake_github, SIZE, max_workers=2),
+        "incremental_state_path": str(tmp_path / "incremental.sqlite3"),
+    }
+
+
+def run(config, **overrides):
+    results = []
+    for check_name, item in iter_audit({**config, **overrides}, CHECKS):
+        result = finding_to_dict(item)
+        if result.get("closed_at") is None:
+            # The age of an open PR depends on when it is evaluated
+            result.pop("age_days", None)
+        results.append((check_name, result))
+    return results
+
+
+def test_first_incremental_run_matches_full_run(config):
+    window = {"start_date": "2024-01-01", "end_date": "2024-03-31"}
+    full = run(config, **window)
+
+    assert full
+    assert run(config, incremental=True, **window) == full
+
+
+def test_resumed_run_matches_full_run(config, capsys):
+    run(config, incremental=True, start_date="2024-01-01", end_date="2024-03-31")
+    capsys.readouterr()
+
+    window = {"start_date": "2024-01-15", "end_date": "2024-04-30"}
+    resumed = run(config, incremental=True, **window)
+
+    assert "Incremental audit" in capsys.readouterr().out
+    assert resumed
+    assert resumed == run(config, **window)
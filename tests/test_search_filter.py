@@ -0,0 +1,54 @@
+from datetime import date
+
+from repo_radar.github_client.search_filter import SearchFilter
+
+OLD = SearchFilter(created_on_or_before=date(2024, 1, 1))
+OLDER = SearchFilter(created_on_or_before=date(2023, 6, 1))
+MERGED = SearchFilter(merged=True)
+NOT_DEV = SearchFilter(excluded_base="dev")
+
+
+def test_default_filter_includes_everything():
+    for other in (SearchFilter(), OLD, MERGED, NOT_DEV):
+        assert SearchFilter().includes(other)
+
+
+def test_includes_narrower_filters_only():
+    assert MERGED.includes(SearchFilter(merged=True, excluded_base="dev"))
+    assert not MERGED.includes(SearchFilter())
+    assert OLD.includes(OLDER)
+    assert not OLDER.includes(OLD)
+    assert not OLD.includes(SearchFilter())
+    assert NOT_DEV.includes(SearchFilter(excluded_base="dev", merged=True))
+    assert not NOT_DEV.includes(SearchFilter(excluded_base="main"))
+
+
+def test_covering_of_nothing_matches_everything():
+    assert SearchFilter.covering([]) == SearchFilter()
+
+
+def test_covering_keeps_shared_predicates():
+    covering = SearchFilter.covering(
+        [
+            SearchFilter(merged=True, created_on_or_before=date(2024, 1, 1), excluded_base="dev"),
+            SearchFilter(merged=True, created_on_or_before=date(2023, 6, 1), excluded_base="dev"),
+        ]
+    )
+
+    assert covering == SearchFilter(
+        merged=True, created_on_or_before=date(2024, 1, 1), excluded_base="dev"
+    )
+
+
+def test_covering_drops_predicates_not_all_filters_have():
+    assert SearchFilter.covering([MERGED, OLD]) == SearchFilter()
+    assert SearchFilter.covering([NOT_DEV, SearchFilter(excluded_base="main")]) == SearchFilter()
+
+
+def test_covering_includes_every_filter():
+    filters = [MERGED, OLD, OLDER, NOT_DEV, SearchFilter(merged=True, excluded_base="dev")]
+    for i in range(len(filters)):
+        for j in range(i, len(filters)):
+            subset = filters[i : j + 1]
+            covering = SearchFilter.covering(subset)
+            assert all(covering.includes(f) for f in subset)